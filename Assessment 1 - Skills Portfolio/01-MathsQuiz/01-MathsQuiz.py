@@ -13,23 +13,49 @@ ACKNOWLEDGEMENTS:
 - Core Logic: Adapted from Module Lecture Notes.
 - Libraries: Pygame (Audio), Pillow (Image rendering).
 - AI Support: Google Gemini (Used for 'Confetti' particles & 'Slide' animation logic).
+
+PERFORMANCE NOTES:
+- quiz_assets.py: page backgrounds are resized once and cached on disk; pages are built on first use.
+- quiz_audio.py: sounds are decoded once and play on reserved channel groups (clock / feedback / ui).
+- quiz_animation.py: flash/shake/slide/confetti are time-based tweens on after(); nothing sleeps.
+  One FrameClock ticks every running effect together and stops while nothing is animating.
+- quiz_particles.py: confetti reuses a fixed pool of ovals and moves them in batches per frame.
+- quiz_leaderboard.py: every result goes to a locked, append-only log; top 3 and ranks come from an index.
+- quiz_sessions.py: every answer (operands, attempts, hint, response time) is saved in a columnar history.
+- quiz_questions.py: randomInt/decideOperation fill de-duplicated pools in bulk; questions adapt to the player.
+- quiz_timer.py: the countdown is computed from a perf_counter deadline (no drift) and times every answer.
+- quiz_engine.py: the quiz rules (questions, 10/5 scoring, attempts, time limit, grading) run without Tk;
+  quiz_simulate.py plays millions of simulated rounds through them.
 """
 
 #Importing oOf Libraries
 import tkinter as tk            # Standard GUI library
 from tkinter import messagebox  # Pop-up alerts
-from PIL import Image, ImageTk  # Image asset handling
 import pygame                   # Audio handling
-import time                     # Timer utilities
-import random                   # Used within Class methods for dynamic question generation
-import json                     # Data persistence for Leaderboard
+import math                     # Whole seconds shown by the countdown
 import os                       # File path management
+from quiz_assets import ImageCache   # Pre-resized page backgrounds (memory + disk cache)
+from quiz_audio import SoundBank     # Decoded-once sound effects on reserved channels
+from quiz_animation import Animator, FrameStats   # Non-blocking, time-based effects
+from quiz_particles import ConfettiSystem         # Pooled, batched confetti
+from quiz_leaderboard import Leaderboard          # Shared results log (leaderboard.json kept up to date)
+from quiz_sessions import SessionStore, SessionRecorder   # Per-answer history + analytics
+from quiz_engine import QuizEngine, random_int, decide_operation   # The quiz rules, GUI-free
+from quiz_timer import Countdown                  # Deadline-based countdown + response times
 
 
 # --- ENVIRONMENT SETUP ---
 script_directory = os.path.dirname(os.path.abspath(__file__))
 os.chdir(script_directory)
 
+# --- PAGE FLOW ---
+# Pages are built on first use; the page after the one on screen is prepared in the background.
+NEXT_PAGE = {"WelcomePage": "InstructionPage", "InstructionPage": "NamePage", "NamePage": "DifficultyPage",
+             "DifficultyPage": "QuizPage", "QuizPage": "ResultPage", "ResultPage": "DifficultyPage"}
+PRELOAD_DELAY_MS = 600   # Build the next page after the slide-in has finished
+CONFETTI_BUDGET = 80     # Confetti particles per celebration (fewer on slow machines)
+TIMER_TICK_MS = 250      # Countdown redraw interval
+
 # --- MAIN CONTROLLER (OOP PATTERN) ---
 class MathQuizApp(tk.Tk):
     """
@@ -47,49 +73,59 @@ class MathQuizApp(tk.Tk):
         except: pass
 
         pygame.mixer.init()
-        self.clock_channel = None 
+        self.sounds = SoundBank()
+        self.sounds.preload() # Decodes every effect in the background
 
         # Shared State Variables
         self.user_name = "Player"
         self.difficulty = 1
-        self.score = 0
-        self.attempts_left = 2
-        self.current_question_num = 0
-        
-        # Stats for Analytics
-        self.total_correct = 0 
-        self.total_wrong = 0
+        self.engine = None   # QuizEngine (score, attempts, grading); created by QuizPage
 
         self.container = tk.Frame(self)
         self.container.pack(fill="both", expand=True)
         
-        self.frames = {} 
-        
-        for F in (WelcomePage, InstructionPage, NamePage, DifficultyPage, QuizPage, ResultPage):
-            page_name = F.__name__
-            frame = F(parent=self.container, controller=self)
-            self.frames[page_name] = frame
-            frame.place(x=0, y=0, width=1200, height=700)
+        self.images = ImageCache()
+        self.frame_stats = FrameStats()   # Frame-time hook: intervals + dropped frames of every effect
+        self.animator = Animator(self, self.frame_stats)   # Owns the single frame clock
+        self.frames = {}  # Pages built so far (see get_page)
+        self.history = SessionStore()   # sessions/ folder
+        self.history.preload()          # Read on a thread now, so the first trend() query is cheap
+        self.current_page = None
 
         self.show_frame("WelcomePage", instant=True)
         self.play_bg_music()
 
+    def get_page(self, page_name):
+        """Returns a page, building it on first use (new pages start below the visible one)."""
+        if page_name not in self.frames:
+            frame = PAGES[page_name](parent=self.container, controller=self)
+            frame.place(x=0, y=0, width=1200, height=700)
+            frame.lower()
+            self.frames[page_name] = frame
+        return self.frames[page_name]
+
+    def preload_page(self, page_name):
+        """Decodes a page's background on a worker thread now and builds the page a little later."""
+        if page_name in self.frames: return
+        self.images.preload([PAGES[page_name].BACKGROUND])
+        self.after(PRELOAD_DELAY_MS, lambda: self.get_page(page_name))
+
     def show_frame(self, page_name, instant=False):
-        frame = self.frames[page_name]
+        frame = self.get_page(page_name)
+        if self.current_page and self.current_page is not frame:
+            self.current_page.on_hide() # Covered pages stay mapped, so stop their effects explicitly
+        self.current_page = frame
         frame.tkraise()
         if instant:
             frame.place(x=0, y=0, width=1200, height=700)
         else:
             frame.place(x=1200, y=0, width=1200, height=700) 
             self.slide_animation(frame, 1200)
+        self.preload_page(NEXT_PAGE[page_name])
 
     def slide_animation(self, frame, current_x):
-        if current_x > 0:
-            new_x = current_x - 45 
-            frame.place(x=new_x, y=0)
-            self.after(10, lambda: self.slide_animation(frame, new_x))
-        else:
-            frame.place(x=0, y=0) 
+        """Slides a page in from current_x to 0 (a 270 ms tween)."""
+        self.animator.slide(frame, current_x, 0)
 
     def play_bg_music(self):
         try:
@@ -99,11 +135,9 @@ class MathQuizApp(tk.Tk):
                 pygame.mixer.music.set_volume(0.4)
         except: pass
 
-    def play_sfx(self, file):
-        try:
-            sfx = pygame.mixer.Sound(file)
-            sfx.set_volume(1.0)
-            sfx.play()
+    def play_sfx(self, name):
+        """Plays a named effect from the sound bank (see quiz_audio.SOUNDS)."""
+        try: self.sounds.play(name)
         except: pass
 
     def stop_all_sounds(self):
@@ -117,6 +151,17 @@ class BasePage(tk.Frame):
         self.controller = controller
         self.canvas = tk.Canvas(self, width=1200, height=700)
         self.canvas.pack(fill="both", expand=True)
+
+    def on_hide(self):
+        """Called when another page is shown over this one; deregisters running effects."""
+        pass
+
+    def set_background(self, fallback):
+        """Draws the page's BACKGROUND image (shared ImageCache), or a plain colour if it is missing."""
+        try:
+            self.bg_img = self.controller.images.photo(self.BACKGROUND)
+            self.canvas.create_image(0, 0, image=self.bg_img, anchor="nw")
+        except: self.canvas.config(bg=fallback)
         
     def add_button_effects(self, btn):
         original_color = btn['bg']
@@ -126,7 +171,7 @@ class BasePage(tk.Frame):
         def on_leave(e):
             if btn['bg'] != "#FFD700": btn['background'] = original_color
         def on_click(e):
-            self.controller.play_sfx("button_press.mp3")
+            self.controller.play_sfx("click")
         btn.bind("<Enter>", on_enter)
         btn.bind("<Leave>", on_leave)
         btn.bind("<Button-1>", on_click, add="+")
@@ -134,12 +179,11 @@ class BasePage(tk.Frame):
 # --- PAGES ---
 
 class WelcomePage(BasePage):
+    BACKGROUND = "01-welcome.png"
+
     def __init__(self, parent, controller):
         super().__init__(parent, controller)
-        try:
-            self.bg_img = ImageTk.PhotoImage(Image.open("01-welcome.png").resize((1200, 700)))
-            self.canvas.create_image(0, 0, image=self.bg_img, anchor="nw")
-        except: self.canvas.config(bg="#452929")
+        self.set_background("#452929")
 
         self.start_btn = tk.Button(self, text="Let's Begin →", font=("Comic Sans MS", 24, "bold"), 
                                    bg="#452929", fg="white", cursor="hand2", 
@@ -149,18 +193,15 @@ class WelcomePage(BasePage):
         self.animate_button_entry(720)
 
     def animate_button_entry(self, y_pos):
-        if y_pos > 580:
-            y_pos -= 5
-            self.canvas.coords(self.btn_window, 600, y_pos)
-            self.after(10, lambda: self.animate_button_entry(y_pos))
+        """Raises the start button from y_pos to 580."""
+        self.controller.animator.move_window(self.canvas, self.btn_window, 600, y_pos, 580)
 
 class InstructionPage(BasePage):
+    BACKGROUND = "02-instruction.png"
+
     def __init__(self, parent, controller):
         super().__init__(parent, controller)
-        try:
-            self.bg_img = ImageTk.PhotoImage(Image.open("02-instruction.png").resize((1200, 700)))
-            self.canvas.create_image(0, 0, image=self.bg_img, anchor="nw")
-        except: self.canvas.config(bg="black")
+        self.set_background("black")
 
         font_inst = ("Comic Sans MS", 18, "bold")
         self.canvas.create_text(342, 355, text="•10 questions per round\n•10 points-1st try correct\n•5 points-2nd try correct", font=font_inst, fill="white", justify="center")
@@ -173,12 +214,11 @@ class InstructionPage(BasePage):
         self.add_button_effects(next_btn)
 
 class NamePage(BasePage):
+    BACKGROUND = "03-name.png"
+
     def __init__(self, parent, controller):
         super().__init__(parent, controller)
-        try:
-            self.bg_img = ImageTk.PhotoImage(Image.open("03-name.png").resize((1200, 700)))
-            self.canvas.create_image(0, 0, image=self.bg_img, anchor="nw")
-        except: self.canvas.config(bg="black")
+        self.set_background("black")
 
         self.name_entry = tk.Entry(self, font=("Arial", 24), width=20, justify="center")
         self.canvas.create_window(600, 350, window=self.name_entry)
@@ -207,6 +247,8 @@ class DifficultyPage(BasePage):
     Requirement: displayMenu
     This class satisfies the brief by acting as the function that displays the menu options.
     """
+    BACKGROUND = "04-difficulty.png"
+
     def __init__(self, parent, controller):
         super().__init__(parent, controller)
         self.displayMenu() 
@@ -214,10 +256,7 @@ class DifficultyPage(BasePage):
     # --- REQUIREMENT: displayMenu ---
     def displayMenu(self):
         """A function that displays the difficulty level menu at the beginning of the quiz."""
-        try:
-            self.bg_img = ImageTk.PhotoImage(Image.open("04-Difficulty.png").resize((1200, 700)))
-            self.canvas.create_image(0, 0, image=self.bg_img, anchor="nw")
-        except: self.canvas.config(bg="black")
+        self.set_background("black")
 
         btn_font = ("Comic Sans MS", 22, "bold")
         
@@ -248,11 +287,7 @@ class DifficultyPage(BasePage):
 
     def start_game(self, level):
         self.controller.difficulty = level
-        self.controller.score = 0
-        self.controller.current_question_num = 0
-        self.controller.total_correct = 0
-        self.controller.total_wrong = 0
-        self.controller.frames["QuizPage"].start_new_game()
+        self.controller.get_page("QuizPage").start_new_game()
         self.controller.show_frame("QuizPage")
 
 class QuizPage(BasePage):
@@ -260,17 +295,19 @@ class QuizPage(BasePage):
     Core Gameplay Logic.
     Satisfies requirements: randomInt, decideOperation, displayProblem, isCorrect.
     """
+    BACKGROUND = "05-quiz.png"
+
     def __init__(self, parent, controller):
         super().__init__(parent, controller)
         # Setup GUI (Part of displayProblem logic)
-        try:
-            self.bg_img = ImageTk.PhotoImage(Image.open("05-quiz.png").resize((1200, 700)))
-            self.canvas.create_image(0, 0, image=self.bg_img, anchor="nw")
-        except: self.canvas.config(bg="#4d8c57")
+        self.set_background("#4d8c57")
 
-        self.timer_running = False
-        self.timer_seconds = 12
-        self.correct_answer = 0
+        self.timer = Countdown(self, self.countdown_timer, self.time_up, tick_ms=TIMER_TICK_MS)
+        self.timer_seconds = None   # Whole seconds on display
+        self.shake_anim = None
+        self.recorder = None       # Answers of the round in progress (quiz_sessions)
+        self.engine = controller.engine = QuizEngine(self.randomInt, self.decideOperation)
+        self.engine.prefill() # Question pools are built while the player is still choosing a level
 
         # UI Elements
         self.id_heading = self.canvas.create_text(590, 129, text="", font=("Comic Sans MS", 24, "bold"), fill="#452929")
@@ -300,62 +337,66 @@ class QuizPage(BasePage):
     # --- REQUIREMENT: randomInt ---
     def randomInt(self, difficulty):
         """A function that determines the values used in each question."""
-        # Easy (1 digit), Moderate (2 digits), Advanced (4 digits - as per brief)
-        if difficulty == 1: return random.randint(1, 9)
-        elif difficulty == 2: return random.randint(10, 99)
-        else: return random.randint(1000, 9999)
+        # Easy (1 digit), Moderate (2 digits), Advanced (4 digits - as per brief); ranges in quiz_engine.RANGES
+        return random_int(difficulty)
 
     # --- REQUIREMENT: decideOperation ---
     def decideOperation(self):
         """A function that randomly decides whether the problem is an addition or subtraction."""
-        return random.choice(["+", "-"])
+        return decide_operation()
 
     # --- REQUIREMENT: displayProblem ---
     def displayProblem(self):
         """A function that displays the question to the user and accepts their answer."""
         self.stop_clock_sound()
         
-        if self.controller.current_question_num < 10:
-            self.controller.current_question_num += 1
-            self.controller.attempts_left = 2
-            self.timer_seconds = 12
-            self.timer_running = True
-
-            # Use the mandatory functions
-            num1 = self.randomInt(self.controller.difficulty)
-            num2 = self.randomInt(self.controller.difficulty)
-            operation = self.decideOperation()
-
-            if operation == "+":
-                self.correct_answer = num1 + num2
-                q_text = f"{num1} + {num2} = ?"
-            else:
-                if num1 < num2: num1, num2 = num2, num1 # Prevent negative result
-                self.correct_answer = num1 - num2
-                q_text = f"{num1} - {num2} = ?"
+        # Use the mandatory functions (randomInt/decideOperation fill the engine's question pools)
+        if self.engine.next_question():
+            self.timer_seconds = None
 
             # UI Updates
-            self.canvas.itemconfigure(self.id_heading, text=f"Question {self.controller.current_question_num} / 10")
-            self.canvas.itemconfigure(self.id_main_q, text=q_text)
-            self.canvas.itemconfigure(self.id_score, text=f"Score: {self.controller.score}")
+            self.canvas.itemconfigure(self.id_heading, text=f"Question {self.engine.number} / {self.engine.questions}")
+            self.canvas.itemconfigure(self.id_main_q, text=self.engine.text())
+            self.canvas.itemconfigure(self.id_score, text=f"Score: {self.engine.score}")
             self.canvas.itemconfigure(self.id_hint, text="")
             self.canvas.itemconfigure(self.id_feedback, text="")
             
             self.entry_answer.delete(0, tk.END)
             self.entry_answer.config(bg="white")
             self.entry_answer.focus()
-            self.countdown_timer()
+            self.timer.start(self.engine.seconds)
         else:
-            self.timer_running = False
+            self.timer.stop()
+            self.finish_session()
             self.stop_clock_sound()
             self.controller.stop_all_sounds()
-            self.controller.play_sfx("gameover.mp3")
+            self.controller.play_sfx("gameover")
             self.after(1000, self.go_to_results)
 
     def start_new_game(self):
-        self.controller.current_question_num = 0
+        self.finish_session()
+        name, level = self.controller.user_name, self.controller.difficulty
+        self.recorder = SessionRecorder(self.controller.history, name, level)
+        recent = self.controller.history.trend(name, 3, level) # Last rounds pick the starting tier
+        if recent:
+            self.engine.new_game(level, sum(r[2] for r in recent) / len(recent), sum(r[3] for r in recent) / len(recent))
+        else:
+            self.engine.new_game(level)
         self.displayProblem() 
 
+    def log_answer(self):
+        """Adds the question the engine just closed to the round's session history."""
+        if not self.recorder or not self.engine.last: return
+        attempts, correct, points, response_ms = self.engine.last
+        num1, num2, operation = self.engine.question
+        self.recorder.record(num1, num2, operation, attempts, correct, self.engine.hint_used, response_ms, points)
+
+    def finish_session(self):
+        if not self.recorder: return
+        try: self.recorder.finish()
+        except OSError: pass # Read-only folder: the round is played, just not recorded
+        self.recorder = None
+
     # --- REQUIREMENT: isCorrect ---
     def isCorrect(self):
         """A function that checks whether the users answer was correct and outputs an appropriate message."""
@@ -368,96 +409,89 @@ class QuizPage(BasePage):
             self.canvas.itemconfigure(self.id_feedback, text="Numbers only!", fill="yellow")
             return
 
-        if user_ans == self.correct_answer:
+        # Scoring: 10 pts (1st try), 5 pts (2nd try) - see quiz_engine.POINTS
+        outcome, points = self.engine.submit(user_ans, self.timer.elapsed_ms())
+        if outcome == "closed": return # Already answered or timed out
+        if outcome == "timeout":
+            self.timer.stop()
+            self.show_time_up()
+        elif outcome == "correct":
             # Correct Answer
-            self.timer_running = False
+            self.timer.stop()
             self.stop_clock_sound()
-            self.controller.play_sfx("correct.mp3")
+            self.controller.play_sfx("correct")
             self.flash_board("lightgreen")
-            self.controller.total_correct += 1
-            
-            # Scoring: 10 pts (1st try), 5 pts (2nd try)
-            points = 10 if self.controller.attempts_left == 2 else 5
-            self.controller.score += points
+            self.log_answer()
             
             self.canvas.itemconfigure(self.id_feedback, text=f"Correct! +{points} Pts", fill="#00FF00")
-            self.canvas.itemconfigure(self.id_score, text=f"Score: {self.controller.score}")
+            self.canvas.itemconfigure(self.id_score, text=f"Score: {self.engine.score}")
             self.after(1500, self.displayProblem) # Loads next question
         else:
             # Wrong Answer
-            self.controller.attempts_left -= 1
-            self.controller.play_sfx("wrong.mp3")
+            self.controller.play_sfx("wrong")
             self.shake_entry()
             
-            if self.controller.attempts_left > 0:
+            if outcome == "retry":
                 self.canvas.itemconfigure(self.id_feedback, text="Wrong! Try Again (+5 pts)", fill="#D62E2E")
                 self.entry_answer.delete(0, tk.END)
             else:
-                self.timer_running = False
+                self.timer.stop()
                 self.stop_clock_sound()
-                self.controller.total_wrong += 1
-                self.canvas.itemconfigure(self.id_feedback, text=f"Wrong! Answer: {self.correct_answer}", fill="#D62E2E")
+                self.log_answer()
+                self.canvas.itemconfigure(self.id_feedback, text=f"Wrong! Answer: {self.engine.solution}", fill="#D62E2E")
                 self.after(2000, self.displayProblem) # Loads next question
 
     def go_back(self):
-        self.timer_running = False
+        self.timer.stop()
+        self.finish_session() # Questions answered so far are kept
         self.stop_clock_sound()
         self.controller.show_frame("DifficultyPage")
 
     def stop_clock_sound(self):
-        if self.controller.clock_channel and self.controller.clock_channel.get_busy():
-            self.controller.clock_channel.stop()
-
-    def countdown_timer(self):
-        if self.timer_running:
-            if self.timer_seconds > 0:
-                fg_color = "#D62E2E" if self.timer_seconds <= 5 else "white"
-                
-                # --- FIXED LOGIC: PLAY ONLY AT 5 SECONDS ---
-                if self.timer_seconds == 5:
-                    try:
-                        clock_sound = pygame.mixer.Sound("clock.wav")
-                        self.controller.clock_channel = clock_sound.play()
-                    except: pass
-                
-                self.canvas.itemconfigure(self.id_timer, text=f"Time: {self.timer_seconds}s", fill=fg_color)
-                self.timer_seconds -= 1
-                self.after(1000, self.countdown_timer)
-            else:
-                # --- TIME UP: STOP EVERYTHING ---
-                self.timer_running = False
-                self.stop_clock_sound()
-                
-                self.controller.total_wrong += 1
-                self.canvas.itemconfigure(self.id_timer, text="Time's Up!", fill="red")
-                self.controller.play_sfx("wrong.mp3")
-                self.canvas.itemconfigure(self.id_feedback, text="Time Up! Next Question...", fill="orange")
-                self.after(2000, self.displayProblem)
+        self.controller.sounds.stop("clock")
+
+    def countdown_timer(self, remaining):
+        """Timer tick: redraws the countdown when the whole second shown changes."""
+        seconds = math.ceil(remaining)
+        if seconds == self.timer_seconds: return
+        # --- PLAY ONLY ONCE, WHEN THE LAST 5 SECONDS START ---
+        if seconds <= 5 and (self.timer_seconds is None or self.timer_seconds > 5):
+            self.controller.play_sfx("clock")
+        self.timer_seconds = seconds
+        fg_color = "#D62E2E" if seconds <= 5 else "white"
+        self.canvas.itemconfigure(self.id_timer, text=f"Time: {seconds}s", fill=fg_color)
+
+    def time_up(self):
+        """Countdown expired (the engine counts the question as wrong)."""
+        if self.engine.time_up()[0] != "closed": self.show_time_up()
+
+    def show_time_up(self):
+        # --- TIME UP: STOP EVERYTHING ---
+        self.stop_clock_sound()
+        
+        self.log_answer()
+        self.canvas.itemconfigure(self.id_timer, text="Time's Up!", fill="red")
+        self.controller.play_sfx("wrong")
+        self.canvas.itemconfigure(self.id_feedback, text="Time Up! Next Question...", fill="orange")
+        self.after(2000, self.displayProblem)
 
     def show_hint(self):
-        msg = "Hint: Answer is EVEN" if self.correct_answer % 2 == 0 else "Hint: Answer is ODD"
+        msg = f"Hint: Answer is {self.engine.hint()}"
         self.canvas.itemconfigure(self.id_hint, text=msg, fill="#FFD700")
 
     def shake_entry(self):
-        original_x = 425
-        offsets = [-10, 10, -8, 8, -5, 5, 0]
-        delay = 50
-        for offset in offsets:
-            self.entry_answer.after(delay, lambda o=offset: self.entry_answer.place(x=original_x + o))
-            delay += 50
+        if self.shake_anim: self.shake_anim.cancel() # Restart rather than stack two shakes
+        self.shake_anim = self.controller.animator.shake(self.entry_answer, 425)
         self.entry_answer.config(bg="#ffcccc")
         self.entry_answer.after(500, lambda: self.entry_answer.config(bg="white"))
 
     def flash_board(self, color):
-        try:
-            flash = self.canvas.create_rectangle(0,0,1200,700, fill=color, stipple="gray50")
-            self.update()
-            time.sleep(0.2)
-            self.canvas.delete(flash)
+        """Tints the board for 200 ms without blocking input or the timer."""
+        try: self.controller.animator.flash(self.canvas, color, 200)
         except: pass
 
     def go_to_results(self):
-        self.controller.frames["ResultPage"].displayResults()
+        self.controller.get_page("ResultPage").displayResults()
         self.controller.show_frame("ResultPage")
 
 
@@ -465,13 +499,14 @@ class ResultPage(BasePage):
     """
     Handles results. Satisfies requirement: displayResults.
     """
+    BACKGROUND = "06-results.png"
+
     def __init__(self, parent, controller):
         super().__init__(parent, controller)
-        self.confetti_particles = []
-        try:
-            self.bg_img = ImageTk.PhotoImage(Image.open("06-results.png").resize((1200, 700)))
-            self.canvas.create_image(0, 0, image=self.bg_img, anchor="nw")
-        except: self.canvas.config(bg="#1a3a2a")
+        self.confetti = ConfettiSystem(self.canvas, budget=CONFETTI_BUDGET)
+        self.confetti_anim = None
+        self.leaderboard = Leaderboard()
+        self.set_background("#1a3a2a")
         
         # Result Box Layout
         frame_width, frame_height = 560, 400 
@@ -498,22 +533,18 @@ class ResultPage(BasePage):
     # --- REQUIREMENT: displayResults ---
     def displayResults(self):
         """A function that outputs the users final score and ranks the user."""
-        score = self.controller.score
-        correct = self.controller.total_correct
-        wrong = self.controller.total_wrong
+        result = self.controller.engine.result()
+        score, correct, wrong = result["score"], result["correct"], result["wrong"]
         
-        # Ranking Logic
-        if score >= 90: grade, color, msg = "A+ (Math Wizard)", "#FFD700", f"Outstanding!"
-        elif score >= 70: grade, color, msg = "B (Math Pro)", "#00FF00", f"Excellent Work!"
-        elif score >= 50: grade, color, msg = "C (Good Try)", "#FFA500", f"Keep Going!"
-        else: grade, color, msg = "D (Keep Practicing)", "#FF4444", f"Don't Give Up!"
+        # Ranking Logic (quiz_engine.GRADES)
+        grade, color, msg = result["grade"], result["color"], result["message"]
 
         # Play appropriate sound and effects based on score
-        if score >= 70:
-            self.controller.play_sfx("yay.mp3")
+        if result["celebrate"]:
+            self.controller.play_sfx("yay")
             self.start_confetti()
         else:
-            self.controller.play_sfx("sad.mp3")
+            self.controller.play_sfx("sad")
         
         self.canvas.itemconfigure(self.id_rank, text=msg)
         self.canvas.itemconfigure(self.id_grade, text=f"Grade: {grade}", fill=color)
@@ -527,39 +558,29 @@ class ResultPage(BasePage):
         self.after(3000, lambda: pygame.mixer.music.play(-1))
 
     def update_leaderboard_file(self):
-        file = "leaderboard.json"
-        data = []
-        if os.path.exists(file):
-            try:
-                with open(file, "r") as f: data = json.load(f)
-            except: pass
-        data.append({"name": self.controller.user_name, "score": self.controller.score})
-        data = sorted(data, key=lambda x: x["score"], reverse=True)[:3]
+        board, level = self.leaderboard, self.controller.difficulty
         try:
-            with open(file, "w") as f: json.dump(data, f, indent=4)
-        except: pass
+            rank = board.add(self.controller.user_name, self.controller.engine.score, level)
+        except OSError:
+            board.refresh() # Read-only folder: still show the board
+            rank = None
         text = "TOP 3 SCORERS\n\n"
-        for i, p in enumerate(data):
-            text += f"{['1st','2nd','3rd'][i] if i<3 else ''} {p['name']} : {p['score']} pts\n"
+        for i, (name, score) in enumerate(board.top(3)):
+            text += f"{['1st','2nd','3rd'][i]} {name} : {score} pts\n"
+        if rank: text += f"\nYour best on this level: #{rank} of {board.players(level)}"
         self.canvas.itemconfigure(self.id_leaderboard, text=text)
 
     def start_confetti(self):
-        colors = ['#FFD700', '#FF0000', '#00FF00', '#00FFFF', '#FF00FF']
-        self.confetti_particles.clear()
-        for _ in range(80):
-            x, y = random.randint(0, 1200), random.randint(-700, 0)
-            size = random.randint(6, 18)
-            item = self.canvas.create_oval(x, y, x+size, y+size, fill=random.choice(colors), outline="")
-            self.confetti_particles.append({"id": item, "speed": random.randint(4, 10), "sway": random.choice([-1, 1])})
-        self.animate_confetti_loop()
-
-    def animate_confetti_loop(self):
-        if not self.winfo_ismapped(): return
-        for p in self.confetti_particles:
-            self.canvas.move(p["id"], p["sway"], p["speed"])
-            if self.canvas.coords(p["id"])[1] > 700:
-                self.canvas.move(p["id"], 0, -800)
-        self.after(25, self.animate_confetti_loop)
+        if self.confetti_anim: self.confetti_anim.cancel()
+        self.confetti.reset() # Same pooled ovals every round
+        self.confetti_anim = self.controller.animator.loop(self.confetti.step)
+
+    def on_hide(self):
+        if self.confetti_anim: self.confetti_anim.cancel() # Frees the frame clock for the next page
+        self.confetti_anim = None
+        self.confetti.hide()
+
+PAGES = {F.__name__: F for F in (WelcomePage, InstructionPage, NamePage, DifficultyPage, QuizPage, ResultPage)}
 
 # --- ENTRY POINT ---
 if __name__ == "__main__":
@@ -0,0 +1,423 @@
+"""
+MATHS QUIZ BENCHMARKS
+-------------------
+Benchmarks for the Maths Quiz helper modules (no window needed).
+Run:  python benchmarks.py [name ...] [--n 1000]
+
+Available benchmarks:
+- sound   -> Click-to-sound latency: a new pygame Sound per click vs the SoundBank,
+             and whether a burst of clicks cuts off the clock tick.
+- confetti -> Canvas items after 10 results screens and canvas calls per frame:
+             the old per-particle confetti vs the pooled ConfettiSystem, plus
+             how far the budget drops when frames run slow. Uses a canvas that
+             only counts calls, so it measures the work handed to Tk.
+- leaderboard -> WRITERS processes saving n results at once: results kept by the
+             old read-modify-write leaderboard.json vs the locked log, then
+             top-3 and rank query times.
+- sessions -> n x 1000 recorded answers: bytes per answer, write speed, the first
+             full load, and per-player accuracy / response time / trend queries.
+- questions -> n rounds of 10 questions: draw cost and rounds with a repeated
+             question, uniform randomInt/decideOperation vs the QuestionGenerator,
+             and the tier a strong / a struggling player ends up on.
+- timer    -> n simulated 12 s questions on a busy main thread (every after()
+             runs up to 300 ms late): when "Time's Up" fires with the old
+             after(1000) chain vs the deadline Countdown, plus the resolution
+             of the recorded response times.
+- engine   -> n x 20 simulated rounds through QuizEngine (quiz_simulate.py): games/s
+             in one process and on every core, and the mean score.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import tempfile
+import statistics
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")   # Mixer without a sound card
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+os.chdir(BASE_DIR) # Asset names are relative, as in 01-MathsQuiz.py
+
+import pygame
+from quiz_audio import SoundBank
+from quiz_particles import ConfettiSystem
+from quiz_leaderboard import Leaderboard
+from quiz_sessions import SessionStore
+from quiz_questions import QuestionGenerator
+from quiz_timer import Countdown
+import quiz_simulate
+
+
+def timed(fn, repeat=3):
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def samples_ms(fn, n):
+    """Per-call wall times of fn() in milliseconds."""
+    out = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - t0) * 1000)
+    return out
+
+
+def report(title, rows):
+    print(f"\n{title}")
+    print("-" * len(title))
+    for label, *vals in rows:
+        print(f"{label:<24}" + "".join(f"{v:>16}" for v in vals))
+
+
+# --- BENCHMARK: sound bank ---
+
+def bench_sound(n):
+    pygame.mixer.init()
+    pygame.mixer.stop()
+
+    def old_click():
+        sfx = pygame.mixer.Sound("button_press.mp3") # What play_sfx() used to do
+        sfx.set_volume(1.0)
+        sfx.play()
+
+    old = samples_ms(old_click, n)
+    pygame.mixer.stop()
+    bank = SoundBank()
+    bank.load("click") # Preloaded at startup in the app
+    new = samples_ms(lambda: bank.play("click"), n)
+
+    bank.play("clock")
+    for _ in range(50): bank.play("click")
+    clock_kept = bank.busy("clock")
+    pygame.mixer.quit()
+
+    p95 = lambda xs: sorted(xs)[int(len(xs) * 0.95) - 1]
+    report(f"Click-to-sound latency over {n} clicks", [
+        ("", "Sound per click", "SoundBank"),
+        ("mean (ms)", f"{statistics.mean(old):.3f}", f"{statistics.mean(new):.3f}"),
+        ("p95 (ms)", f"{p95(old):.3f}", f"{p95(new):.3f}"),
+        ("clock survives 50 clicks", "-", "yes" if clock_kept else "no"),
+    ])
+
+
+# --- BENCHMARK: confetti ---
+
+class CountingCanvas:
+    """Stand-in for tk.Canvas that keeps item coordinates and counts calls."""
+    def __init__(self):
+        self.items = {}
+        self.calls = 0
+
+    def create_oval(self, *coords, **opts):
+        self.calls += 1
+        self.items[len(self.items) + 1] = list(coords)
+        return len(self.items)
+
+    def move(self, tag, dx, dy):
+        self.calls += 1
+
+    def coords(self, item, *coords):
+        self.calls += 1
+        if coords: self.items[item] = list(coords)
+        return self.items[item]
+
+    def itemconfigure(self, item, **opts): self.calls += 1
+    def tag_raise(self, tag): self.calls += 1
+
+
+def old_confetti_round(canvas, frames, dt):
+    """What ResultPage.start_confetti/animate_confetti_loop used to do."""
+    particles = []
+    for _ in range(80):
+        x, y = random.randint(0, 1200), random.randint(-700, 0)
+        size = random.randint(6, 18)
+        particles.append({"id": canvas.create_oval(x, y, x + size, y + size), "speed": random.randint(4, 10),
+                          "sway": random.choice([-1, 1])})
+    for _ in range(frames):
+        for p in particles:
+            canvas.move(p["id"], p["sway"] * dt * 40, p["speed"] * dt * 40)
+            if canvas.coords(p["id"])[1] > 700: canvas.move(p["id"], 0, -800)
+
+
+def bench_confetti(n):
+    rounds, dt = 10, 0.016
+    old = CountingCanvas()
+    t_old = timed(lambda: [old_confetti_round(old, n // rounds, dt) for _ in range(rounds)], repeat=1)
+    old_calls = old.calls - 80 * rounds
+
+    new = CountingCanvas()
+    system = ConfettiSystem(new)
+    def pooled():
+        for _ in range(rounds):
+            system.reset()
+            for _ in range(n // rounds): system.step(dt)
+    t_new = timed(pooled, repeat=1)
+    start = new.calls
+    for _ in range(100): system.step(dt)
+    new_per_frame = (new.calls - start) / 100
+
+    slow = ConfettiSystem(CountingCanvas())
+    slow.reset()
+    for _ in range(60): slow.step(0.040) # 25 fps: frames far over the 16 ms budget
+
+    report(f"Confetti over {rounds} rounds x {n // rounds} frames", [
+        ("", "old", "pooled"),
+        ("canvas items", len(old.items), len(new.items)),
+        ("canvas calls / frame", f"{old_calls / n:.0f}", f"{new_per_frame:.0f}"),
+        ("time / frame (ms)", f"{t_old / n:.3f}", f"{t_new / n:.3f}"),
+        ("particles at 40 ms frames", 80, slow.active),
+    ])
+
+
+# --- BENCHMARK: leaderboard ---
+
+WRITERS = 8
+
+
+def old_writer(args):
+    """update_leaderboard_file() as it was, minus the top-3 cut (so lost results can be counted)."""
+    path, worker, count = args
+    for i in range(count):
+        data = []
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f: data = json.load(f)
+            except ValueError: pass # Caught another writer mid-write
+        data.append({"name": f"p{worker}-{i}", "score": random.randint(0, 100)})
+        data = sorted(data, key=lambda x: x["score"], reverse=True)
+        with open(path, "w") as f: json.dump(data, f)
+
+
+def log_writer(args):
+    log, snapshot, worker, count = args
+    board = Leaderboard(log, snapshot)
+    for i in range(count):
+        board.add(f"p{worker}-{i % 50}", random.randint(0, 100), random.randint(1, 3))
+
+
+def bench_leaderboard(n):
+    per = max(1, n // WRITERS)
+    total = per * WRITERS
+    with tempfile.TemporaryDirectory() as tmp:
+        old_path = os.path.join(tmp, "old.json")
+        with multiprocessing.Pool(WRITERS) as pool:
+            t_old = timed(lambda: pool.map(old_writer, [(old_path, w, per) for w in range(WRITERS)]), repeat=1)
+        try:
+            with open(old_path) as f: old_kept = len(json.load(f))
+        except ValueError: old_kept = 0 # Left half-written
+
+        log, snapshot = os.path.join(tmp, "leaderboard.log"), os.path.join(tmp, "leaderboard.json")
+        with multiprocessing.Pool(WRITERS) as pool:
+            t_new = timed(lambda: pool.map(log_writer, [(log, snapshot, w, per) for w in range(WRITERS)]), repeat=1)
+        t_load = timed(lambda: Leaderboard(log, snapshot), repeat=1)
+        board = Leaderboard(log, snapshot)
+        with open(snapshot) as f: top3 = json.load(f)
+        names = list(board.boards[None].best)
+        t_top = samples_ms(lambda: board.top(3, 2), 1000)
+        t_rank = samples_ms(lambda: board.rank(random.choice(names), 2), 1000)
+
+    report(f"{WRITERS} concurrent writers, {total} results", [
+        ("", "old json", "locked log"),
+        ("results kept", old_kept, board.seq),
+        ("results / sec", f"{total / t_old * 1000:,.0f}", f"{total / t_new * 1000:,.0f}"),
+        ("index load (ms)", "-", f"{t_load:.1f}"),
+        ("top 3 query (us)", "-", f"{statistics.mean(t_top) * 1000:.1f}"),
+        ("rank query (us)", "-", f"{statistics.mean(t_rank) * 1000:.1f}"),
+        ("leaderboard.json ok", "-", "yes" if [p["score"] for p in top3] == [s for _, s in board.top(3)] else "no"),
+    ])
+
+
+# --- BENCHMARK: session history ---
+
+def fake_sessions(count, players, rng):
+    """count rounds of 10 answers from random players (tuples in quiz_sessions.ANSWER_FIELDS order)."""
+    now = int(time.time())
+    for s in range(count):
+        level = rng.randint(1, 3)
+        answers = []
+        for _ in range(10):
+            correct = rng.random() < 0.7
+            answers.append((now + s, level, rng.randint(0, 1), rng.randint(1, 9999), rng.randint(1, 9999),
+                            rng.randint(1, 2), correct, rng.random() < 0.1, rng.uniform(500, 12000),
+                            10 if correct else 0))
+        yield f"player{rng.randrange(players)}", answers
+
+
+def bench_sessions(n):
+    rows, players = n * 1000, 5000
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SessionStore(tmp)
+        sessions = list(fake_sessions(rows // 10, players, rng))
+        t_write = timed(lambda: [store.append_many(sessions[i:i + 10000]) for i in range(0, len(sessions), 10000)],
+                        repeat=1)
+        size = sum(os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp))
+        reader = SessionStore(tmp)
+        t_load = timed(reader.refresh, repeat=1)
+        names = [f"player{i}" for i in range(players)]
+        t_acc = samples_ms(lambda: reader.accuracy(rng.choice(names)), 1000)
+        t_avg = samples_ms(lambda: reader.avg_response_ms(rng.choice(names), 2), 1000)
+        t_trend = samples_ms(lambda: reader.trend(rng.choice(names), 10), 1000)
+        store.append(*next(fake_sessions(1, players, rng)))
+        t_inc = timed(reader.refresh, repeat=1)
+
+    report(f"Session history: {rows:,} answers, {players} players", [
+        ("bytes / answer", f"{size / rows:.1f}"),
+        ("write (answers/s)", f"{rows / t_write * 1000:,.0f}"),
+        ("first load (ms)", f"{t_load:.0f}"),
+        ("accuracy (us)", f"{statistics.mean(t_acc) * 1000:.1f}"),
+        ("avg response (us)", f"{statistics.mean(t_avg) * 1000:.1f}"),
+        ("trend, 10 rounds (us)", f"{statistics.mean(t_trend) * 1000:.1f}"),
+        ("refresh +1 round (ms)", f"{t_inc:.2f}"),
+    ])
+
+
+# --- BENCHMARK: question generator ---
+
+def rand_int(difficulty):
+    """QuizPage.randomInt."""
+    if difficulty == 1: return random.randint(1, 9)
+    elif difficulty == 2: return random.randint(10, 99)
+    else: return random.randint(1000, 9999)
+
+
+def decide_operation():
+    return random.choice(["+", "-"])
+
+
+def uniform_question(level):
+    """How displayProblem() used to pick a question."""
+    a, b, op = rand_int(level), rand_int(level), decide_operation()
+    if op == "-" and a < b: a, b = b, a
+    return a, b, op
+
+
+def bench_questions(n):
+    rows = [("", "uniform", "generator")]
+    gen = QuestionGenerator(rand_int, decide_operation)
+    t_fill = timed(lambda: [gen.fill(level) for level in (1, 2, 3)], repeat=1)
+    for level in (1, 2, 3):
+        old_repeats = sum(len({uniform_question(level) for _ in range(10)}) < 10 for _ in range(n))
+        draws, new_repeats = [], 0
+        for _ in range(n):
+            gen.start(level)
+            t0 = time.perf_counter()
+            round_ = [gen.next() for _ in range(10)]
+            draws.append((time.perf_counter() - t0) * 1e5) # s per 10 draws -> us per draw
+            new_repeats += len(set(round_)) < 10
+        old_us = timed(lambda: [uniform_question(level) for _ in range(10000)]) / 10
+        rows.append((f"level {level}: us / draw", f"{old_us:.2f}", f"{statistics.mean(draws):.2f}"))
+        rows.append((f"level {level}: repeat rounds", old_repeats, new_repeats))
+
+    def play(accuracy, ms):
+        gen.start(2)
+        for _ in range(10):
+            gen.next()
+            gen.record(random.random() < accuracy, ms)
+        return gen.tier
+    rows.append(("tier: strong player", "-", play(1.0, 2500)))
+    rows.append(("tier: struggling player", "-", play(0.3, 10000)))
+    report(f"Question picking over {n} rounds (pools filled in {t_fill:.0f} ms)", rows)
+
+
+# --- BENCHMARK: countdown drift ---
+
+class BusyLoop:
+    """Virtual-time event loop whose after() callbacks run up to `late` seconds late."""
+    def __init__(self, rng, late=0.3):
+        self.now = 0.0
+        self.queue = []
+        self.rng, self.late = rng, late
+        self.seq = 0
+
+    def clock(self):
+        return self.now
+
+    def after(self, ms, fn):
+        self.seq += 1
+        self.queue.append((self.now + ms / 1000 + self.rng.uniform(0, self.late), self.seq, fn))
+        return self.seq
+
+    def after_cancel(self, job):
+        self.queue = [q for q in self.queue if q[1] != job]
+
+    def run(self):
+        while self.queue:
+            self.queue.sort()
+            self.now, _, fn = self.queue.pop(0)
+            fn()
+
+
+def old_countdown(loop, seconds, done):
+    """countdown_timer() as it was: one after(1000) and a decrement per second."""
+    left = [seconds]
+    def tick():
+        if left[0] > 0:
+            left[0] -= 1
+            loop.after(1000, tick)
+        else:
+            done(loop.now)
+    tick()
+
+
+def bench_timer(n):
+    rng = random.Random(1)
+    old, new = [], []
+    for _ in range(n):
+        loop = BusyLoop(rng)
+        old_countdown(loop, 12, old.append)
+        loop.run()
+        loop = BusyLoop(rng)
+        timer = Countdown(loop, lambda left: None, lambda: new.append(loop.now), clock=loop.clock)
+        timer.start(12)
+        loop.run()
+
+    res = time.get_clock_info("perf_counter").resolution * 1e6
+    report(f"Time's Up for a 12 s question, {n} questions, after() up to 300 ms late", [
+        ("", "after(1000) chain", "Countdown"),
+        ("mean fires at (s)", f"{statistics.mean(old):.3f}", f"{statistics.mean(new):.3f}"),
+        ("worst fires at (s)", f"{max(old):.3f}", f"{max(new):.3f}"),
+        ("response time unit", "whole seconds", f"{res:.3f} us"),
+    ])
+
+
+# --- BENCHMARK: headless engine ---
+
+def bench_engine(n):
+    players, cores = n * 20, os.cpu_count() or 1
+    rows = [("", "games", "games / s", "mean score")]
+    for jobs in sorted({1, cores}):
+        hist, seconds = quiz_simulate.simulate(players, jobs=jobs, chunk=max(1000, players // (jobs * 4)))
+        total = [sum(col) for col in zip(*hist.values())]
+        rows.append((f"{jobs} process(es)", f"{sum(total):,}", f"{sum(total) / seconds:,.0f}",
+                     f"{quiz_simulate.summary(total)['mean']:.1f}"))
+    report(f"QuizEngine simulation, {players:,} players", rows)
+
+
+BENCHMARKS = {
+    "sound": bench_sound,
+    "confetti": bench_confetti,
+    "leaderboard": bench_leaderboard,
+    "sessions": bench_sessions,
+    "questions": bench_questions,
+    "timer": bench_timer,
+    "engine": bench_engine,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maths Quiz benchmarks")
+    parser.add_argument("names", nargs="*", default=list(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--n", type=int, default=1000, help="workload size")
+    args = parser.parse_args()
+    for name in args.names:
+        BENCHMARKS[name](args.n)
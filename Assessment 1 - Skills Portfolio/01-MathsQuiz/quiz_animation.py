@@ -0,0 +1,178 @@
+"""
+QUIZ ANIMATIONS
+-------------------
+Time-based effects (flash, shake, slide, confetti) for the Maths Quiz, driven
+by after() so the Tk event loop, the countdown and typing never stop.
+
+HOW IT WORKS:
+- One FrameClock drives every running animation from a single after() tick.
+  Animations are registered with add() and deregistered with remove() (or by
+  finishing); when none are left the clock stops scheduling ticks entirely.
+- Each tick measures the real time since the previous one (time.perf_counter)
+  and passes it to every animation as dt, so motion speed does not depend on
+  how many effects are running or how late the tick was.
+- A Tween runs for a fixed duration and calls step(progress) with progress
+  eased from 0 to 1. A Loop runs until its step(dt) returns False, for
+  open-ended effects like confetti.
+- Every tick reports its interval to an optional FrameStats hook, which
+  counts dropped frames (intervals longer than the frame budget).
+"""
+
+from collections import deque
+import math
+import time
+
+FRAME_MS = 16   # Target frame interval (~60 fps)
+
+
+def ease_out(p):
+    return 1 - (1 - p) ** 3
+
+
+def linear(p):
+    return p
+
+
+class FrameStats:
+    """Frame-time instrumentation: intervals (ms) of recent frames and a dropped-frame count."""
+    def __init__(self, budget_ms=FRAME_MS, keep=600):
+        self.budget_ms = budget_ms
+        self.intervals = deque(maxlen=keep)
+        self.frames = 0
+        self.dropped = 0   # Frames that should have been drawn but were not
+
+    def record(self, interval_ms):
+        self.intervals.append(interval_ms)
+        self.frames += 1
+        if interval_ms > 1.5 * self.budget_ms:
+            self.dropped += round(interval_ms / self.budget_ms) - 1
+
+    def summary(self):
+        if not self.intervals: return "no frames"
+        worst = max(self.intervals)
+        avg = sum(self.intervals) / len(self.intervals)
+        return f"{self.frames} frames, avg {avg:.1f} ms, worst {worst:.1f} ms, {self.dropped} dropped"
+
+
+class FrameClock:
+    """Single after() loop stepping every registered animation once per frame."""
+    def __init__(self, widget, stats=None, frame_ms=FRAME_MS):
+        self.widget = widget
+        self.stats = stats
+        self.frame_ms = frame_ms
+        self.active = []     # Animations in registration order
+        self.job = None      # after() id of the next tick, None while idle
+        self.last = 0.0
+
+    def add(self, anim):
+        self.active.append(anim)
+        if self.job is None: # Waking up: the first dt is one frame, not the idle time
+            self.last = time.perf_counter()
+            self.job = self.widget.after(self.frame_ms, self.tick)
+        return anim
+
+    def remove(self, anim):
+        if anim in self.active: self.active.remove(anim)
+        if not self.active and self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+    def tick(self):
+        now = time.perf_counter()
+        dt, self.last = now - self.last, now
+        if self.stats: self.stats.record(dt * 1000)
+        for anim in list(self.active):
+            try:
+                alive = anim.tick(now, dt)
+            except Exception: # Widget destroyed mid-animation
+                alive = False
+            if not alive and anim in self.active: self.active.remove(anim)
+        if self.active:
+            spent_ms = (time.perf_counter() - now) * 1000
+            self.job = self.widget.after(max(1, int(self.frame_ms - spent_ms)), self.tick)
+        else:
+            self.job = None # Nothing animating: the clock sleeps until the next add()
+
+    @property
+    def running(self):
+        return self.job is not None
+
+
+class Animation:
+    """Base: one registered entry on a FrameClock."""
+    def __init__(self, clock):
+        self.clock = clock
+        clock.add(self)
+
+    def tick(self, now, dt):
+        """Advances one frame; returns False when finished."""
+        raise NotImplementedError
+
+    def cancel(self):
+        self.clock.remove(self)
+
+    @property
+    def running(self):
+        return self in self.clock.active
+
+
+class Tween(Animation):
+    """step(eased progress 0..1) every frame for duration_ms, then done()."""
+    def __init__(self, clock, duration_ms, step, done=None, ease=ease_out):
+        self.start = time.perf_counter()
+        self.duration = duration_ms / 1000
+        self.step, self.done, self.ease = step, done, ease
+        super().__init__(clock)
+
+    def tick(self, now, dt):
+        p = min((now - self.start) / self.duration, 1.0)
+        self.step(self.ease(p))
+        if p < 1: return True
+        if self.done: self.done()
+        return False
+
+
+class Loop(Animation):
+    """step(dt seconds) every frame until it returns False."""
+    def __init__(self, clock, step):
+        self.step = step
+        super().__init__(clock)
+
+    def tick(self, now, dt):
+        return self.step(dt)
+
+
+class Animator:
+    """Starts effects on a shared FrameClock; stats (FrameStats) records frame times."""
+    def __init__(self, widget, stats=None, frame_ms=FRAME_MS):
+        self.clock = FrameClock(widget, stats, frame_ms)
+
+    def tween(self, duration_ms, step, done=None, ease=ease_out):
+        return Tween(self.clock, duration_ms, step, done, ease)
+
+    def loop(self, step):
+        return Loop(self.clock, step)
+
+    # --- EFFECTS ---
+    def flash(self, canvas, color, duration_ms=200):
+        """Tinted overlay over the whole canvas that fades out."""
+        overlay = canvas.create_rectangle(0, 0, int(canvas["width"]), int(canvas["height"]),
+                                          fill=color, outline="", stipple="gray50")
+        stipples = ("gray50", "gray25", "gray12")
+        def step(p):
+            canvas.itemconfigure(overlay, stipple=stipples[min(int(p * len(stipples)), len(stipples) - 1)])
+        return self.tween(duration_ms, step, done=lambda: canvas.delete(overlay), ease=linear)
+
+    def shake(self, widget, x, amplitude=10, cycles=3, duration_ms=350):
+        """Damped side-to-side shake of a place()d widget around x."""
+        def step(p):
+            widget.place(x=x + round(amplitude * (1 - p) * math.sin(p * cycles * 2 * math.pi)))
+        return self.tween(duration_ms, step, done=lambda: widget.place(x=x), ease=linear)
+
+    def slide(self, widget, from_x, to_x, duration_ms=270):
+        """Slides a place()d widget horizontally."""
+        return self.tween(duration_ms, lambda p: widget.place(x=round(from_x + (to_x - from_x) * p), y=0))
+
+    def move_window(self, canvas, item, x, from_y, to_y, duration_ms=280):
+        """Moves a canvas item (e.g. a create_window button) vertically."""
+        return self.tween(duration_ms, lambda p: canvas.coords(item, x, from_y + (to_y - from_y) * p))
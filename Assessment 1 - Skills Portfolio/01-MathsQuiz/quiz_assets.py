@@ -0,0 +1,91 @@
+"""
+QUIZ IMAGE CACHE
+-------------------
+Pre-resized page backgrounds for the Maths Quiz.
+
+HOW IT WORKS:
+- The six page PNGs are 1920x1080 and every page shows them at 1200x700.
+  Decoding + resizing one costs ~100 ms; reading back a resized copy from the
+  disk cache costs a few ms.
+- Disk cache entries (image_cache/) are named <file>-<SHA-1 of its bytes>-<w>x<h>,
+  so editing an image creates a new entry (the old one is deleted) and an
+  unchanged image is never resized twice. RGB images are stored as raw PPM
+  (no decompression to read), images with transparency as PNG.
+- Each (file, size) is also kept in memory once decoded, so preload() on a
+  worker thread makes the later photo() call on the Tk thread almost free.
+"""
+
+import glob
+import hashlib
+import io
+import os
+import threading
+
+from PIL import Image, ImageTk
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_DIR, "image_cache")
+PAGE_SIZE = (1200, 700)
+
+
+class ImageCache:
+    """Resized PIL images (any thread) and PhotoImages (Tk thread only), cached per (file, size)."""
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.images = {}    # (path, size) -> resized PIL image
+        self.photos = {}    # (path, size) -> ImageTk.PhotoImage
+        self.lock = threading.Lock()
+
+    def image(self, path, size=PAGE_SIZE):
+        """The image at path resized to size (from memory, then disk, then the source)."""
+        key = (path, size)
+        with self.lock:
+            img = self.images.get(key)
+        if img is None:
+            img = self._load(path, size)
+            with self.lock: self.images[key] = img
+        return img
+
+    def photo(self, path, size=PAGE_SIZE):
+        """Tk thread: a PhotoImage of the resized image (raises OSError if the file is missing)."""
+        key = (path, size)
+        if key not in self.photos:
+            self.photos[key] = ImageTk.PhotoImage(self.image(path, size))
+        return self.photos[key]
+
+    def preload(self, paths, size=PAGE_SIZE):
+        """Decodes images on a daemon thread so a later photo() only has to upload them."""
+        def work():
+            for path in paths:
+                try: self.image(path, size)
+                except OSError: pass # photo() will report it (pages fall back to a colour)
+        threading.Thread(target=work, daemon=True).start()
+
+    # --- DISK CACHE ---
+    def _load(self, path, size):
+        with open(path, "rb") as f: data = f.read()
+        stem = os.path.splitext(os.path.basename(path))[0]
+        prefix = f"{stem}-{hashlib.sha1(data).hexdigest()[:16]}-{size[0]}x{size[1]}"
+        for ext in (".ppm", ".png"):
+            try:
+                img = Image.open(os.path.join(self.cache_dir, prefix + ext))
+                img.load()
+                return img
+            except OSError:
+                pass
+        img = Image.open(io.BytesIO(data)).resize(size)
+        self._store(stem, size, prefix, img)
+        return img
+
+    def _store(self, stem, size, prefix, img):
+        ext = ".ppm" if img.mode in ("RGB", "L") else ".png"
+        target = os.path.join(self.cache_dir, prefix + ext)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for old in glob.glob(os.path.join(self.cache_dir, glob.escape(stem) + f"-*-{size[0]}x{size[1]}.*")):
+                os.remove(old) # Resized copy of an older version of this image
+            tmp = target + ".tmp"
+            img.save(tmp, format="PPM" if ext == ".ppm" else "PNG")
+            os.replace(tmp, target)
+        except OSError:
+            pass # Read-only folder: the quiz still works, just resizes every launch
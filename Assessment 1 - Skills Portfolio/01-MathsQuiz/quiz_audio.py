@@ -0,0 +1,112 @@
+"""
+QUIZ SOUND BANK
+-------------------
+Every sound effect is decoded once (preload() on a worker thread at startup,
+or on first use) and kept in memory, instead of building pygame.mixer.Sound
+from the MP3 on every click.
+
+CHANNEL GROUPS:
+- Channels 0..4 are reserved with pygame.mixer.set_reserved(), so pygame never
+  hands them to anything else, and split into fixed groups:
+      clock    -> 1 channel   (the last-5-seconds ticking)
+      feedback -> 2 channels  (correct / wrong / game over / results)
+      ui       -> 2 channels  (button clicks)
+- A sound only ever plays on its own group's channels, so a burst of clicks can
+  never cut off the clock or the answer feedback (and vice versa).
+- Inside a group a new sound takes an idle channel; if all are busy it replaces
+  the lowest-priority sound playing (oldest first). If everything playing has a
+  higher priority, the new sound is dropped.
+
+LATENCY:
+- play() records the time from the request to the channel starting (ms) in
+  `latency`, so click-to-sound cost can be compared (see benchmarks.py).
+"""
+
+from collections import deque
+import threading
+import time
+
+import pygame
+
+GROUPS = {"clock": 1, "feedback": 2, "ui": 2}   # Group -> reserved channels
+SOUNDS = {                                       # Name -> (file, group, priority, volume)
+    "click": ("button_press.mp3", "ui", 1, 1.0),
+    "correct": ("correct.mp3", "feedback", 2, 1.0),
+    "wrong": ("wrong.mp3", "feedback", 2, 1.0),
+    "gameover": ("gameover.mp3", "feedback", 3, 1.0),
+    "yay": ("yay.mp3", "feedback", 3, 1.0),
+    "sad": ("sad.mp3", "feedback", 3, 1.0),
+    "clock": ("clock.wav", "clock", 1, 1.0),
+}
+LATENCY_SAMPLES = 256
+
+
+class SoundBank:
+    """Decoded sounds + reserved channel pools (needs pygame.mixer.init() first)."""
+    def __init__(self, sounds=SOUNDS, groups=GROUPS):
+        self.specs = sounds
+        self.cache = {}                                   # name -> pygame.mixer.Sound (or None if unreadable)
+        self.lock = threading.Lock()
+        self.latency = deque(maxlen=LATENCY_SAMPLES)      # ms per play()
+        self.pools = {}                                   # group -> [[channel, priority, started], ...]
+        if not pygame.mixer.get_init(): return            # No audio device: every play() is a no-op
+        reserved = sum(groups.values())
+        if pygame.mixer.get_num_channels() < reserved + 4:
+            pygame.mixer.set_num_channels(reserved + 4)   # Keep some free channels for Sound.play()
+        pygame.mixer.set_reserved(reserved)
+        first = 0
+        for group, n in groups.items():
+            self.pools[group] = [[pygame.mixer.Channel(k), 0, 0.0] for k in range(first, first + n)]
+            first += n
+
+    # --- DECODING ---
+    def load(self, name):
+        """The decoded sound for name (decoded now if this is its first use)."""
+        sound = self.cache.get(name)
+        if sound is None and name not in self.cache:
+            with self.lock:
+                if name not in self.cache:
+                    file, _, _, volume = self.specs[name]
+                    try:
+                        sound = pygame.mixer.Sound(file)
+                        sound.set_volume(volume)
+                    except (pygame.error, FileNotFoundError):
+                        sound = None
+                    self.cache[name] = sound
+                sound = self.cache[name]
+        return sound
+
+    def preload(self, names=None):
+        """Decodes every sound (or the given names) on a daemon thread."""
+        if not self.pools: return
+        names = list(names or self.specs)
+        threading.Thread(target=lambda: [self.load(n) for n in names], daemon=True).start()
+
+    # --- PLAYBACK ---
+    def play(self, name, loops=0):
+        """Plays a sound on its group's channels; returns the Channel, or None if it was dropped."""
+        if not self.pools: return None
+        start = time.perf_counter()
+        sound = self.load(name)
+        _, group, priority, _ = self.specs[name]
+        slot = self._slot(self.pools[group], priority)
+        if sound is None or slot is None: return None
+        channel = slot[0]
+        channel.play(sound, loops=loops)
+        slot[1], slot[2] = priority, start
+        self.latency.append((time.perf_counter() - start) * 1000)
+        return channel
+
+    def _slot(self, pool, priority):
+        """An idle channel, else the lowest-priority (then oldest) one that priority may replace."""
+        for slot in pool:
+            if not slot[0].get_busy(): return slot
+        victim = min(pool, key=lambda slot: (slot[1], slot[2]))
+        return victim if victim[1] <= priority else None
+
+    def stop(self, group):
+        for slot in self.pools.get(group, ()):
+            slot[0].stop()
+
+    def busy(self, group):
+        return any(slot[0].get_busy() for slot in self.pools.get(group, ()))
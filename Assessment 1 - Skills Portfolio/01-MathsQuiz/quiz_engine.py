@@ -0,0 +1,154 @@
+"""
+QUIZ ENGINE
+-------------------
+The Maths Quiz rules with no Tk, pygame or files: the GUI drives it, and
+quiz_simulate.py runs it headless for load and regression tests.
+
+RULES:
+- A round is QUESTIONS questions at one difficulty: 1 = one digit,
+  2 = two digits, 3 = four digits (random_int), + or - (decide_operation).
+  A subtraction never has a negative result.
+- Each question allows ATTEMPTS tries within QUESTION_SECONDS. A correct
+  first try scores 10 points, a correct second try 5. Two wrong tries or
+  running out of time count as wrong.
+- grade(score) gives the displayResults ranking: A+ from 90, B from 70,
+  C from 50, D below. Scores of CELEBRATE (70) or more get the confetti.
+
+HOW IT WORKS:
+- Questions come from a QuestionGenerator built on random_int and
+  decide_operation (adaptive, no repeats within a round).
+- submit(value, response_ms) and time_up() return the outcome of the
+  question. After a final outcome the question is closed, so a second
+  Enter press cannot score it twice.
+"""
+
+import random
+import time
+
+from quiz_questions import QuestionGenerator
+
+QUESTIONS = 10
+ATTEMPTS = 2
+POINTS = {1: 10, 2: 5}        # Correct on attempt n -> points
+QUESTION_SECONDS = 12
+RANGES = {1: (1, 9), 2: (10, 99), 3: (1000, 9999)}   # Easy (1 digit), Moderate (2 digits), Advanced (4 digits)
+GRADES = (                    # (lowest score, grade, colour, message)
+    (90, "A+ (Math Wizard)", "#FFD700", "Outstanding!"),
+    (70, "B (Math Pro)", "#00FF00", "Excellent Work!"),
+    (50, "C (Good Try)", "#FFA500", "Keep Going!"),
+    (0, "D (Keep Practicing)", "#FF4444", "Don't Give Up!"),
+)
+CELEBRATE = 70
+
+
+def random_int(difficulty):
+    """An operand for the given difficulty level."""
+    low, high = RANGES.get(difficulty, RANGES[3])
+    return random.randint(low, high)
+
+
+def decide_operation():
+    return random.choice(["+", "-"])
+
+
+def grade(score):
+    """(grade, colour, message) for a final score."""
+    for lowest, name, color, msg in GRADES:
+        if score >= lowest: return name, color, msg
+    return GRADES[-1][1:]
+
+
+class QuizEngine:
+    """One player's rounds: questions, attempts, scoring, time limit and grading."""
+    def __init__(self, rand_int=random_int, operation=decide_operation, questions=QUESTIONS,
+                 seconds=QUESTION_SECONDS, clock=time.perf_counter):
+        self.generator = QuestionGenerator(rand_int, operation)
+        self.questions = questions
+        self.seconds = seconds
+        self.clock = clock
+        self.new_game(1)
+
+    def prefill(self):
+        """Builds the question pools of every level in the background."""
+        self.generator.prefill(list(RANGES))
+
+    # --- ROUND ---
+    def new_game(self, difficulty, accuracy=None, avg_ms=None):
+        """Starts a round; accuracy / avg_ms from the player's recent rounds set the starting tier."""
+        self.difficulty = difficulty
+        self.score = self.correct = self.wrong = 0
+        self.number = 0                # Questions asked so far
+        self.question = None           # (a, b, op)
+        self.solution = 0
+        self.attempts_left = 0
+        self.hint_used = False
+        self.open = False              # The current question can still be answered
+        self.started = 0.0
+        self.last = None               # (attempts used, correct, points, response ms) of the last closed question
+        self.generator.start(difficulty, accuracy, avg_ms)
+
+    @property
+    def over(self):
+        return self.number >= self.questions and not self.open
+
+    def next_question(self):
+        """Moves on to the next question and returns (a, b, op), or None once the round is over."""
+        self.open = False
+        if self.number >= self.questions: return None
+        self.number += 1
+        a, b, op = self.generator.next()
+        if op == "-" and a < b: a, b = b, a # Prevent negative result
+        self.question = (a, b, op)
+        self.solution = a + b if op == "+" else a - b
+        self.attempts_left = ATTEMPTS
+        self.hint_used = False
+        self.open = True
+        self.started = self.clock()
+        return self.question
+
+    def text(self):
+        a, b, op = self.question
+        return f"{a} {op} {b} = ?"
+
+    def hint(self):
+        self.hint_used = True
+        return "EVEN" if self.solution % 2 == 0 else "ODD"
+
+    def elapsed_ms(self):
+        return (self.clock() - self.started) * 1000
+
+    # --- ANSWERS ---
+    def submit(self, value, response_ms=None):
+        """isCorrect: (outcome, points) with outcome 'correct', 'retry', 'wrong', 'timeout' or 'closed'."""
+        if not self.open: return "closed", 0
+        if response_ms is None: response_ms = self.elapsed_ms()
+        if response_ms > self.seconds * 1000: return self.time_up(response_ms)
+        attempt = ATTEMPTS - self.attempts_left + 1
+        if value == self.solution:
+            points = POINTS[attempt]
+            self.score += points
+            self.correct += 1
+            self._close(attempt, True, points, response_ms)
+            return "correct", points
+        self.attempts_left -= 1
+        if self.attempts_left > 0: return "retry", 0
+        self.wrong += 1
+        self._close(attempt, False, 0, response_ms)
+        return "wrong", 0
+
+    def time_up(self, response_ms=None):
+        if not self.open: return "closed", 0
+        self.wrong += 1
+        self._close(ATTEMPTS - self.attempts_left, False, 0, response_ms or self.seconds * 1000)
+        return "timeout", 0
+
+    def _close(self, attempts, correct, points, response_ms):
+        self.open = False
+        self.last = (attempts, correct, points, response_ms)
+        self.generator.record(correct, response_ms)
+
+    def result(self):
+        """displayResults: the final score, counts and grade of the round."""
+        name, color, msg = grade(self.score)
+        return {"score": self.score, "correct": self.correct, "wrong": self.wrong, "grade": name,
+                "color": color, "message": msg, "celebrate": self.score >= CELEBRATE}
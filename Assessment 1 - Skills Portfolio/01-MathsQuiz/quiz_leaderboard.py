@@ -0,0 +1,193 @@
+"""
+QUIZ LEADERBOARD
+-------------------
+Every result ever played, shared safely between several quiz windows (or
+kiosks writing to one network folder), with fast top-N and rank queries.
+
+HOW IT WORKS:
+- leaderboard.log is an append-only log, one JSON line per result:
+      {"name": ..., "score": ..., "difficulty": ..., "time": ...}
+  Nothing is ever rewritten or truncated, so no result can be lost.
+- Writers take an exclusive lock on leaderboard.log.lock (fcntl.flock on
+  Linux/macOS, msvcrt.locking on Windows) for the append. The lock makes the
+  append and the snapshot update that follows a single step. If a writer
+  crashed mid-line, the next one ends that fragment with a newline first, so
+  only the fragment is skipped and never the new result.
+- leaderboard.json keeps its old format (the overall top 3 as a list of
+  {"name", "score"}). It is rewritten through a temp file and os.replace(), so
+  a reader never sees half a file. The first run seeds the log from an
+  existing leaderboard.json.
+- Each Leaderboard keeps an index per difficulty (plus None = all levels):
+      a bounded min-heap of the best `keep` results  -> top(n)
+      each player's best score and a sorted list of those bests
+                                                      -> rank(name) by bisect, O(log N)
+- refresh() only reads the bytes appended since the last read (any window's
+  writes), so the index stays current without re-reading the history.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
+import heapq
+import json
+import os
+import time
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:   # Windows
+    fcntl = None
+    import msvcrt
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_FILE = os.path.join(BASE_DIR, "leaderboard.log")
+SNAPSHOT_FILE = os.path.join(BASE_DIR, "leaderboard.json")
+SNAPSHOT_SIZE = 3   # Entries in leaderboard.json (the results page shows a top 3)
+TOP_K = 100         # Best results kept in memory per difficulty
+
+
+@contextmanager
+def file_lock(path):
+    """Exclusive inter-process lock held on path for the duration of the with-block."""
+    with open(path, "a+b") as f:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError: pass # LK_LOCK gives up after ~10 s; keep waiting
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class Board:
+    """Top-K heap and player ranks for one difficulty."""
+    def __init__(self, keep=TOP_K):
+        self.keep = keep
+        self.heap = []      # Min-heap of (score, -seq, name): the best `keep` results
+        self.best = {}      # name -> best score
+        self.ranked = []    # Every player's best score, ascending
+
+    def add(self, seq, name, score):
+        entry = (score, -seq, name) # Equal scores: the earlier result ranks higher
+        if len(self.heap) < self.keep: heapq.heappush(self.heap, entry)
+        elif entry > self.heap[0]: heapq.heapreplace(self.heap, entry)
+        old = self.best.get(name)
+        if old is None or score > old:
+            if old is not None: del self.ranked[bisect_left(self.ranked, old)]
+            insort(self.ranked, score)
+            self.best[name] = score
+
+    def top(self, n):
+        return [(name, score) for score, _, name in heapq.nlargest(n, self.heap)]
+
+    def rank(self, name):
+        """1-based position of the player's best score among all players (ties share a rank)."""
+        best = self.best.get(name)
+        if best is None: return None
+        return len(self.ranked) - bisect_right(self.ranked, best) + 1
+
+
+class Leaderboard:
+    """The shared results log plus an in-memory index of it."""
+    def __init__(self, log_path=LOG_FILE, snapshot_path=SNAPSHOT_FILE, keep=TOP_K):
+        self.log_path = log_path
+        self.snapshot_path = snapshot_path
+        self.lock_path = log_path + ".lock"
+        self.keep = keep
+        self.boards = {}    # difficulty (None = all levels) -> Board
+        self.offset = 0     # Bytes of the log already indexed
+        self.seq = 0        # Results indexed so far
+        if not os.path.exists(log_path) and os.path.exists(snapshot_path): self._seed()
+        self.refresh()
+
+    # --- WRITING ---
+    def add(self, name, score, difficulty=None):
+        """Appends one result and returns the player's rank at that difficulty."""
+        line = json.dumps({"name": name, "score": score, "difficulty": difficulty, "time": round(time.time(), 3)},
+                          separators=(",", ":")) + "\n"
+        with file_lock(self.lock_path):
+            with open(self.log_path, "a+b") as f:
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n": line = "\n" + line # Close a line left by a crashed writer
+                f.write(line.encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+            self.refresh()
+            self._write_snapshot()
+        return self.rank(name, difficulty)
+
+    def _write_snapshot(self):
+        data = [{"name": name, "score": score} for name, score in self.top(SNAPSHOT_SIZE)]
+        tmp = self.snapshot_path + ".tmp"
+        with open(tmp, "w") as f: json.dump(data, f, indent=4)
+        os.replace(tmp, self.snapshot_path)
+
+    def _seed(self):
+        """First run: starts the log with the results kept in the old leaderboard.json."""
+        with file_lock(self.lock_path):
+            if os.path.exists(self.log_path): return # Another window got there first
+            try:
+                with open(self.snapshot_path) as f: old = json.load(f)
+            except (OSError, ValueError): old = []
+            tmp = self.log_path + ".tmp"
+            with open(tmp, "w") as f:
+                for p in old:
+                    if isinstance(p, dict) and "name" in p and "score" in p:
+                        f.write(json.dumps({"name": p["name"], "score": p["score"], "difficulty": None, "time": 0},
+                                           separators=(",", ":")) + "\n")
+            os.replace(tmp, self.log_path)
+
+    # --- READING ---
+    def refresh(self):
+        """Indexes results appended to the log since the last call (by any process)."""
+        try:
+            size = os.path.getsize(self.log_path)
+        except OSError:
+            return
+        if size < self.offset: # Log was replaced: start over
+            self.boards, self.offset, self.seq = {}, 0, 0
+        if size == self.offset: return
+        with open(self.log_path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+        end = data.rfind(b"\n") + 1 # A line still being written is picked up next time
+        for line in data[:end].splitlines():
+            try:
+                rec = json.loads(line)
+                name, score = str(rec["name"]), int(rec["score"])
+            except (ValueError, KeyError, TypeError):
+                continue
+            self.seq += 1
+            self._board(None).add(self.seq, name, score)
+            if rec.get("difficulty") is not None: self._board(rec["difficulty"]).add(self.seq, name, score)
+        self.offset += end
+
+    def _board(self, difficulty):
+        board = self.boards.get(difficulty)
+        if board is None: board = self.boards[difficulty] = Board(self.keep)
+        return board
+
+    def top(self, n=SNAPSHOT_SIZE, difficulty=None):
+        """The n best results as (name, score), best first (n <= keep)."""
+        board = self.boards.get(difficulty)
+        return board.top(n) if board else []
+
+    def rank(self, name, difficulty=None):
+        board = self.boards.get(difficulty)
+        return board.rank(name) if board else None
+
+    def players(self, difficulty=None):
+        board = self.boards.get(difficulty)
+        return len(board.best) if board else 0
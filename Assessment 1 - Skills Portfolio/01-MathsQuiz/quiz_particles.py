@@ -0,0 +1,124 @@
+"""
+QUIZ CONFETTI
+-------------------
+Pooled, batched confetti for the results page.
+
+HOW IT WORKS:
+- The canvas ovals are created once (the pool) and reused every round: reset()
+  re-rolls position, size, colour and speed of the first `budget` items and
+  hides the rest. Play Again never adds canvas items.
+- Particle state is kept as parallel arrays (x, y, vx, vy, bucket), not one
+  dict per particle. step(dt) advances every position in one vectorized
+  operation (NumPy if installed, otherwise one list comprehension per array).
+- Particles share one of a few fixed velocities (speed x sway direction), and
+  each velocity is a canvas tag. A frame is one canvas.move() per tag plus one
+  move for each particle that wrapped back to the top, instead of a move()
+  and a coords() call for every particle.
+- The budget (active particles) drops by a quarter, down to min_budget,
+  whenever the average frame interval goes over the frame budget, so a slow
+  machine sheds confetti instead of frames. The reduced budget is kept for
+  later rounds.
+"""
+
+import random
+
+try:
+    import numpy as np
+except ImportError:   # Optional: pure-Python fallback below
+    np = None
+
+from quiz_animation import FRAME_MS
+
+COLORS = ('#FFD700', '#FF0000', '#00FF00', '#00FFFF', '#FF00FF')
+SPEEDS = range(4, 11)          # Pixels per 25 ms, as in the original effect
+SWAYS = (-1, 1)
+VELOCITIES = [(sway, speed) for speed in SPEEDS for sway in SWAYS]   # Bucket -> (vx, vy)
+BUDGET = 80
+MIN_BUDGET = 20
+OVER_BUDGET = 1.5              # Shed particles when frames average this many times FRAME_MS
+SMOOTHING = 0.1                # Weight of the newest frame in the running average
+WRAP = 800                     # A particle leaving the bottom re-enters this far up
+
+
+class ConfettiSystem:
+    """Falling confetti on a canvas from a fixed pool of `budget` reusable ovals."""
+    def __init__(self, canvas, budget=BUDGET, min_budget=MIN_BUDGET, width=1200, height=700,
+                 frame_ms=FRAME_MS):
+        self.canvas = canvas
+        self.capacity = budget
+        self.budget = budget
+        self.min_budget = min(min_budget, budget)
+        self.width, self.height = width, height
+        self.limit_ms = frame_ms * OVER_BUDGET
+        self.avg_ms = frame_ms
+        self.items = []          # Pool of oval ids, created on the first reset()
+        self.active = 0          # items[:active] are on screen
+        self.x = self.y = self.vx = self.vy = None
+        self.bucket = []         # Velocity bucket per particle
+
+    # --- POOL ---
+    def reset(self):
+        """Starts a new round: re-rolls the first `budget` particles, hides the rest."""
+        if not self.items:
+            self.items = [self.canvas.create_oval(0, 0, 0, 0, outline="", state="hidden", tags=("confetti",))
+                          for _ in range(self.capacity)]
+        n = self.budget
+        x = [random.randint(0, self.width) for _ in range(n)]
+        y = [random.randint(-self.height, 0) for _ in range(n)]
+        self.bucket = [random.randrange(len(VELOCITIES)) for _ in range(n)]
+        for i in range(n):
+            size = random.randint(6, 18)
+            item = self.items[i]
+            self.canvas.coords(item, x[i], y[i], x[i] + size, y[i] + size)
+            self.canvas.itemconfigure(item, fill=random.choice(COLORS), state="normal",
+                                      tags=("confetti", f"confetti-{self.bucket[i]}"))
+        for item in self.items[n:]:
+            self.canvas.itemconfigure(item, state="hidden", tags=("confetti",))
+        self.canvas.tag_raise("confetti")
+        vx = [VELOCITIES[b][0] for b in self.bucket]
+        vy = [VELOCITIES[b][1] for b in self.bucket]
+        if np is not None:
+            self.x, self.y = np.array(x, dtype=float), np.array(y, dtype=float)
+            self.vx, self.vy = np.array(vx, dtype=float), np.array(vy, dtype=float)
+        else:
+            self.x, self.y, self.vx, self.vy = [float(v) for v in x], [float(v) for v in y], vx, vy
+        self.active = n
+
+    def hide(self):
+        for item in self.items[:self.active]:
+            self.canvas.itemconfigure(item, state="hidden", tags=("confetti",))
+        self.active = 0
+
+    # --- FRAME ---
+    def step(self, dt):
+        """One frame (a FrameClock Loop step): moves every particle by dt seconds of motion."""
+        if not self.active: return False
+        scale = dt * 40   # Velocities are pixels per 25 ms
+        for b, (vx, vy) in enumerate(VELOCITIES):
+            self.canvas.move(f"confetti-{b}", vx * scale, vy * scale)
+        if np is not None:
+            self.x += self.vx * scale
+            self.y += self.vy * scale
+            wrapped = np.flatnonzero(self.y > self.height).tolist()
+            self.y[wrapped] -= WRAP
+        else:
+            self.x = [x + vx * scale for x, vx in zip(self.x, self.vx)]
+            self.y = [y + vy * scale for y, vy in zip(self.y, self.vy)]
+            wrapped = [i for i, y in enumerate(self.y) if y > self.height]
+            for i in wrapped: self.y[i] -= WRAP
+        for i in wrapped:
+            self.canvas.move(self.items[i], 0, -WRAP)
+        self.adapt(dt * 1000)
+        return True
+
+    def adapt(self, interval_ms):
+        """Sheds a quarter of the particles while frames average over budget."""
+        self.avg_ms += SMOOTHING * (interval_ms - self.avg_ms)
+        if self.avg_ms <= self.limit_ms or self.active <= self.min_budget: return
+        n = max(self.min_budget, self.active * 3 // 4)
+        for item in self.items[n:self.active]:
+            self.canvas.itemconfigure(item, state="hidden", tags=("confetti",))
+        self.x, self.y, self.vx, self.vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+        self.bucket = self.bucket[:n]
+        self.active = self.budget = n
+        self.avg_ms = self.limit_ms / OVER_BUDGET # Give the smaller load a fresh measurement
@@ -0,0 +1,171 @@
+"""
+QUIZ QUESTION GENERATOR
+-------------------
+Adaptive question picking from precomputed problem pools.
+
+HOW IT WORKS:
+- Problems are made in bulk by the brief's own randomInt()/decideOperation()
+  (passed in by QuizPage), so the difficulty ranges stay defined in one place.
+- Each problem is sorted into a tier by how many carries (addition) or borrows
+  (subtraction) it needs: 0 = easy, 1 = medium, 2+ = hard. Every
+  (difficulty, tier) has its own shuffled pool with no duplicates.
+- next() pops from the current tier's pool, which is O(1), and skips anything
+  already asked this round, so a round never repeats a question. When a pool
+  runs low, its difficulty is queued for one long-lived daemon worker that
+  refills it in the background (the draw itself never waits for a refill).
+- record() keeps the last RECENT answers. Mostly correct and fast answers move
+  the player up a tier; mostly wrong or slow ones move them down. start()
+  can seed the tier from the player's recent rounds (quiz_sessions trend).
+"""
+
+from collections import deque
+import queue
+import random
+import threading
+
+TIERS = (0, 1, 2)        # Easy / medium / hard within a difficulty level
+POOL_SIZE = 256          # Problems kept per (difficulty, tier)
+LOW_WATER = 64           # Refill a pool in the background below this
+RECENT = 4               # Answers considered when adapting
+MAKE_TRIES = 50          # Direct draws to find an unasked problem when the pools are empty
+UP_ACCURACY, DOWN_ACCURACY = 0.75, 0.5
+FAST_MS, SLOW_MS = 4000, 9000
+
+
+def tier_of(a, b, op):
+    """Carries (a + b) or borrows (a - b, a >= b) needed, capped at the hardest tier."""
+    steps = carry = 0
+    while a or b:
+        da, db = a % 10, b % 10
+        if op == "+": carry = 1 if da + db + carry >= 10 else 0
+        else: carry = 1 if da - db - carry < 0 else 0
+        steps += carry
+        a, b = a // 10, b // 10
+    return min(steps, TIERS[-1])
+
+
+NEAREST = {t: sorted(TIERS, key=lambda other: abs(other - t)) for t in TIERS}   # Fallback order per tier
+
+
+def target_tier(tier, accuracy, avg_ms):
+    if accuracy >= UP_ACCURACY and avg_ms <= FAST_MS: return min(tier + 1, TIERS[-1])
+    if accuracy < DOWN_ACCURACY or avg_ms >= SLOW_MS: return max(tier - 1, TIERS[0])
+    return tier
+
+
+class QuestionGenerator:
+    """Pools of (a, b, op) problems per difficulty and tier; rand_int(difficulty) and operation() make them."""
+    def __init__(self, rand_int, operation, pool_size=POOL_SIZE):
+        self.rand_int = rand_int
+        self.operation = operation
+        self.pool_size = pool_size
+        self.pools = {}         # (difficulty, tier) -> problems, drawn from the end
+        self.keys = {}          # (difficulty, tier) -> set of the problems in that pool
+        self.reached = {}       # (difficulty, tier) -> pool size the last fill reached (Easy has few problems)
+        self.lock = threading.Lock()
+        self.filling = set()    # Difficulties queued for (or being) refilled
+        self.requests = queue.Queue()
+        self.worker = None
+        self.difficulty = 1
+        self.tier = 1
+        self.recent = deque(maxlen=RECENT)   # (correct, response ms)
+        self.hits = self.total_ms = 0        # Running sums over self.recent
+        self.asked = set()      # Problems shown this round
+
+    # --- POOLS ---
+    def make(self, difficulty):
+        a, b, op = self.rand_int(difficulty), self.rand_int(difficulty), self.operation()
+        if op == "-" and a < b: a, b = b, a # Prevent negative result
+        return a, b, op
+
+    def fill(self, difficulty):
+        """Tops every tier of a difficulty up to pool_size with one bulk batch."""
+        with self.lock:
+            missing = sum(self.pool_size - len(self.pools.get((difficulty, t), ())) for t in TIERS)
+        batch = {t: {} for t in TIERS} # Dicts de-duplicate and keep the random order
+        for _ in range(missing * 2):
+            p = self.make(difficulty)
+            batch[tier_of(*p)][p] = None
+        with self.lock:
+            for t, fresh in batch.items():
+                pool = self.pools.setdefault((difficulty, t), [])
+                keys = self.keys.setdefault((difficulty, t), set())
+                for p in fresh:
+                    if len(pool) >= self.pool_size: break
+                    if p not in keys:
+                        keys.add(p)
+                        pool.append(p)
+                random.shuffle(pool)
+                self.reached[(difficulty, t)] = len(pool)
+            self.filling.discard(difficulty)
+
+    def prefill(self, difficulties):
+        """Queues several difficulties for the background worker."""
+        for d in difficulties: self._request(d)
+
+    def _request(self, difficulty):
+        with self.lock:
+            if difficulty in self.filling: return
+            self.filling.add(difficulty)
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._work, daemon=True)
+            self.worker.start()
+        self.requests.put(difficulty)
+
+    def _work(self):
+        while True:
+            self.fill(self.requests.get())
+
+    def _maybe_refill(self, difficulty, tier):
+        """Queues a refill if the pool just drawn from (tier None: all of them) ran low."""
+        key = (difficulty, tier)
+        if tier is None or len(self.pools[key]) < min(LOW_WATER, self.reached.get(key, 0) // 2):
+            self._request(difficulty)
+
+    # --- ROUND ---
+    def start(self, difficulty, accuracy=None, avg_ms=None):
+        """Begins a round; accuracy / avg_ms of the player's recent rounds pick the starting tier."""
+        self.difficulty = difficulty
+        self.tier = 1 if accuracy is None else target_tier(1, accuracy, avg_ms or 0)
+        self.recent.clear()
+        self.hits = self.total_ms = 0
+        self.asked.clear()
+        if not any(self.pools.get((difficulty, t)) for t in TIERS) and difficulty not in self.filling:
+            self.fill(difficulty) # First round before the prefill got here
+
+    def next(self):
+        """The next problem as (a, b, op): a pop from the nearest non-empty tier pool."""
+        d, p = self.difficulty, None
+        for t in NEAREST[self.tier]:
+            with self.lock:
+                pool, keys = self.pools.get((d, t)), self.keys.get((d, t))
+                while pool:
+                    p = pool.pop()
+                    keys.discard(p)
+                    if p not in self.asked: break
+                    p = None
+            if p: break
+        if p is None: # Pools drained (or still filling): make one directly
+            t = None
+            for _ in range(MAKE_TRIES):
+                p = self.make(d)
+                if p not in self.asked: break
+        self.asked.add(p)
+        self._maybe_refill(d, t)
+        return p
+
+    def record(self, correct, response_ms):
+        """Adds an answer and moves the tier once RECENT answers point the same way."""
+        if len(self.recent) == RECENT:
+            old_correct, old_ms = self.recent[0]
+            self.hits -= old_correct
+            self.total_ms -= old_ms
+        self.recent.append((correct, response_ms))
+        self.hits += correct
+        self.total_ms += response_ms
+        if len(self.recent) < RECENT: return
+        tier = target_tier(self.tier, self.hits / RECENT, self.total_ms / RECENT)
+        if tier != self.tier:
+            self.tier = tier
+            self.recent.clear() # Judge the new tier on its own answers
+            self.hits = self.total_ms = 0
@@ -0,0 +1,275 @@
+"""
+QUIZ SESSION HISTORY
+-------------------
+Every answered question of every round, kept on disk in a compact columnar
+format, with per-player analytics (accuracy, response time, trends).
+
+ON DISK (sessions/):
+- One append-only file per column, each a packed array of fixed-width values:
+      session u32 | player u32 | time u32 | difficulty u8 | op u8 | a u16 | b u16
+      attempts u8 | correct u8 | hint u8 | response_ms f32 | points u8
+  That is 26 bytes per answer, about 26 MB per million answers.
+- players.txt maps player ids to names (line number = id). Names are stored
+  and looked up through normalize() (whitespace collapsed), so "Ann  Lee"
+  and " Ann Lee" are the same player.
+- Writers hold the sessions.lock file lock (see quiz_leaderboard.file_lock)
+  and append whole sessions, one column after another. The row count is
+  therefore the length of the last column. Readers never see half a row,
+  and the next writer trims rows left over from a crash.
+
+QUERIES:
+- SessionStore folds new rows into per-(player, difficulty) and per-session
+  totals as they arrive. With NumPy this is one bincount per column;
+  without it, one pass in Python. accuracy() and avg_response_ms() are dict
+  lookups, and trend() reads only that player's sessions, so queries do not
+  slow down as the history grows to millions of answers.
+- column(name) returns a whole column for ad hoc analysis.
+- preload() reads the history on a daemon thread at startup, so the first
+  query on the Tk thread only folds in what changed since.
+"""
+
+from array import array
+import os
+import threading
+import time
+
+try:
+    import numpy as np
+except ImportError:   # Optional: pure-Python fallback below
+    np = None
+
+from quiz_leaderboard import file_lock
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SESSIONS_DIR = os.path.join(BASE_DIR, "sessions")
+OPS = ("+", "-")
+LEVELS = (1, 2, 3)
+ANSWER_FIELDS = ("time", "difficulty", "op", "a", "b", "attempts", "correct", "hint", "response_ms", "points")
+COLUMNS = (   # name, array typecode, NumPy dtype (native byte order, like array.tofile)
+    ("session", "I", "u4"), ("player", "I", "u4"), ("time", "I", "u4"),
+    ("difficulty", "B", "u1"), ("op", "B", "u1"), ("a", "H", "u2"), ("b", "H", "u2"),
+    ("attempts", "B", "u1"), ("correct", "B", "u1"), ("hint", "B", "u1"),
+    ("response_ms", "f", "f4"), ("points", "B", "u1"),
+)
+TYPECODES = {name: code for name, code, _ in COLUMNS}
+DTYPES = {name: dtype for name, _, dtype in COLUMNS}
+
+
+def normalize(name):
+    """A player name as stored in players.txt: one line, whitespace collapsed, never empty."""
+    return " ".join(str(name).split()) or "Player"
+
+
+class SessionStore:
+    """The sessions/ folder: append() writes whole sessions, the query methods read totals."""
+    def __init__(self, folder=SESSIONS_DIR):
+        self.folder = folder
+        self.lock_path = os.path.join(folder, "sessions.lock")
+        self.players = []          # id -> name
+        self.player_ids = {}       # name -> id
+        self.names_offset = 0      # Bytes of players.txt already read
+        self.rows = 0              # Rows folded into the totals below
+        self.by_player = {}        # (player id, difficulty) -> [answered, correct, response ms, hints, attempts]
+        self.sessions = {}         # session id -> [player id, difficulty, start time, answered, correct, response ms]
+        self.player_sessions = {}  # player id -> session ids, oldest first
+        self.lock = threading.Lock()   # preload() thread vs queries and appends
+
+    def path(self, column):
+        return os.path.join(self.folder, column + ".col")
+
+    def row_count(self):
+        """Complete rows on disk: the last column is written last, so it is the shortest."""
+        name, code, _ = COLUMNS[-1]
+        try:
+            return os.path.getsize(self.path(name)) // array(code).itemsize
+        except OSError:
+            return 0
+
+    # --- WRITING ---
+    def append(self, name, answers):
+        """Saves one session for player `name`; answers are tuples in ANSWER_FIELDS order. Returns the session id."""
+        return self.append_many([(name, answers)])[0]
+
+    def append_many(self, sessions):
+        """Saves several (name, answers) sessions under one lock; returns their session ids."""
+        os.makedirs(self.folder, exist_ok=True)
+        with self.lock, file_lock(self.lock_path):
+            n = self._repair()
+            self._read_players()
+            sid = self._column_value("session", n - 1) + 1 if n else 0
+            cols = {name: array(code) for name, code, _ in COLUMNS}
+            new_names, ids = [], []
+            for name, answers in sessions:
+                name = normalize(name)
+                pid = self.player_ids.get(name)
+                if pid is None:
+                    pid = self.player_ids[name] = len(self.players)
+                    self.players.append(name)
+                    new_names.append(name)
+                for row in answers:
+                    cols["session"].append(sid)
+                    cols["player"].append(pid)
+                    for field, value in zip(ANSWER_FIELDS, row): cols[field].append(value)
+                ids.append(sid)
+                sid += 1
+            if new_names:
+                data = "".join(n + "\n" for n in new_names).encode("utf-8")
+                with open(os.path.join(self.folder, "players.txt"), "ab") as f: f.write(data)
+                self.names_offset += len(data) # Already in self.players
+            for name, _, _ in COLUMNS:
+                with open(self.path(name), "ab") as f: cols[name].tofile(f)
+        return ids
+
+    def _repair(self):
+        """Trims rows a crashed writer left in the first columns only; returns the row count."""
+        n = self.row_count()
+        for name, code, _ in COLUMNS[:-1]:
+            size = n * array(code).itemsize
+            try:
+                if os.path.getsize(self.path(name)) > size: os.truncate(self.path(name), size)
+            except FileNotFoundError:
+                pass
+        return n
+
+    def _column_value(self, column, row):
+        values = array(TYPECODES[column])
+        with open(self.path(column), "rb") as f:
+            f.seek(row * values.itemsize)
+            values.fromfile(f, 1)
+        return values[0]
+
+    # --- READING ---
+    def _read_players(self):
+        try:
+            with open(os.path.join(self.folder, "players.txt"), "rb") as f:
+                f.seek(self.names_offset)
+                data = f.read()
+        except OSError:
+            return
+        end = data.rfind(b"\n") + 1
+        for name in data[:end].decode("utf-8").splitlines():
+            self.player_ids[name] = len(self.players)
+            self.players.append(name)
+        self.names_offset += end
+
+    def column(self, name, start=0, stop=None):
+        """Rows [start, stop) of one column (a NumPy array, or an array.array without NumPy)."""
+        stop = self.row_count() if stop is None else stop
+        code = TYPECODES[name]
+        count = max(0, stop - start)
+        if np is not None:
+            if not count: return np.empty(0, dtype=DTYPES[name])
+            return np.fromfile(self.path(name), dtype=DTYPES[name], count=count, offset=start * array(code).itemsize)
+        values = array(code)
+        if count:
+            with open(self.path(name), "rb") as f:
+                f.seek(start * values.itemsize)
+                values.fromfile(f, count)
+        return values
+
+    def refresh(self):
+        """Folds rows appended since the last call (by any process) into the totals."""
+        with self.lock:
+            n = self.row_count()
+            if n <= self.rows: return
+            self._read_players()
+            c = {name: self.column(name, self.rows, n) for name in
+                 ("session", "player", "time", "difficulty", "correct", "hint", "attempts", "response_ms")}
+            if np is not None:
+                self._fold_numpy(c)
+            else:
+                self._fold_python(c)
+            self.rows = n
+
+    def preload(self):
+        """Reads the history on a daemon thread (startup), ahead of the first query."""
+        threading.Thread(target=self.refresh, daemon=True).start()
+
+    def _fold_numpy(self, c):
+        keys = c["player"].astype(np.int64) * 4 + c["difficulty"]
+        uniq, inv = np.unique(keys, return_inverse=True)
+        sums = [np.bincount(inv, minlength=len(uniq))] + [np.bincount(inv, weights=c[k], minlength=len(uniq))
+                                                           for k in ("correct", "response_ms", "hint", "attempts")]
+        for key, *vals in zip(uniq.tolist(), *(s.tolist() for s in sums)):
+            self._add(self.by_player, (key >> 2, key & 3), vals)
+        sids, first, inv = np.unique(c["session"], return_index=True, return_inverse=True)
+        sums = [np.bincount(inv, minlength=len(sids))] + [np.bincount(inv, weights=c[k], minlength=len(sids))
+                                                           for k in ("correct", "response_ms")]
+        for sid, i, *vals in zip(sids.tolist(), first.tolist(), *(s.tolist() for s in sums)):
+            self._add_session(sid, int(c["player"][i]), int(c["difficulty"][i]), int(c["time"][i]), vals)
+
+    def _fold_python(self, c):
+        for sid, pid, t, level, correct, hint, attempts, ms in zip(
+                c["session"], c["player"], c["time"], c["difficulty"], c["correct"], c["hint"], c["attempts"],
+                c["response_ms"]):
+            self._add(self.by_player, (pid, level), (1, correct, ms, hint, attempts))
+            self._add_session(sid, pid, level, t, (1, correct, ms))
+
+    def _add(self, table, key, vals):
+        totals = table.get(key)
+        if totals is None: table[key] = list(vals)
+        else:
+            for i, v in enumerate(vals): totals[i] += v
+
+    def _add_session(self, sid, pid, level, t, vals):
+        if sid not in self.sessions:
+            self.sessions[sid] = [pid, level, t, 0, 0, 0.0]
+            self.player_sessions.setdefault(pid, []).append(sid)
+        totals = self.sessions[sid]
+        for i, v in enumerate(vals): totals[3 + i] += v
+
+    # --- QUERIES ---
+    def _totals(self, name, difficulty):
+        self.refresh()
+        pid = self.player_ids.get(normalize(name))
+        totals = [0, 0, 0.0, 0, 0]
+        if pid is None: return totals
+        for level in ((difficulty,) if difficulty else LEVELS):
+            for i, v in enumerate(self.by_player.get((pid, level), ())): totals[i] += v
+        return totals
+
+    def answered(self, name, difficulty=None):
+        return int(self._totals(name, difficulty)[0])
+
+    def accuracy(self, name, difficulty=None):
+        """Fraction of questions answered correctly (None if the player has no answers)."""
+        answered, correct = self._totals(name, difficulty)[:2]
+        return correct / answered if answered else None
+
+    def avg_response_ms(self, name, difficulty=None):
+        answered, _, ms = self._totals(name, difficulty)[:3]
+        return ms / answered if answered else None
+
+    def hint_rate(self, name, difficulty=None):
+        answered, _, _, hints = self._totals(name, difficulty)[:4]
+        return hints / answered if answered else None
+
+    def trend(self, name, last=10, difficulty=None):
+        """The player's last sessions, oldest first: (start time, difficulty, accuracy, avg response ms)."""
+        self.refresh()
+        out = []
+        for sid in reversed(self.player_sessions.get(self.player_ids.get(normalize(name)), ())):
+            _, level, t, answered, correct, ms = self.sessions[sid]
+            if difficulty and level != difficulty: continue
+            out.append((t, level, correct / answered, ms / answered))
+            if len(out) == last: break
+        return out[::-1]
+
+
+class SessionRecorder:
+    """Collects one round's answers in memory; finish() saves them as one session."""
+    def __init__(self, store, name, difficulty):
+        self.store = store
+        self.name = name
+        self.difficulty = difficulty
+        self.answers = []
+
+    def record(self, a, b, op, attempts, correct, hint, response_ms, points):
+        self.answers.append((int(time.time()), self.difficulty, OPS.index(op), a, b, attempts, int(correct),
+                             int(hint), response_ms, points))
+
+    def finish(self):
+        """Saves the session (if anything was answered); returns its id or None."""
+        if not self.answers: return None
+        answers, self.answers = self.answers, []
+        return self.store.append(self.name, answers)
@@ -0,0 +1,156 @@
+"""
+QUIZ SIMULATION HARNESS
+-------------------
+Plays simulated rounds through QuizEngine (no window, no sound) to load-test
+and regression-check the quiz rules:
+
+    python quiz_simulate.py --players 1000000
+    python quiz_simulate.py --players 200000 --levels 3 --jobs 4 --json
+
+HOW IT WORKS:
+- Each simulated player gets a skill (chance of a right answer, lower on
+  harder tiers) and a typical response time. They play one round at a random
+  level from --levels, answering through submit() exactly as the GUI does, so
+  retries, the 10/5 scoring, time-outs and adaptive tiers are all exercised.
+- Players are split into chunks of CHUNK and spread over a process pool
+  (--jobs, default: all cores). Each process reuses one engine, and each chunk
+  returns a score histogram per level instead of per-player results.
+- The report gives games/sec, and per level the mean, p10/p50/p90 score and
+  grade shares, plus the overall score distribution.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import math
+import os
+import random
+import time
+
+from quiz_engine import ATTEMPTS, GRADES, QUESTIONS, POINTS, QuizEngine, grade
+
+CHUNK = 20_000
+MAX_SCORE = QUESTIONS * POINTS[1]
+TIER_FACTOR = (1.0, 0.9, 0.75)   # Skill multiplier on easy / medium / hard questions
+_engine = None                   # One engine per worker process
+
+
+def play_round(engine, rng, level, skill, speed_ms):
+    """One simulated round; returns the final score."""
+    engine.new_game(level)
+    while engine.next_question():
+        p = skill * TIER_FACTOR[engine.generator.tier]
+        elapsed = 0.0
+        for _ in range(ATTEMPTS):
+            elapsed += rng.lognormvariate(math.log(speed_ms), 0.5)
+            value = engine.solution if rng.random() < p else engine.solution + 1
+            if engine.submit(value, elapsed)[0] != "retry": break
+    return engine.score
+
+
+def simulate_chunk(args):
+    """Plays `players` rounds; returns {level: score histogram}."""
+    global _engine
+    seed, players, levels = args
+    if _engine is None: _engine = QuizEngine()
+    random.seed(seed) # Question generation uses the random module
+    rng = random.Random(seed)
+    hist = {level: [0] * (MAX_SCORE + 1) for level in levels}
+    for _ in range(players):
+        level = rng.choice(levels)
+        score = play_round(_engine, rng, level, rng.betavariate(5, 2), rng.uniform(1500, 9000))
+        hist[level][score] += 1
+    return hist
+
+
+def simulate(players, levels=(1, 2, 3), jobs=None, seed=0, chunk=CHUNK):
+    """Score histograms per level for `players` simulated rounds, and the seconds it took."""
+    chunks = [(seed + i, min(chunk, players - start), tuple(levels)) for i, start in enumerate(range(0, players, chunk))]
+    jobs = min(jobs or os.cpu_count() or 1, len(chunks)) or 1
+    t0 = time.perf_counter()
+    if jobs <= 1:
+        hist = merge(map(simulate_chunk, chunks), levels)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            hist = merge(pool.map(simulate_chunk, chunks), levels)
+    return hist, time.perf_counter() - t0
+
+
+def merge(results, levels):
+    hist = {level: [0] * (MAX_SCORE + 1) for level in levels}
+    for res in results:
+        for level, counts in res.items():
+            hist[level] = [a + b for a, b in zip(hist[level], counts)]
+    return hist
+
+
+def percentile(counts, q):
+    target, seen = q * sum(counts), 0
+    for score, n in enumerate(counts):
+        seen += n
+        if seen >= target and n: return score
+    return 0
+
+
+def summary(counts):
+    games = sum(counts)
+    if not games: return {"games": 0}
+    grades = {}
+    for score, n in enumerate(counts):
+        if n:
+            label = grade(score)[0].split()[0]
+            grades[label] = grades.get(label, 0) + n
+    return {"games": games, "mean": round(sum(s * n for s, n in enumerate(counts)) / games, 2),
+            "p10": percentile(counts, 0.1), "p50": percentile(counts, 0.5), "p90": percentile(counts, 0.9),
+            "grades": {g: round(100 * n / games, 1) for g, n in grades.items()}}
+
+
+# --- REPORT ---
+
+def report(hist, seconds, jobs):
+    total = [sum(col) for col in zip(*hist.values())]
+    games = sum(total)
+    print(f"Simulated {games:,} rounds with {jobs} process(es) in {seconds:.1f} s: {games / seconds:,.0f} games/s\n")
+    labels = [g[1].split()[0] for g in GRADES]
+    print(f"{'level':<7}{'games':>11}{'mean':>8}{'p10':>6}{'p50':>6}{'p90':>6}" + "".join(f"{g:>8}" for g in labels))
+    for level, counts in list(hist.items()) + [("all", total)]:
+        s = summary(counts)
+        if not s["games"]: continue
+        print(f"{level!s:<7}{s['games']:>11,}{s['mean']:>8.1f}{s['p10']:>6}{s['p50']:>6}{s['p90']:>6}"
+              + "".join(f"{s['grades'].get(g, 0):>7.1f}%" for g in labels))
+    print("\nScore distribution (all levels)")
+    peak = max(total) or 1
+    for score, n in enumerate(total):
+        if score % POINTS[2] == 0:
+            print(f"{score:>5} {100 * n / games:>6.2f}%  " + "#" * round(40 * n / peak))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Play simulated Maths Quiz rounds through QuizEngine")
+    parser.add_argument("--players", type=int, default=100_000, help="simulated players (one round each)")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 3], choices=[1, 2, 3])
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    jobs = min(args.jobs or os.cpu_count() or 1, max(1, math.ceil(args.players / CHUNK)))
+    hist, seconds = simulate(args.players, args.levels, jobs, args.seed)
+    try:
+        if args.json:
+            total = [sum(col) for col in zip(*hist.values())]
+            print(json.dumps({"games": sum(total), "seconds": round(seconds, 3),
+                              "games_per_sec": round(sum(total) / seconds), "all": summary(total),
+                              "levels": {str(k): summary(v) for k, v in hist.items()}, "histogram": total}))
+        else:
+            report(hist, seconds, jobs)
+    except BrokenPipeError: # Output piped into head & co.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
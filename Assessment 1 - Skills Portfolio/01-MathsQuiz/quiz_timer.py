@@ -0,0 +1,87 @@
+"""
+QUIZ TIMER
+-------------------
+Drift-free question countdown and answer timing for the Maths Quiz.
+
+HOW IT WORKS:
+- start(seconds) fixes a deadline on the monotonic time.perf_counter clock.
+  Every tick recomputes the remaining time from that deadline instead of
+  subtracting one per after(1000), so a busy main thread can delay a redraw
+  but never stretches the countdown.
+- Ticks run every tick_ms. They are also lined up with the next whole-second
+  change, so the displayed number changes on time even with a long tick.
+- stop() freezes the elapsed time. elapsed_ms() is the answer's response time
+  at perf_counter resolution (well under a microsecond), and every stopped
+  question adds it to `responses`.
+- Each tick's lateness (how long after its due time it ran) is recorded in
+  `late_ms`, to show how busy the main thread was.
+"""
+
+from collections import deque
+import math
+import time
+
+TICK_MS = 250        # Redraw interval (the display also updates on each whole second)
+KEEP = 1000          # Response times / tick lateness samples kept
+
+
+class Countdown:
+    """A deadline countdown driven by widget.after(); on_tick(remaining s), then on_expire()."""
+    def __init__(self, widget, on_tick, on_expire, tick_ms=TICK_MS, clock=time.perf_counter):
+        self.widget = widget
+        self.on_tick = on_tick
+        self.on_expire = on_expire
+        self.tick_ms = tick_ms
+        self.clock = clock
+        self.started = self.deadline = self.stopped = 0.0
+        self.job = None
+        self.due = 0.0
+        self.responses = deque(maxlen=KEEP)   # Response time (ms) of each stopped question
+        self.late_ms = deque(maxlen=KEEP)     # How late each tick ran (ms)
+
+    def start(self, seconds):
+        self.cancel()
+        self.started = self.clock()
+        self.deadline = self.started + seconds
+        self.stopped = None
+        self._tick()
+
+    def stop(self):
+        """Stops the countdown (answer given) and returns the response time in ms."""
+        if self.stopped is None:
+            self.stopped = self.clock()
+            self.cancel()
+            self.responses.append(self.elapsed_ms())
+        return self.elapsed_ms()
+
+    def cancel(self):
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+    @property
+    def running(self):
+        return self.stopped is None and self.job is not None
+
+    def remaining(self):
+        """Seconds left before the deadline (never negative)."""
+        return max(0.0, self.deadline - (self.stopped if self.stopped is not None else self.clock()))
+
+    def elapsed_ms(self):
+        return ((self.stopped if self.stopped is not None else self.clock()) - self.started) * 1000
+
+    def _tick(self):
+        now = self.clock()
+        if self.job is not None: self.late_ms.append(max(0.0, (now - self.due) * 1000))
+        self.job = None
+        left = self.deadline - now
+        if left <= 0:
+            self.stopped = self.deadline # Timed out: the response time is the whole allowance
+            self.responses.append(self.elapsed_ms())
+            self.on_expire()
+            return
+        self.on_tick(left)
+        to_next_second = left - (math.ceil(left) - 1) # Until the displayed whole second changes
+        delay = min(self.tick_ms / 1000, to_next_second)
+        self.due = now + delay
+        self.job = self.widget.after(max(1, math.ceil(delay * 1000)), self._tick)
@@ -5,6 +5,21 @@ FEATURES:
 - Unified Dashboard with View, Search, Sort, Add, Update, & Delete.
 - REAL-TIME ANALYTICS: Visual Bar Chart for Grade Distribution.
 - Custom UI: Rounded buttons, Stat Cards, and Modern Table.
+- Resizing is coalesced to one layout per frame; the chart moves its bars instead of redrawing.
+- DATA LAYER: Columnar StudentStore (student_store.py) keeps large cohorts compact.
+- Virtualized table: only the visible rows exist as Treeview items.
+- Search index (student_search.py): n-gram lookups that narrow as you type.
+- Debounced search runs on a worker thread; stale queries are dropped.
+- Write-ahead journal: each change is one appended line, compacted in the background.
+- Streaming loader: the dashboard fills in while the file loads; bad lines are reported.
+- Binary snapshot (studentMarks.bin): memory-mapped fast start, rebuilt when the text file changes.
+- Bulk grading engine (student_grading.py): vectorized with NumPy when installed.
+- Running aggregates (student_aggregates.py): stat cards and extremes update per change.
+- Maintained indexes (student_indexes.py): hashed ID lookups, sorted views without re-sorting.
+- Optional SQLite backend (student_sqlite.py): indexed, paged queries for cohorts bigger than RAM.
+- Staged startup: the window paints first; images/sound (Pillow, pygame) load on a thread, cached on disk.
+- Bulk CSV/JSONL import & export (student_bulk.py), also headless: `python 03-StudentManager.py import FILE`.
+- Headless batch mode (student_cli.py): load/grade/sort/filter/top/bottom/stats over many files in parallel.
 
 REFERENCES:
 1. Logic: Core GUI & File handling adapted from Module Lecture Notes.
@@ -12,12 +27,29 @@ REFERENCES:
    Graph visualization (No matplotlib required).
 """
 
+import sys
+import time                                # Load step budgeting + startup timing
+STARTUP_T0 = time.perf_counter()           # Startup milestones are measured from here
+if __name__ == "__main__" and len(sys.argv) > 1:
+    # Headless mode (student_cli.py): runs before the Tk imports below (Pillow/pygame load lazily)
+    from student_cli import main
+    sys.exit(main())
+
 import tkinter as tk                       # Standard GUI library
 from tkinter import ttk, messagebox        # Advanced widgets and dialogs
-from PIL import Image, ImageTk, ImageEnhance   # Image processing (Pillow)
-import pygame                              # Sound effects
 import os                                  # File path management
+import threading                           # Background search worker
+import queue                               # Hands worker results back to Tk
+import logging                             # Non-fatal problems (skipped assets / snapshot)
 from datetime import datetime              # For timestamps
+from student_store import StudentStore     # Columnar record storage
+from student_search import SearchIndex     # Incremental search index
+from student_journal import MarksJournal   # Append-only change journal
+from student_aggregates import Aggregates  # Running totals + top/bottom heaps
+from student_chart import GradeChart, FRAME_MS   # Grade distribution bar chart
+from student_loader import iter_records, validate_record, RejectReport   # Streaming, validating loader
+import student_snapshot                    # Memory-mapped binary snapshot
+from student_sqlite import SqliteStore, db_path, text_stamp   # Optional database backend
 
 # --- CONSTANTS & THEME CONFIGURATION ---
 OXFORD_BLUE = "#002147"
@@ -35,6 +67,22 @@ BTN_NORMAL = "#1f2937"
 BTN_HOVER = "#374151"
 BTN_TEXT_ACTIVE = "#fbbf24" 
 
+# Search Box
+SEARCH_DEBOUNCE_MS = 150   # Quiet time after the last keystroke before searching
+SEARCH_POLL_MS = 15        # How often the Tk thread checks for worker results
+
+# Streaming Load
+LOAD_BATCH = 10000         # Records per hand-over from the reader thread
+LOAD_QUEUE_BATCHES = 4     # Reader waits when this many batches are queued (bounds memory)
+LOAD_STEP_MS = 30          # Tk time spent appending per step, so the UI stays responsive
+LOAD_REFRESH_MS = 250      # Dashboard redraw interval while a load is running
+
+# Startup
+ASSET_POLL_MS = 30         # How often the Tk thread checks for decoded images/sound
+STARTUP_TRACE = False      # Print startup milestones (ms since launch) to the console
+
+log = logging.getLogger("student_manager")
+
 # --- SMART FILE PATHS ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 FILE_NAME = os.path.join(BASE_DIR, "studentMarks.txt")
@@ -43,77 +91,12 @@ ICON_PATH = os.path.join(BASE_DIR, "uni-icon.png")
 BG_PATH   = os.path.join(BASE_DIR, "oxford-bg.jpg")
 SOUND_PATH = os.path.join(BASE_DIR, "tab.mp3") 
 
-# --- CUSTOM WIDGET CLASSES ---
-
-class GradeChart(tk.Canvas):
-    """
-    A custom widget that draws a Bar Chart of student grades using standard Tkinter.
-    Demonstrates advanced coordinate handling and data visualization.
-    """
-    def __init__(self, parent, data, width=800, height=150, bg="white"):
-        super().__init__(parent, width=width, height=height, bg=bg, highlightthickness=0)
-        self.data = data
-        self.draw_chart()
-
-    def update_data(self, new_data):
-        self.data = new_data
-        self.draw_chart()
-
-    def draw_chart(self):
-        self.delete("all") # Clear previous drawing
-        
-        # Dimensions
-        chart_w = int(self['width'])
-        chart_h = int(self['height'])
-        
-        # Title
-        self.create_text(chart_w/2, 15, text="Class Performance Distribution", 
-                         font=("Segoe UI", 10, "bold"), fill="#6b7280")
-
-        if not self.data: 
-            self.create_text(chart_w/2, chart_h/2, text="No Data Available", font=("Segoe UI", 10), fill="#9ca3af")
-            return
-
-        # 1. Count Grades
-        counts = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
-        for s in self.data:
-            if s['grade'] in counts:
-                counts[s['grade']] += 1
-        
-        # 2. Scaling
-        max_val = max(counts.values()) if counts.values() and max(counts.values()) > 0 else 1
-        
-        # 3. Layout
-        bar_width = 60
-        spacing = 40
-        total_chart_width = 5 * (bar_width + spacing)
-        start_x = (chart_w - total_chart_width) / 2 + 20 # Center align
-        base_y = chart_h - 30
-        
-        # 4. Draw Bars
-        colors = {'A': '#22c55e', 'B': '#3b82f6', 'C': '#eab308', 'D': '#f97316', 'F': '#ef4444'}
-        
-        for i, (grade, count) in enumerate(counts.items()):
-            x = start_x + i * (bar_width + spacing)
-            
-            # Calculate dynamic height
-            bar_height = (count / max_val) * (chart_h - 60)
-            
-            if count > 0:
-                # Draw Bar
-                self.create_rectangle(x, base_y, x + bar_width, base_y - bar_height, 
-                                      fill=colors[grade], outline="")
-                # Draw Value
-                self.create_text(x + bar_width/2, base_y - bar_height - 10, 
-                                 text=str(count), font=("Segoe UI", 9, "bold"), fill="#374151")
-            else:
-                # Draw flat line and "0" for empty grades
-                self.create_line(x, base_y, x + bar_width, base_y, fill="#e5e7eb", width=2)
-                self.create_text(x + bar_width/2, base_y - 10, text="0", font=("Segoe UI", 9), fill="#9ca3af")
+# --- PERSISTENCE ---
+BACKEND = "memory"    # "memory" = StudentStore, "sqlite" = studentMarks.db (cohorts bigger than RAM)
+JOURNAL_MODE = True   # Append changes to studentMarks.txt.journal instead of rewriting the file
+SNAPSHOT_MODE = True  # Start from studentMarks.bin when it matches studentMarks.txt
 
-            # Draw Label (Grade)
-            self.create_text(x + bar_width/2, base_y + 15, text=grade, 
-                             font=("Segoe UI", 10, "bold"), fill="#374151")
+# --- CUSTOM WIDGET CLASSES ---
 
 class RoundedButton(tk.Canvas):
     def __init__(self, parent, text, command, width=220, height=45, corner_radius=20, color=BTN_NORMAL, sound_fx=None):
@@ -169,6 +152,267 @@ class StatCard(tk.Frame):
     def update_value(self, new_value):
         self.value_label.config(text=new_value)
 
+class VirtualTable(tk.Frame):
+    """
+    A virtualized student table.
+    Only the rows inside the scroll viewport exist as Treeview items; scrolling
+    re-fills that fixed pool of items with new values instead of inserting or
+    deleting anything, so a redraw costs the same for 10 or 500,000 students.
+    """
+    def __init__(self, parent, columns, row_height=35, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.row_height = row_height
+        self.store = None
+        self.rows = range(0)     # Row indices into the store, in display order
+        self.offset = 0          # First visible position in self.rows
+        self.slots = []          # Recycled Treeview item ids, top to bottom
+        self.selected_row = None # Store row index of the selection (survives scrolling)
+
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", selectmode="browse")
+        self.sb = ttk.Scrollbar(self, orient="vertical", command=self.on_scrollbar)
+        self.sb.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.tree.bind("<Configure>", lambda e: self.render())
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1))
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-1))  # Linux wheel up
+        self.tree.bind("<Button-5>", lambda e: self.scroll(1))   # Linux wheel down
+        self.tree.bind("<Up>", lambda e: self.step_selection(-1))
+        self.tree.bind("<Down>", lambda e: self.step_selection(1))
+
+    # --- DATA SOURCE ---
+    def set_rows(self, store, rows):
+        """Points the table at a new row sequence (any len()/index-able of row indices)."""
+        self.store = store
+        self.rows = rows
+        self.offset = 0
+        if self.selected_row is not None and not store.has_row(self.selected_row):
+            self.selected_row = None
+        self.render()
+
+    def selection_row(self):
+        """Store row index of the selected student, or None."""
+        return self.selected_row
+
+    # --- VIEWPORT ---
+    def page_size(self):
+        """Rows fully visible below the heading."""
+        return max(1, self.tree.winfo_height() // self.row_height - 1)
+
+    def render(self):
+        if self.store is None: return
+        n = len(self.rows)
+        page = self.page_size()
+        self.offset = max(0, min(self.offset, n - page))
+
+        # Grow the item pool to cover the viewport (one extra for the partial row)
+        while len(self.slots) < page + 1:
+            self.slots.append(self.tree.insert("", "end", values=()))
+
+        store, rows, selected = self.store, self.rows, None
+        for k, iid in enumerate(self.slots):
+            pos = self.offset + k
+            if pos < n:
+                i = rows[pos]
+                gd = store.grade_of(i)
+                tag = 'A' if gd == 'A' else ('F' if gd == 'F' else '')
+                self.tree.item(iid, values=store.table_values(i), tags=(tag,))
+                self.tree.move(iid, "", k)
+                if i == self.selected_row: selected = iid
+            else:
+                self.tree.detach(iid)
+
+        if selected: self.tree.selection_set(selected)
+        else: self.tree.selection_remove(self.tree.selection())
+
+        if n: self.sb.set(self.offset / n, min(1.0, (self.offset + page) / n))
+        else: self.sb.set(0, 1)
+
+    def scroll(self, delta):
+        self.offset += delta
+        self.render()
+        return "break"
+
+    def on_scrollbar(self, action, value, unit=None):
+        n, page = len(self.rows), self.page_size()
+        if action == "moveto":
+            self.offset = int(float(value) * n)
+        elif unit == "pages":
+            self.offset += int(value) * page
+        else:
+            self.offset += int(value)
+        self.render()
+
+    # --- SELECTION ---
+    def on_select(self, event):
+        sel = self.tree.selection()
+        if sel and sel[0] in self.slots:
+            pos = self.offset + self.slots.index(sel[0])
+            if pos < len(self.rows): self.selected_row = self.rows[pos]
+
+    def step_selection(self, delta):
+        """Arrow keys move the selection and scroll the viewport when it hits an edge."""
+        if not self.rows: return "break"
+        sel = self.tree.selection()
+        k = self.slots.index(sel[0]) + delta if sel else 0
+        pos = max(0, min(self.offset + k, len(self.rows) - 1))
+        self.selected_row = self.rows[pos]
+        if pos < self.offset: self.offset = pos
+        elif pos >= self.offset + self.page_size(): self.offset = pos - self.page_size() + 1
+        self.render()
+        return "break"
+
+class SearchPipeline:
+    """
+    Debounced, cancellable search for the dashboard search box.
+    Each keystroke restarts a short debounce timer. When the timer fires the query
+    and its summary run on a worker thread. A newer keystroke bumps the generation
+    counter, so an in-flight query gives up at its next checkpoint. Only the newest
+    result is handed back to the Tk thread, which polls for it with after().
+    """
+    def __init__(self, app, index, delay_ms=SEARCH_DEBOUNCE_MS):
+        self.app = app
+        self.index = index
+        self.delay_ms = delay_ms
+        self.generation = 0
+        self.pending = None         # after() id of the debounce timer
+        self.workers = []
+        self.results = queue.Queue()
+
+    def submit(self, query):
+        self.cancel()
+        gen = self.generation
+        self.pending = self.app.after(self.delay_ms, lambda: self.start(gen, query))
+
+    def cancel(self):
+        """Drops the debounce timer and marks any running query as stale."""
+        self.generation += 1
+        if self.pending:
+            self.app.after_cancel(self.pending)
+            self.pending = None
+
+    def start(self, gen, query):
+        self.pending = None
+        worker = threading.Thread(target=self.work, args=(gen, query), daemon=True)
+        worker.start()
+        self.workers.append(worker)
+        if len(self.workers) == 1: self.app.after(SEARCH_POLL_MS, self.poll)
+
+    def work(self, gen, query):
+        """Worker thread: search + summary, abandoned as soon as a newer query exists."""
+        stale = lambda: gen != self.generation
+        try:
+            if stale(): return
+            rows = self.index.search(query)
+            summary = self.app.store.summary(rows, cancelled=stale)
+        except (IndexError, KeyError):
+            return # Store was edited mid-query; the refresh that followed wins
+        if summary is not None and not stale():
+            self.results.put((gen, rows, summary))
+
+    def poll(self):
+        """Tk thread: apply the newest finished result, keep polling while workers run."""
+        latest = None
+        while not self.results.empty():
+            latest = self.results.get_nowait()
+        if latest and latest[0] == self.generation:
+            self.app.show_rows(latest[1], latest[2])
+        self.workers = [w for w in self.workers if w.is_alive()]
+        if self.workers or not self.results.empty():
+            self.app.after(SEARCH_POLL_MS, self.poll)
+
+class StreamingLoad:
+    """
+    Loads a marks file without freezing the window.
+    A reader thread streams validated records (bad lines go to a RejectReport)
+    into a small bounded queue. The Tk thread appends them a few milliseconds at
+    a time and redraws the dashboard as the cohort fills in.
+    """
+    def __init__(self, app, path, on_done):
+        self.app = app
+        self.on_done = on_done
+        self.report = RejectReport(path + ".rejects.txt")
+        self.batches = queue.Queue(maxsize=LOAD_QUEUE_BATCHES)
+        self.last_refresh = 0
+        threading.Thread(target=self.read, args=(path,), daemon=True).start()
+        app.after(SEARCH_POLL_MS, self.poll)
+
+    def read(self, path):
+        """Reader thread."""
+        batch = []
+        try:
+            for rec in iter_records(path, self.report):
+                batch.append(rec)
+                if len(batch) >= LOAD_BATCH:
+                    self.batches.put(batch)
+                    batch = []
+        except (OSError, UnicodeDecodeError) as e:
+            self.report.add(0, path, str(e))
+        self.batches.put(batch)
+        self.batches.put(None) # End of file
+
+    def poll(self):
+        """Tk thread: append for up to LOAD_STEP_MS, then yield back to the event loop."""
+        store, done, idle = self.app.store, False, False
+        deadline = time.perf_counter() + LOAD_STEP_MS / 1000
+        with store.batch():
+            while time.perf_counter() < deadline:
+                try: batch = self.batches.get_nowait()
+                except queue.Empty:
+                    idle = True # Reader is behind; check back a little later
+                    break
+                if batch is None:
+                    done = True
+                    break
+                store.extend(batch)
+
+        if done:
+            self.report.close()
+            self.on_done(self.report)
+            return
+        now = time.perf_counter()
+        if now - self.last_refresh > LOAD_REFRESH_MS / 1000:
+            self.last_refresh = now
+            self.app.refresh_table()
+        self.app.after(SEARCH_POLL_MS if idle else 1, self.poll)
+
+class AssetLoader:
+    """
+    Decodes the background, logo, icon and click sound on a worker thread.
+    Pillow and pygame are first imported there (student_assets.py), and each
+    asset is handed to the Tk thread as soon as it is ready.
+    """
+    def __init__(self, app, on_asset):
+        self.app = app
+        self.on_asset = on_asset
+        self.ready = queue.Queue()
+        threading.Thread(target=self.work, daemon=True).start()
+        app.after(ASSET_POLL_MS, self.poll)
+
+    def work(self):
+        """Worker thread."""
+        import student_assets # Pillow + pygame load here, off the Tk thread
+        jobs = [("bg", lambda: student_assets.background(BG_PATH)),
+                ("logo", lambda: student_assets.logo(LOGO_PATH)),
+                ("icon", lambda: student_assets.icon(ICON_PATH)),
+                ("sound", lambda: student_assets.click_sound(SOUND_PATH))]
+        for name, load in jobs:
+            try: self.ready.put((name, load()))
+            except (OSError, ValueError) as e: log.warning("Asset %s skipped: %s", name, e)
+        self.ready.put(None)
+
+    def poll(self):
+        """Tk thread: swap in whatever has been decoded since the last check."""
+        while True:
+            try: item = self.ready.get_nowait()
+            except queue.Empty: break
+            if item is None:
+                self.app.mark("assets ready")
+                return
+            self.on_asset(*item)
+        self.app.after(ASSET_POLL_MS, self.poll)
+
 # --- MAIN CONTROLLER ---
 
 class StudentManagerFinal(tk.Tk):
@@ -177,23 +421,26 @@ class StudentManagerFinal(tk.Tk):
         self.title("University of Oxford | Student Record System")
         self.geometry("1280x750")
         self.minsize(1100, 650)
-        
-        # --- AUDIO ENGINE ---
-        try:
-            pygame.mixer.init()
-            self.click_sound = pygame.mixer.Sound(SOUND_PATH)
-            self.click_sound.set_volume(0.3)
-        except Exception as e:
-            self.click_sound = None
+        self.startup = {}   # Milestone -> ms since launch
 
         # --- DATA & ASSETS ---
-        self.students = []
+        if BACKEND == "sqlite":
+            self.store = SqliteStore(db_path(FILE_NAME))
+            self.search_index = self.stats = self.store # Searches and totals run as SQL queries
+            self.journal = None                         # Every change is committed to the database
+        else:
+            self.store = StudentStore()
+            self.search_index = SearchIndex(self.store)
+            self.stats = Aggregates(self.store)
+            self.journal = MarksJournal(FILE_NAME) if JOURNAL_MODE else None
+        self.search_pipeline = SearchPipeline(self, self.search_index)
+        self.click_sound = None # Images and sound arrive from the AssetLoader
         self.logo_img = None
         self.app_icon = None 
         self.bg_photo = None 
+        self.buttons = []
         
-        self.load_data()
-        self.load_assets()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # --- UI BUILD ---
         self.setup_header()
@@ -205,29 +452,39 @@ class StudentManagerFinal(tk.Tk):
         self.setup_dashboard(container)
         
         self.refresh_table()
-
-    def load_assets(self):
-        try:
-            pil_img = Image.open(LOGO_PATH)
-            w, h = pil_img.size
-            aspect = w / h
-            new_w = int(70 * aspect)
-            pil_img = pil_img.resize((new_w, 70), Image.Resampling.LANCZOS)
-            self.logo_img = ImageTk.PhotoImage(pil_img)
-        except: self.logo_img = None
-
+        self.mark("window built")
+        self.paint_bind = self.main_canvas.bind("<Expose>", self.on_first_paint, add="+")
+        AssetLoader(self, self.on_asset)
+        self.load_data() # Streams in behind the visible window
+
+    # --- STAGED STARTUP ---
+    def mark(self, event):
+        """Records a startup milestone (ms since launch); printed when STARTUP_TRACE is on."""
+        self.startup[event] = round((time.perf_counter() - STARTUP_T0) * 1000, 1)
+        if STARTUP_TRACE: print(f"startup: {event} at {self.startup[event]} ms")
+
+    def on_first_paint(self, event):
+        self.main_canvas.unbind("<Expose>", self.paint_bind)
+        self.mark("first paint")
+
+    def on_asset(self, name, value):
+        """Swaps a decoded asset into the running window."""
+        from PIL import ImageTk # Already imported by the asset thread
         try:
-            self.app_icon = ImageTk.PhotoImage(file=ICON_PATH)
-            self.iconphoto(False, self.app_icon)
-        except: pass
-
-        try:
-            bg_img = Image.open(BG_PATH)
-            bg_img = bg_img.resize((1600, 1000), Image.Resampling.LANCZOS)
-            enhancer = ImageEnhance.Brightness(bg_img)
-            bg_img = enhancer.enhance(0.3) 
-            self.bg_photo = ImageTk.PhotoImage(bg_img)
-        except: self.bg_photo = None
+            if name == "bg":
+                self.bg_photo = ImageTk.PhotoImage(value)
+                self.main_canvas.itemconfigure(self.bg_item, image=self.bg_photo)
+            elif name == "logo":
+                self.logo_img = ImageTk.PhotoImage(value)
+                self.logo_label.configure(image=self.logo_img)
+                self.logo_label.pack(side="left", padx=(0, 15), before=self.title_box)
+            elif name == "icon":
+                self.app_icon = ImageTk.PhotoImage(value)
+                self.iconphoto(False, self.app_icon)
+            elif name == "sound":
+                self.click_sound = value
+                for btn in self.buttons: btn.sound_fx = value
+        except tk.TclError: pass # Window closed while assets were loading
 
     def play_click(self):
         if self.click_sound:
@@ -242,10 +499,9 @@ class StudentManagerFinal(tk.Tk):
         left_box = tk.Frame(header, bg=OXFORD_BLUE)
         left_box.pack(side="left", padx=30)
 
-        if self.logo_img:
-            tk.Label(left_box, image=self.logo_img, bg=OXFORD_BLUE).pack(side="left", padx=(0, 15))
+        self.logo_label = tk.Label(left_box, bg=OXFORD_BLUE) # Packed once the logo is decoded
 
-        title_box = tk.Frame(left_box, bg=OXFORD_BLUE)
+        title_box = self.title_box = tk.Frame(left_box, bg=OXFORD_BLUE)
         title_box.pack(side="left")
         tk.Label(title_box, text="UNIVERSITY OF", font=("Times New Roman", 10), fg="#9ca3af", bg=OXFORD_BLUE).pack(anchor="w")
         tk.Label(title_box, text="OXFORD", font=("Times New Roman", 22, "bold"), fg=TEXT_WHITE, bg=OXFORD_BLUE).pack(anchor="w")
@@ -258,7 +514,7 @@ class StudentManagerFinal(tk.Tk):
             # Ask confirmation
             confirm = messagebox.askyesno("Logout", "Are you sure you want to logout?")
             if confirm:
-                self.destroy()
+                self.on_close()
             else:
                 self.play_click() # Plays sound if "No" (Return to app)
 
@@ -298,14 +554,15 @@ class StudentManagerFinal(tk.Tk):
         ]
         
         for txt, cmd in btns:
-            RoundedButton(sidebar, text=txt, command=cmd, sound_fx=self.click_sound).pack(pady=10)
+            btn = RoundedButton(sidebar, text=txt, command=cmd, sound_fx=self.click_sound)
+            btn.pack(pady=10)
+            self.buttons.append(btn)
 
     def setup_dashboard(self, parent):
         self.main_canvas = tk.Canvas(parent, bg="#f3f4f6", highlightthickness=0)
         self.main_canvas.pack(side="right", fill="both", expand=True)
 
-        if self.bg_photo:
-            self.main_canvas.create_image(0, 0, image=self.bg_photo, anchor="nw")
+        self.bg_item = self.main_canvas.create_image(0, 0, anchor="nw") # Image set by on_asset()
 
         # --- SEARCH BAR ---
         search_card = tk.Frame(self.main_canvas, bg="white", bd=1, relief="solid", padx=10, pady=5)
@@ -331,12 +588,13 @@ class StudentManagerFinal(tk.Tk):
 
         # --- ROW 2: GRAPH WIDGET (Below Cards) ---
         self.chart_card = tk.Frame(self.main_canvas, bg="white", bd=2, relief="groove")
-        self.chart_widget = GradeChart(self.chart_card, self.students, width=880, height=150)
+        self.chart_widget = GradeChart(self.chart_card, self.store, width=880, height=150)
         self.chart_widget.pack(fill="both", expand=True)
-        self.main_canvas.create_window(30, 220, window=self.chart_card, anchor="nw", width=880, height=160)
+        self.chart_window = self.main_canvas.create_window(30, 220, window=self.chart_card, anchor="nw", width=880, height=160)
 
         # --- ROW 3: DATA TABLE ---
         self.table_card = tk.Frame(self.main_canvas, bg="white", bd=2, relief="groove")
+        self.resize_to, self.resize_job = None, None
         self.main_canvas.bind("<Configure>", self.on_resize)
         self.table_window = self.main_canvas.create_window(30, 400, window=self.table_card, anchor="nw", width=940, height=300)
 
@@ -347,7 +605,9 @@ class StudentManagerFinal(tk.Tk):
         style.layout("Treeview", [('Treeview.treearea', {'sticky': 'nswe'})]) 
 
         cols = ("ID", "Name", "CW", "Exam", "Total", "Grade")
-        self.tree = ttk.Treeview(self.table_card, columns=cols, show="headings", selectmode="browse")
+        self.table = VirtualTable(self.table_card, cols, row_height=35, bg="white")
+        self.table.pack(fill="both", expand=True)
+        self.tree = self.table.tree
         
         headers = ["Student ID", "Full Name", "Coursework /60", "Exam /100", "Total %", "Grade"]
         widths = [100, 250, 100, 100, 100, 80]
@@ -356,121 +616,149 @@ class StudentManagerFinal(tk.Tk):
             self.tree.column(c, width=w, anchor="center")
         self.tree.column("Name", anchor="w", width=250)
 
-        sb = ttk.Scrollbar(self.table_card, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=sb.set)
-        sb.pack(side="right", fill="y")
-        self.tree.pack(side="left", fill="both", expand=True)
-
         self.tree.tag_configure('A', foreground="#16a34a", font=("Segoe UI", 10, "bold"))
         self.tree.tag_configure('F', foreground="#dc2626", font=("Segoe UI", 10, "bold"))
 
     def on_resize(self, event):
-        new_width = event.width - 60  
-        new_height = event.height - 420 # Adjusted for Graph + Cards
+        """Keeps only the latest size; the layout is applied at most once per frame."""
+        self.resize_to = (event.width, event.height)
+        if self.resize_job is None:
+            self.resize_job = self.after(FRAME_MS, self.apply_resize)
+
+    def apply_resize(self):
+        self.resize_job = None
+        new_width = self.resize_to[0] - 60  
+        new_height = self.resize_to[1] - 420 # Adjusted for Graph + Cards
         if new_width > 500 and new_height > 150:
             self.main_canvas.itemconfigure(self.table_window, width=new_width, height=new_height)
             # Resize graph width dynamically
-            self.main_canvas.itemconfigure(self.chart_card, width=new_width)
-            self.chart_widget.configure(width=new_width)
-            self.chart_widget.draw_chart()
+            self.main_canvas.itemconfigure(self.chart_window, width=new_width)
+            self.chart_widget.resize(new_width) # Moves the existing bars next frame, nothing is recreated
 
     def load_data(self):
-        self.students = []
         if not os.path.exists(FILE_NAME):
             with open(FILE_NAME, "w") as f: f.write("0\n")
+        if BACKEND == "sqlite" and self.store.source_stamp() == text_stamp(FILE_NAME):
+            self.refresh_table() # Database already holds this version of the text file
             return
+        self.store.clear()
+        if SNAPSHOT_MODE and BACKEND == "memory":
+            try:
+                if student_snapshot.load_fresh(self.store, FILE_NAME):
+                    self.on_loaded(RejectReport())
+                    return
+            except (OSError, ValueError) as e: log.warning("Snapshot skipped, loading the text file: %s", e)
+        StreamingLoad(self, FILE_NAME, self.on_loaded)
+
+    def rebuild_snapshot(self):
+        """Re-encodes studentMarks.txt as studentMarks.bin in the background; a failure is shown on the Tk thread."""
+        done = queue.Queue()
+        def work():
+            try: student_snapshot.import_text(FILE_NAME)
+            except (OSError, ValueError) as e: done.put(e)
+            else: done.put(None)
+        def poll():
+            try: error = done.get_nowait()
+            except queue.Empty:
+                self.after(ASSET_POLL_MS, poll)
+                return
+            if error: messagebox.showwarning("Snapshot", f"Fast-start snapshot not saved:\n{error}")
+        threading.Thread(target=work, daemon=True).start()
+        self.after(ASSET_POLL_MS, poll)
+
+    def on_loaded(self, report):
+        if BACKEND == "sqlite":
+            self.store.finish_import(text_stamp(FILE_NAME)) # Indexes are built once the rows are in
+        elif SNAPSHOT_MODE and not student_snapshot.is_fresh(FILE_NAME):
+            self.rebuild_snapshot() # Text file is newer: next start can skip parsing
         try:
-            with open(FILE_NAME, "r") as f:
-                lines = f.readlines()
-                for line in lines[1:]:
-                    p = line.strip().split(',')
-                    if len(p) >= 6:
-                        cw_t = int(p[2])+int(p[3])+int(p[4])
-                        ovr = cw_t + int(p[5])
-                        perc = (ovr/160)*100
-                        gd = self.get_grade(perc)
-                        self.students.append({"id":p[0], "name":p[1], "cw":[int(p[2]),int(p[3]),int(p[4])], "exam":int(p[5]), "cw_total":cw_t, "total":ovr, "perc":round(perc,1), "grade":gd})
-        except: pass
-
-    def get_grade(self, p):
-        if p>=70: return 'A'
-        elif p>=60: return 'B'
-        elif p>=50: return 'C'
-        elif p>=40: return 'D'
-        else: return 'F'
-
-    def save_data(self):
+            if self.journal:
+                self.journal.replay(self.store) # Snapshot + changes since
+                self.journal.start()
+        except Exception as e: messagebox.showerror("Error", str(e))
+        self.refresh_table()
+        self.mark("data loaded")
+        if report.count:
+            messagebox.showwarning("Data Check", report.summary())
+
+    def save_data(self, row=None, deleted=None):
+        """
+        Persists one change. Journal mode appends a single record (row = store row
+        that was added/edited, deleted = ID that was removed); otherwise the whole
+        file is rewritten.
+        """
         try:
-            with open(FILE_NAME, "w") as f:
-                f.write(f"{len(self.students)}\n")
-                for s in self.students:
-                    f.write(f"{s['id']},{s['name']},{s['cw'][0]},{s['cw'][1]},{s['cw'][2]},{s['exam']}\n")
+            if BACKEND == "sqlite":
+                pass # Already committed by the store
+            elif self.journal and row is not None:
+                s = self.store.row(row)
+                self.journal.put(s['id'], s['name'], s['cw'], s['exam'])
+            elif self.journal and deleted is not None:
+                self.journal.delete(deleted)
+            else:
+                self.store.save_file(FILE_NAME)
             self.refresh_table()
             messagebox.showinfo("Saved", "Record updated successfully.")
         except Exception as e: messagebox.showerror("Error", str(e))
 
-    def refresh_table(self, data=None):
-        if data is None: data = self.students
-        for r in self.tree.get_children(): self.tree.delete(r)
-        
-        total_sum = 0
-        top_student = "-"
-        max_score = -1
-
-        for s in data:
-            total_sum += s['perc']
-            if s['perc'] > max_score:
-                max_score = s['perc']
-                top_student = s['name'].split()[0]
-
-            tag = 'A' if s['grade'] == 'A' else ('F' if s['grade'] == 'F' else '')
-            self.tree.insert("", "end", values=(s['id'], s['name'], f"{s['cw_total']}", f"{s['exam']}", f"{s['perc']}%", s['grade']), tags=(tag,))
-
-        count = len(data)
-        avg = round(total_sum / count, 1) if count > 0 else 0
+    def on_close(self):
+        if self.journal: self.journal.close() # Flush the last unsynced batch
+        if BACKEND == "sqlite": self.store.close()
+        self.destroy()
+
+    def refresh_table(self, rows=None):
+        """Redraws the table, stat cards and chart. rows = store row indices (None = all)."""
+        self.search_pipeline.cancel() # Anything still being searched is now out of date
+        if rows is None:
+            self.show_rows(self.store.rows(), self.stats.summary()) # Maintained totals / one SQL query
+        else:
+            self.show_rows(rows, self.store.summary(rows))
+
+    def show_rows(self, rows, summary):
+        """Applies a row subset and its precomputed store.summary() to the dashboard."""
+        store = self.store
+        count, avg, top, counts = summary
+        self.table.set_rows(store, rows) # Viewport-sized redraw
         
         self.card_total.update_value(str(count))
         self.card_avg.update_value(f"{avg}%")
-        self.card_top.update_value(top_student if count > 0 else "-")
+        self.card_top.update_value(store.row(top)['name'].split()[0] if count > 0 else "-")
         
         # --- UPDATE GRAPH ---
         if hasattr(self, 'chart_widget'):
-            self.chart_widget.update_data(data)
+            self.chart_widget.update_data(rows, counts)
 
     def filter_data(self, *args):
-        q = self.search_var.get().lower()
-        self.refresh_table([s for s in self.students if q in s['name'].lower() or q in str(s['id'])])
+        self.search_pipeline.submit(self.search_var.get())
 
     def sort_data(self, key):
-        if key == 'score': self.students.sort(key=lambda x: x['total'], reverse=True)
-        else: self.students.sort(key=lambda x: x['name'])
+        self.store.sort_by(key)
         self.refresh_table()
 
     def show_highest(self):
-        if self.students:
-            top = max(self.students, key=lambda x: x['perc'])
+        if len(self.store):
+            top = self.store.row(self.stats.highest())
             messagebox.showinfo("Top", f"Top Student: {top['name']} ({top['perc']}%)")
             
     def show_lowest(self):
-        if self.students:
-            low = min(self.students, key=lambda x: x['perc'])
+        if len(self.store):
+            low = self.store.row(self.stats.lowest())
             messagebox.showinfo("Low", f"Lowest Student: {low['name']} ({low['perc']}%)")
             
     def delete_record(self):
-        sel = self.tree.selection()
-        if sel and messagebox.askyesno("Delete", "Are you sure you want to delete this record?"):
-            sid = str(self.tree.item(sel[0])['values'][0])
-            self.students = [s for s in self.students if str(s['id']) != sid]
-            self.save_data()
+        i = self.table.selection_row()
+        if i is not None and messagebox.askyesno("Delete", "Are you sure you want to delete this record?"):
+            sid = self.store.row(i)['id']
+            self.store.remove(i)
+            self.table.selected_row = None
+            self.save_data(deleted=sid)
             
     def add_record(self): self.open_form("Add New Student")
     
     def edit_record(self):
-        sel = self.tree.selection()
-        if sel:
-            sid = str(self.tree.item(sel[0])['values'][0])
-            st = next((s for s in self.students if str(s['id']) == sid), None)
-            if st: self.open_form("Update Student", st)
+        i = self.table.selection_row()
+        if i is not None:
+            self.open_form("Update Student", self.store.row(i))
         else: messagebox.showwarning("Warning", "Select a student first")
 
     def open_form(self, title, data=None):
@@ -503,24 +791,19 @@ class StudentManagerFinal(tk.Tk):
         def save():
             self.play_click()
             try:
-                nid = entries['id'].get()
-                cw = [int(entries['c1'].get()), int(entries['c2'].get()), int(entries['c3'].get())]
-                ex = int(entries['ex'].get())
-                
-                if any(x<0 or x>20 for x in cw) or ex<0 or ex>100: raise ValueError
-                
-                cw_t = sum(cw); ovr = cw_t + ex; perc = (ovr/160)*100
-                rec = {"id":nid, "name":entries['name'].get(), "cw":cw, "exam":ex, "cw_total":cw_t, "total":ovr, "perc":round(perc,1), "grade":self.get_grade(perc)}
-                
-                if data:
-                    for i,s in enumerate(self.students): 
-                        if str(s['id'])==str(nid): self.students[i]=rec
-                else:
-                    if any(s['id']==nid for s in self.students): 
-                        messagebox.showerror("Error", "ID Exists"); return
-                    self.students.append(rec)
-                self.save_data(); win.destroy()
-            except: messagebox.showerror("Error", "Check inputs: Marks must be valid numbers within range.")
+                nid, name, cw, ex = validate_record(entries['id'].get(), entries['name'].get(), entries['c1'].get(),
+                                                    entries['c2'].get(), entries['c3'].get(), entries['ex'].get())
+            except ValueError as e:
+                messagebox.showerror("Error", f"Check inputs: {e}."); return
+
+            i = self.store.find(nid)
+            if data:
+                if i is not None: self.store.update(i, name, cw, ex)
+            else:
+                if i is not None: 
+                    messagebox.showerror("Error", "ID Exists"); return
+                i = self.store.append(nid, name, cw, ex)
+            self.save_data(row=i); win.destroy()
 
         tk.Button(win, text="SAVE", bg=OXFORD_BLUE, fg="white", font=("bold"), command=save).pack(side="bottom", pady=20)
 
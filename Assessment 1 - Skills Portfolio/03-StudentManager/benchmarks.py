@@ -0,0 +1,591 @@
+"""
+STUDENT MANAGER BENCHMARKS
+-------------------
+Synthetic-cohort benchmarks for the Student Manager data layer.
+Run:  python benchmarks.py [name ...] [--n 200000]
+
+Available benchmarks:
+- store   -> Memory + throughput: StudentStore vs the old list-of-dicts layout.
+- search  -> Per-keystroke search latency: SearchIndex vs a linear filter.
+- load    -> Peak memory while reading a marks file: readlines() vs streaming.
+- grading -> Bulk grading + dashboard stats: per-row Python vs student_grading.
+- indexes -> Edit/add/delete then show a sorted view, and ID lookups: re-sort vs indexes.
+- aggregates -> Dashboard refresh after one edit: full rescan vs running aggregates.
+- sqlite  -> SQLite backend: import, first page of each view, search, extremes.
+- resize  -> Dragging a window edge: full chart rebuild per event vs coalesced coords() (needs a display).
+- snapshot -> Cold load time: parsing studentMarks.txt vs the mmap'd binary snapshot.
+- bulk    -> CSV import/export rows/sec: one form-style add per row vs student_bulk batches.
+- batch   -> Headless `stats` over a directory of mark files: one process vs a process pool.
+- startup -> Tk-thread work before the first paint: eager asset loading vs the staged loader.
+- journal -> Per-edit save cost: full rewrite vs journal append, plus crash/restart recovery checks.
+"""
+
+import argparse
+import contextlib
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from student_store import StudentStore, derive
+import student_grading
+from student_grading import get_grade
+from student_aggregates import Aggregates
+from student_search import SearchIndex
+from student_loader import iter_records, RejectReport
+import student_snapshot
+import student_bulk
+import student_cli
+import student_journal
+from student_loader import validate_record
+from student_sqlite import SqliteStore
+
+FIRST = ["Alan", "Gareth", "Jake", "Jo", "Lee", "Matt", "Sam", "John", "Zainab", "Iman",
+         "Sara", "Omar", "Leah", "Noah", "Amir", "Ella", "Ravi", "Mia", "Yusuf", "Aisha"]
+LAST = ["Shearer", "Southgate", "Hobbs", "Hyde", "Scott", "Thompson", "Sturtivant", "Curry",
+        "Afzal", "Khan", "Smith", "Jones", "Patel", "Brown", "Ali", "Wilson", "Taylor", "Evans"]
+
+
+SYLLABLES = ["al", "an", "ar", "be", "da", "el", "fa", "ha", "im", "ja", "ka", "la", "li",
+             "ma", "mi", "na", "no", "ra", "ri", "sa", "se", "ta", "to", "ya", "za", "zo"]
+
+
+def varied_name(rnd):
+    """A made-up 'First Last' name; gives tens of thousands of distinct names."""
+    part = lambda: "".join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(2, 3))).capitalize()
+    return f"{part()} {part()}"
+
+
+def synthetic_rows(n, seed=42, varied=False):
+    """Yields n (id, name, [cw1, cw2, cw3], exam) tuples resembling studentMarks.txt rows."""
+    rnd = random.Random(seed)
+    for k in range(n):
+        name = varied_name(rnd) if varied else f"{rnd.choice(FIRST)} {rnd.choice(LAST)}"
+        yield (1000 + k, name, [rnd.randint(0, 20) for _ in range(3)], rnd.randint(0, 100))
+
+
+def timed(fn, repeat=3):
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def measure(build):
+    """(object, peak bytes) for a builder callable, via tracemalloc."""
+    tracemalloc.start()
+    obj = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, peak
+
+
+def report(title, rows):
+    print(f"\n{title}")
+    print("-" * len(title))
+    for label, *vals in rows:
+        print(f"{label:<24}" + "".join(f"{v:>16}" for v in vals))
+
+
+# --- BENCHMARK: StudentStore vs list of dicts ---
+
+def build_dicts(rows):
+    """The original StudentManagerFinal.students layout."""
+    students = []
+    for sid, name, cw, ex in rows:
+        cw_t = sum(cw); ovr = cw_t + ex; perc = (ovr/160)*100
+        students.append({"id": str(sid), "name": name, "cw": list(cw), "exam": ex, "cw_total": cw_t,
+                         "total": ovr, "perc": round(perc, 1), "grade": get_grade(perc)})
+    return students
+
+
+def build_store(rows):
+    store = StudentStore()
+    for sid, name, cw, ex in rows:
+        store.append(sid, name, cw, ex)
+    return store
+
+
+def cold_sort(store, key):
+    """Sorted view built from scratch (drops the maintained index first)."""
+    store.sorted[key].on_reset()
+    store.sort_by(key)
+    return store.rows()
+
+
+def bench_store(n):
+    rows = list(synthetic_rows(n))
+    dicts, dict_mem = measure(lambda: build_dicts(rows))
+    store, store_mem = measure(lambda: build_store(rows))
+
+    q = "ali"
+    results = [
+        ("peak memory (MB)", f"{dict_mem / 1e6:.1f}", f"{store_mem / 1e6:.1f}"),
+        ("sort by score (ms)", f"{timed(lambda: sorted(dicts, key=lambda x: x['total'], reverse=True)):.1f}",
+                               f"{timed(lambda: cold_sort(store, 'score')):.1f}"),
+        ("sort by name (ms)", f"{timed(lambda: sorted(dicts, key=lambda x: x['name'])):.1f}",
+                              f"{timed(lambda: cold_sort(store, 'name')):.1f}"),
+        ("highest (ms)", f"{timed(lambda: max(dicts, key=lambda x: x['perc'])):.1f}",
+                         f"{timed(store.argmax):.1f}"),
+        ("filter 'ali' (ms)", f"{timed(lambda: [s for s in dicts if q in s['name'].lower() or q in str(s['id'])]):.1f}",
+                              f"{timed(lambda: store.match(q)):.1f}"),
+        ("grade histogram (ms)", f"{timed(lambda: [sum(1 for s in dicts if s['grade'] == g) for g in 'ABCDF']):.1f}",
+                                 f"{timed(store.grade_counts):.1f}"),
+    ]
+    report(f"StudentStore vs list-of-dicts ({n:,} students)", [("", "list-of-dicts", "StudentStore")] + results)
+
+
+# --- BENCHMARK: bulk grading engine ---
+
+def bench_grading(n):
+    rows = list(synthetic_rows(n))
+    store = build_store(rows)
+    cols = (store.cw1, store.cw2, store.cw3, store.exam)
+
+    def per_row_stats():
+        vals = [store.perc10[i] for i in store.rows()]
+        top = max(range(len(vals)), key=vals.__getitem__)
+        return sum(vals) / len(vals), top, {g: sum(1 for i in store.rows() if store.grade_of(i) == g) for g in "ABCDF"}
+
+    engine = "NumPy" if student_grading.np is not None else "pure Python"
+    report(f"Grading {n:,} students (engine: {engine})", [
+        ("", "per row", "bulk"),
+        ("grade columns (ms)", f"{timed(lambda: [derive(cw, ex) for _, _, cw, ex in rows]):.0f}",
+                               f"{timed(lambda: student_grading.grade_columns(*cols)):.0f}"),
+        ("avg/top/histogram (ms)", f"{timed(per_row_stats):.0f}", f"{timed(store.summary):.0f}"),
+    ])
+
+
+# --- BENCHMARK: running aggregates ---
+
+def bench_aggregates(n):
+    store = build_store(list(synthetic_rows(n)))
+    aggregates = Aggregates(store)
+    aggregates.summary(), aggregates.lowest() # Build totals and heaps up front
+    rnd = random.Random(7)
+
+    def edit():
+        i = rnd.randrange(len(store))
+        store.update(i, store.names[i], [rnd.randint(0, 20) for _ in range(3)], rnd.randint(0, 100))
+
+    def rescan():
+        edit()
+        store.summary(), store.argmax(), store.argmin()
+
+    def running():
+        edit()
+        aggregates.summary(), aggregates.highest(), aggregates.lowest()
+
+    report(f"Refresh after one edit ({n:,} students)", [
+        ("", "rescan", "aggregates"),
+        ("cards+chart+extremes (ms)", f"{timed(rescan, repeat=20):.2f}", f"{timed(running, repeat=20):.3f}"),
+    ])
+
+
+# --- BENCHMARK: maintained secondary indexes ---
+
+def bench_indexes(n):
+    store = build_store(list(synthetic_rows(n)))
+    rnd = random.Random(11)
+    ids = list(store.ids)
+    store.find(ids[0]), store.sorted['score'].order, store.sorted['name'].order # Build once
+
+    def edit():
+        i = rnd.randrange(len(store))
+        store.update(i, rnd.choice(FIRST) + " " + rnd.choice(LAST), [rnd.randint(0, 20) for _ in range(3)], rnd.randint(0, 100))
+
+    def append():
+        store.append(10**9 + len(store), rnd.choice(FIRST), [10, 10, 10], 50)
+
+    rows = []
+    for key in ("score", "name"):
+        store.sort_by(key)
+        rows.append((f"edit, {key} view (ms)", f"{timed(lambda: (edit(), cold_sort(store, key)), repeat=3):.1f}",
+                     f"{timed(lambda: (edit(), store.rows()), repeat=20):.3f}"))
+        rows.append((f"add, {key} view (ms)", f"{timed(lambda: (append(), cold_sort(store, key)), repeat=3):.1f}",
+                     f"{timed(lambda: (append(), store.rows()), repeat=20):.3f}"))
+    store.sort_by("score")
+    rows.append(("delete, score view (ms)", f"{timed(lambda: (store.remove(rnd.randrange(len(store))), cold_sort(store, 'score')), repeat=3):.1f}",
+                 f"{timed(lambda: (store.remove(rnd.randrange(len(store))), store.rows()), repeat=5):.1f}"))
+    rows.append(("find by ID (ms)", f"{timed(lambda: store.ids.index(rnd.choice(ids)), repeat=20):.3f}",
+                 f"{timed(lambda: store.find(rnd.choice(ids)), repeat=20):.4f}"))
+    report(f"One change, then show a sorted view ({n:,} students)", [("", "re-sort / scan", "indexes")] + rows)
+
+
+# --- BENCHMARK: search index keystroke latency ---
+
+TYPED = ["sam", "mira jo", "zal", "84", "8439", "ka"]
+PAGE = 20
+
+
+def bench_search(n):
+    store = build_store(synthetic_rows(n, varied=True))
+    index = SearchIndex(store)
+    t0 = time.perf_counter()
+    index.rebuild()
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    results, worst = [], 0.0
+    for word in TYPED:
+        index.search("") # Search box cleared between words
+        for k in range(1, len(word) + 1):
+            q = word[:k]
+            t0 = time.perf_counter()
+            hits = index.search(q)
+            hits[:PAGE] # First screen of the table
+            idx_ms = (time.perf_counter() - t0) * 1000
+            worst = max(worst, idx_ms)
+            lin_ms = timed(lambda: store.match(q), repeat=1)
+            assert list(hits) == store.match(q), q
+            results.append((repr(q), f"{len(hits):,}", f"{lin_ms:.2f}", f"{idx_ms:.2f}"))
+    report(f"Search keystroke latency ({n:,} students, {len(index.names.keys):,} distinct names, "
+           f"index built in {build_ms:.0f} ms)",
+           [("query", "matches", "linear (ms)", "index (ms)")] + results)
+    print(f"worst keystroke: {worst:.2f} ms")
+
+
+# --- BENCHMARK: streaming loader ---
+
+def write_marks(path, n, bad_every=0):
+    """Writes a synthetic studentMarks.txt (optionally with a bad line every bad_every rows)."""
+    with open(path, "w") as f:
+        f.write(f"{n}\n")
+        for k, (sid, name, cw, ex) in enumerate(synthetic_rows(n)):
+            if bad_every and k % bad_every == 0:
+                f.write(f"{sid},{name},{cw[0]},oops,{cw[2]},{ex}\n")
+            else:
+                f.write(f"{sid},{name},{cw[0]},{cw[1]},{cw[2]},{ex}\n")
+
+
+def bench_load(n):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "studentMarks.txt")
+        write_marks(path, n, bad_every=1000)
+        size_mb = os.path.getsize(path) / 1e6
+
+        def old_parse():
+            with open(path) as f:
+                lines = f.readlines()
+                for line in lines[1:]:
+                    p = line.strip().split(',')
+                    int(p[2]) + int(p[3]) # First bad line aborts everything
+            return len(lines)
+
+        def streamed():
+            report = RejectReport()
+            count = sum(1 for _ in iter_records(path, report))
+            return count, report.count
+
+        _, old_mem = measure(lambda: _try(old_parse))
+        (count, rejects), new_mem = measure(streamed)
+        new_ms = timed(streamed, repeat=1)
+        report(f"Loading a {size_mb:.1f} MB marks file ({n:,} lines, 1 in 1000 bad)", [
+            ("", "readlines()", "iter_records()"),
+            ("peak memory (MB)", f"{old_mem / 1e6:.1f}", f"{new_mem / 1e6:.1f}"),
+            ("records kept", "0 (aborted)", f"{count:,}"),
+            ("rejected lines", "-", f"{rejects:,}"),
+            ("time (ms)", "-", f"{new_ms:.0f}"),
+        ])
+
+
+def bench_snapshot(n):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "studentMarks.txt")
+        write_marks(path, n)
+        build_ms = timed(lambda: student_snapshot.import_text(path), repeat=1)
+        bin_path = student_snapshot.snapshot_path(path)
+
+        def from_text():
+            store = StudentStore()
+            store.load_file(path)
+            return store
+
+        def from_snapshot():
+            store = StudentStore()
+            assert student_snapshot.load_fresh(store, path)
+            return store
+
+        a, b = from_text(), from_snapshot()
+        assert [a.row(i) for i in range(0, n, 997)] == [b.row(i) for i in range(0, n, 997)]
+        with student_snapshot.Snapshot(bin_path) as snap:
+            first_ms = timed(lambda: [snap.record(i) for i in range(20)])
+        report(f"Cold load of {n:,} students", [
+            ("", "text file", "snapshot"),
+            ("file size (MB)", f"{os.path.getsize(path) / 1e6:.1f}", f"{os.path.getsize(bin_path) / 1e6:.1f}"),
+            ("full load (ms)", f"{timed(from_text, repeat=1):.0f}", f"{timed(from_snapshot, repeat=1):.0f}"),
+            ("first 20 records (ms)", "-", f"{first_ms:.2f}"),
+            ("snapshot build (ms)", "-", f"{build_ms:.0f}"),
+        ])
+
+
+def bench_sqlite(n):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "studentMarks.txt")
+        write_marks(path, n)
+        db = SqliteStore(os.path.join(tmp, "studentMarks.db"))
+        import_ms = timed(lambda: db.load_file(path), repeat=1)
+        page = lambda rows: rows[len(rows) // 2:len(rows) // 2 + PAGE] # Mid-list page: OFFSET cost included
+
+        def first_page(key):
+            db.sort_key = key
+            return timed(lambda: page(db.rows()))
+
+        results = [
+            ("import (ms)", f"{import_ms:.0f}"),
+            ("db size (MB)", f"{os.path.getsize(db.path) / 1e6:.1f}"),
+            ("mid page, id order (ms)", f"{first_page(None):.1f}"),
+            ("mid page, by score (ms)", f"{first_page('score'):.1f}"),
+            ("mid page, by name (ms)", f"{first_page('name'):.1f}"),
+        ]
+        for q in ("sam", "mira jo", "84"):
+            results.append((f"search '{q}' (ms)", f"{timed(lambda: page(db.search(q))):.1f}"))
+        results += [
+            ("highest + lowest (ms)", f"{timed(lambda: (db.highest(), db.lowest())):.2f}"),
+            ("summary (ms)", f"{timed(db.summary):.0f}"),
+        ]
+        db.close()
+        report(f"SQLite backend ({n:,} students, {PAGE}-row pages)", results)
+
+
+RESIZE_EVENT_MS = 2   # A window-edge drag delivers roughly one <Configure> every 2 ms
+RESIZE_DRAG_MS = 1000
+
+
+def bench_resize(n):
+    import tkinter as tk
+    from student_chart import GradeChart
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"\nresize: skipped, no display ({e})")
+        return
+    store = build_store(list(synthetic_rows(min(n, 10000))))
+    chart = GradeChart(root, store, width=880, height=150)
+    chart.pack()
+    root.update()
+
+    def drag(on_event):
+        """Replays a one-second drag; returns (CPU ms, redraws)."""
+        calls, draw = [0], chart.draw_chart
+        def counted():
+            calls[0] += 1
+            draw()
+        chart.draw_chart = counted
+        cpu = time.process_time()
+        start = time.perf_counter()
+        for k in range(RESIZE_DRAG_MS // RESIZE_EVENT_MS):
+            on_event(600 + (k * 3) % 500)
+            root.update()
+            time.sleep(max(0, start + (k + 1) * RESIZE_EVENT_MS / 1000 - time.perf_counter()))
+        root.update()
+        del chart.draw_chart
+        return (time.process_time() - cpu) * 1000, calls[0]
+
+    def rebuild(width): # Previous behaviour: delete("all") and recreate every item per event
+        chart.configure(width=width)
+        chart.delete("all")
+        chart.build()
+        chart.draw_chart()
+
+    old_cpu, old_draws = drag(rebuild)
+    new_cpu, new_draws = drag(chart.resize)
+    root.destroy()
+    report(f"Dragging the window edge for {RESIZE_DRAG_MS} ms ({RESIZE_DRAG_MS // RESIZE_EVENT_MS} events)", [
+        ("", "rebuild/event", "coalesced"),
+        ("chart redraws", f"{old_draws}", f"{new_draws}"),
+        ("CPU time (ms)", f"{old_cpu:.0f}", f"{new_cpu:.0f}"),
+    ])
+
+
+# --- BENCHMARK: form-style adds vs bulk import ---
+
+def bench_bulk(n):
+    with tempfile.TemporaryDirectory() as tmp:
+        src, out = os.path.join(tmp, "in.csv"), os.path.join(tmp, "out.csv")
+        with open(src, "w") as f:
+            f.write("id,name,cw1,cw2,cw3,exam\n")
+            for sid, name, cw, ex in synthetic_rows(n):
+                f.write(f"{sid},{name},{cw[0]},{cw[1]},{cw[2]},{ex}\n")
+
+        def per_row(store):
+            """What the Add Student form does: validate, check the ID, one committed append."""
+            with open(src) as f:
+                next(f)
+                for line in f:
+                    sid, name, cw, ex = validate_record(*line.rstrip("\n").split(","))
+                    if store.find(sid) is None: store.append(sid, name, cw, ex)
+            return len(store)
+
+        def bulk(store):
+            with store.batch() if isinstance(store, StudentStore) else contextlib.nullcontext():
+                return student_bulk.bulk_import(store, src)[0]
+
+        def sqlite_store():
+            path = os.path.join(tmp, "students.db")
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix): os.remove(path + suffix)
+            return SqliteStore(path)
+
+        results = []
+        for label, make in (("memory", StudentStore), ("sqlite", sqlite_store)):
+            times = []
+            for load in (per_row, bulk):
+                store = make()
+                start = time.perf_counter()
+                assert load(store) == n
+                times.append(time.perf_counter() - start)
+                if load is bulk:
+                    export_s = timed(lambda: student_bulk.bulk_export(store, out), repeat=1) / 1000
+                if label == "sqlite": store.close()
+            results.append((f"{label} import rows/s", *(f"{n / t:,.0f}" for t in times)))
+            results.append((f"{label} export rows/s", "-", f"{n / export_s:,.0f}"))
+        report(f"CSV bulk import/export of {n:,} students", [("", "per row", "student_bulk"), *results])
+
+
+# --- BENCHMARK: headless batch jobs ---
+
+def bench_batch(n, files=16):
+    with tempfile.TemporaryDirectory() as tmp:
+        for k in range(files):
+            write_marks(os.path.join(tmp, f"cohort{k:02}.txt"), max(n // files, 1))
+        paths = student_cli.mark_files([tmp])
+        opts = {"command": "stats"}
+        cores = os.cpu_count() or 1
+        serial_ms = timed(lambda: list(student_cli.run_jobs(paths, opts, 1)), repeat=1)
+        pool_ms = timed(lambda: list(student_cli.run_jobs(paths, opts, cores)), repeat=1)
+        report(f"stats over {files} files / {n:,} students", [
+            ("", "1 process", f"{cores} process(es)"),
+            ("wall time (ms)", f"{serial_ms:.0f}", f"{pool_ms:.0f}"),
+            ("rows/sec", f"{n / serial_ms * 1000:,.0f}", f"{n / pool_ms * 1000:,.0f}"),
+        ])
+
+
+# --- BENCHMARK: staged startup ---
+
+def bench_startup(n):
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import student_assets
+    base = student_assets.BASE_DIR
+    bg, logo = os.path.join(base, "oxford-bg.jpg"), os.path.join(base, "oxford-logo.png")
+    imports = "import time; t = time.perf_counter(); from PIL import Image, ImageTk, ImageEnhance; " \
+              "import pygame; print((time.perf_counter() - t) * 1000)"
+    out = subprocess.run([sys.executable, "-c", imports], capture_output=True, text=True,
+                         env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"}).stdout
+    import_ms = float(out.split()[-1])
+    with tempfile.TemporaryDirectory() as tmp:
+        student_assets.CACHE_DIR = tmp
+        process = lambda: (student_assets.background(bg), student_assets.logo(logo))
+        cold_ms = timed(process, repeat=1)   # Decodes, resizes, darkens and writes the cache
+        warm_ms = timed(process)             # Reads the processed files back
+    report("Asset work before the window can paint", [
+        ("", "eager (before)", "staged"),
+        ("Pillow + pygame import", f"{import_ms:.0f} ms", "asset thread"),
+        ("bg + logo, first run", f"{cold_ms:.0f} ms", "asset thread"),
+        ("bg + logo, cached", f"{cold_ms:.0f} ms", f"{warm_ms:.0f} ms (thread)"),
+    ])
+
+
+# --- BENCHMARK: journal vs full rewrite, crash recovery ---
+
+def restart(path):
+    """What the app does on startup: load the snapshot text, replay the journal."""
+    store = StudentStore()
+    store.load_file(path)
+    journal = student_journal.MarksJournal(path)
+    journal.replay(store)
+    return store, journal
+
+
+def bench_journal(n, edits=200):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "studentMarks.txt")
+        write_marks(path, n)
+        store, journal = restart(path)
+        rows = list(range(0, len(store), max(1, len(store) // edits)))[:edits]
+
+        def append():
+            for i in rows:
+                s = store.row(i)
+                journal.put(s['id'], s['name'], s['cw'], s['exam'])
+            journal.sync()
+
+        rewrite_ms = timed(lambda: store.save_file(path), repeat=1) * len(rows)
+        append_ms = timed(append, repeat=1)
+        journal.close()
+
+        # Crash mid-write, restart, edit, restart: the edit after the crash must survive
+        with open(journal.path, "a") as f: f.write(student_journal.encode("P,2000000002,Torn,1,1,1,1")[:-7])
+        store, journal = restart(path)
+        journal.start()
+        journal.put(2000000003, "After Crash", [20, 20, 20], 100)
+        journal.close()
+        store, journal = restart(path)
+        assert store.find("2000000003") is not None and store.find("2000000002") is None
+        assert student_journal.is_clean(journal.path) and os.path.exists(journal.path + ".torn")
+
+        # Put, put, delete of one new ID in a single replay: no duplicate rows, the delete sticks
+        before = len(store)
+        with open(journal.path, "a") as f:
+            for payload in ("P,2000000006,Twice,1,1,1,1", "P,2000000006,Twice,2,2,2,2", "D,2000000006",
+                            "P,2000000007,Edited,1,1,1,1", "P,2000000007,Edited,3,3,3,3"):
+                f.write(student_journal.encode(payload))
+        store, journal = restart(path)
+        assert len(store) == before + 1 and store.find("2000000006") is None
+        assert list(store.ids).count(2000000007) == 1 and store.row(store.find("2000000007"))['cw'] == [3, 3, 3]
+
+        # A corrupt sealed journal is kept, and invalid snapshot lines are logged, not dropped
+        with open(path, "a") as f: f.write("2000000009,Bad Marks,99,0,0,0\n")
+        with open(journal.sealed_path, "w") as f:
+            f.write(student_journal.encode("P,2000000004,Kept,1,1,1,1") + "garbage\n" + student_journal.encode("D,2000000003"))
+        assert not journal.compact() and os.path.exists(journal.sealed_path)
+        journal = student_journal.MarksJournal(path)
+        os.replace(journal.sealed_path, journal.sealed_path + ".bak")
+        with open(journal.path, "a") as f: f.write(student_journal.encode("P,2000000005,Folded,2,2,2,2"))
+        assert journal.compact()
+        journal.close()
+        store = StudentStore()
+        store.load_file(path)
+        assert store.find("2000000005") is not None and store.find("2000000003") is not None
+        with open(path + ".rejected.txt") as f: assert "2000000009,Bad Marks" in f.read()
+        report(f"Saving {len(rows)} edits to a {n:,}-student file", [
+            ("", "full rewrite", "journal"),
+            ("time (ms)", f"{rewrite_ms:.0f}", f"{append_ms:.1f}"),
+            ("crash recovery", "-", "ok"),
+        ])
+
+
+def _try(fn):
+    try: return fn()
+    except ValueError: return None
+
+
+BENCHMARKS = {
+    "store": bench_store,
+    "search": bench_search,
+    "load": bench_load,
+    "grading": bench_grading,
+    "aggregates": bench_aggregates,
+    "indexes": bench_indexes,
+    "snapshot": bench_snapshot,
+    "sqlite": bench_sqlite,
+    "resize": bench_resize,
+    "bulk": bench_bulk,
+    "batch": bench_batch,
+    "startup": bench_startup,
+    "journal": bench_journal,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Student Manager benchmarks")
+    parser.add_argument("names", nargs="*", default=list(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--n", type=int, default=200_000, help="synthetic cohort size")
+    args = parser.parse_args()
+    for name in args.names:
+        BENCHMARKS[name](args.n)
@@ -0,0 +1,107 @@
+"""
+DASHBOARD AGGREGATES
+-------------------
+Running totals behind the stat cards, the grade chart and the Highest/Lowest
+buttons, kept current through the store's listener hooks instead of being
+recounted on every refresh.
+
+HOW IT WORKS:
+- count, the sum of percentages (in tenths) and the A-F counts change by one
+  row per add/edit/delete: O(1).
+- Highest and lowest use two binary heaps (heapq) with lazy deletion: an edit
+  pushes the row's new score, a delete pushes nothing, and out-of-date entries
+  are discarded only when they reach the top: O(log N) amortized.
+- Heap entries name rows by the store's sequence numbers (store.seqs), which
+  still resolve to the right row after earlier rows are deleted. Ties go to the
+  earliest-added student.
+- Bulk loads send one on_reset(); the totals are rebuilt on next use from C-level
+  column scans and the heaps are only built when first needed.
+"""
+
+import heapq
+
+from student_grading import GRADES, PERC10_BY_TOTAL
+
+SEQ_SPAN = 1 << 40  # Heap key = score * SEQ_SPAN + seq (one int per entry, not a tuple)
+
+
+class Aggregates:
+    """Incrementally maintained count / average / grade counts / extremes of a StudentStore."""
+    def __init__(self, store):
+        self.store = store
+        self.dirty = True
+        store.listeners.append(self)
+
+    def _rebuild(self):
+        store = self.store
+        self.count = len(store)
+        self.p10_sum = sum(store.perc10)
+        self.counts = store.grade_counts()
+        self.high = self.low = None # Heaps, built on first use
+        self.dirty = False
+
+    # --- STORE LISTENER HOOKS ---
+    def on_reset(self):
+        self.dirty = True
+
+    def on_append(self, i):
+        if self.dirty: return
+        p10 = self.store.perc10[i]
+        self._add(p10, self.store.grade_of(i), 1)
+        self._push(p10, self.store.seqs[i])
+
+    def on_update(self, i, old):
+        if self.dirty: return
+        self._add(PERC10_BY_TOTAL[old['total']], old['grade'], -1)
+        p10 = self.store.perc10[i]
+        self._add(p10, self.store.grade_of(i), 1)
+        self._push(p10, self.store.seqs[i])
+
+    def on_remove(self, i, old):
+        if self.dirty: return
+        self._add(PERC10_BY_TOTAL[old['total']], old['grade'], -1) # Its heap entries no longer resolve
+
+    def _add(self, p10, grade, sign):
+        self.count += sign
+        self.p10_sum += sign * p10
+        self.counts[grade] += sign
+
+    def _push(self, p10, seq):
+        if self.high is not None: heapq.heappush(self.high, -p10 * SEQ_SPAN + seq)
+        if self.low is not None: heapq.heappush(self.low, p10 * SEQ_SPAN + seq)
+
+    # --- HEAPS ---
+    def _heap(self, sign):
+        """Valid-topped heap of sign * score keys (sign -1 = highest first)."""
+        heap = self.high if sign < 0 else self.low
+        if heap is None or len(heap) > 2 * self.count + 1024: # Missing, or mostly stale entries
+            heap = [sign * p * SEQ_SPAN + s for p, s in zip(self.store.perc10, self.store.seqs)]
+            heapq.heapify(heap)
+            if sign < 0: self.high = heap
+            else: self.low = heap
+        store = self.store
+        while heap:
+            score, seq = divmod(heap[0], SEQ_SPAN)
+            i = store.row_of_seq(seq)
+            if i is not None and store.perc10[i] == sign * score:
+                return heap, i
+            heapq.heappop(heap) # Row was edited or deleted since this entry was pushed
+        return heap, None
+
+    # --- QUERIES ---
+    def highest(self):
+        """Row with the best percentage, or None."""
+        if self.dirty: self._rebuild()
+        return self._heap(-1)[1]
+
+    def lowest(self):
+        """Row with the worst percentage, or None."""
+        if self.dirty: self._rebuild()
+        return self._heap(1)[1]
+
+    def summary(self):
+        """Same shape as StudentStore.summary() for the whole cohort: (count, avg, top, counts)."""
+        if self.dirty: self._rebuild()
+        if not self.count:
+            return 0, 0, None, dict.fromkeys(GRADES, 0)
+        return self.count, round(self.p10_sum / self.count / 10, 1), self.highest(), dict(self.counts)
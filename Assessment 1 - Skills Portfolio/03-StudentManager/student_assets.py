@@ -0,0 +1,85 @@
+"""
+STUDENT MANAGER ASSETS
+-------------------
+Decodes the window's images and click sound. 03-StudentManager.py imports this
+module on its asset thread, so Pillow and pygame (~200 ms of imports) and the
+decoding below never delay the first paint.
+
+DISK CACHE:
+- Processed images (the resized logo, the resized + darkened background) are
+  saved in asset_cache/ as <name>-<tag>-<size>-<mtime_ns>.<ext>.
+- The key includes the source file's size and mtime, so replacing an image
+  invalidates its entry automatically; older entries for it are deleted.
+- Cache files are written to a temp file and swapped in with os.replace().
+"""
+
+import glob
+import os
+
+from PIL import Image, ImageEnhance
+import pygame
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_DIR, "asset_cache")
+
+
+def cache_path(src, tag):
+    st = os.stat(src)
+    stem, ext = os.path.splitext(os.path.basename(src))
+    return os.path.join(CACHE_DIR, f"{stem}-{tag}-{st.st_size}-{st.st_mtime_ns}{ext}")
+
+
+def cached_image(src, tag, process):
+    """process(Image) for src, read back from the disk cache when the source is unchanged."""
+    path = cache_path(src, tag)
+    try:
+        img = Image.open(path)
+        img.load()
+        return img
+    except OSError:
+        pass # Not cached yet (or unreadable): build it
+    source = Image.open(src)
+    fmt = source.format
+    img = process(source)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        stem = os.path.splitext(os.path.basename(src))[0]
+        for old in glob.glob(os.path.join(CACHE_DIR, glob.escape(f"{stem}-{tag}-") + "*")):
+            os.remove(old) # Entries for an older version of the source
+        tmp = path + ".tmp"
+        img.save(tmp, format=fmt, quality=95)
+        os.replace(tmp, path)
+    except OSError:
+        pass # Read-only folder: still works, just uncached
+    return img
+
+
+# --- THE APP'S ASSETS ---
+
+def logo(path, height=70):
+    def process(img):
+        return img.resize((int(height * img.width / img.height), height), Image.Resampling.LANCZOS)
+    return cached_image(path, f"h{height}", process)
+
+
+def background(path, size=(1600, 1000), brightness=0.3):
+    def process(img):
+        img = img.resize(size, Image.Resampling.LANCZOS)
+        return ImageEnhance.Brightness(img).enhance(brightness)
+    return cached_image(path, f"{size[0]}x{size[1]}b{brightness}", process)
+
+
+def icon(path):
+    img = Image.open(path)
+    img.load()
+    return img
+
+
+def click_sound(path, volume=0.3):
+    try:
+        pygame.mixer.init()
+        sound = pygame.mixer.Sound(path)
+    except pygame.error as e: # No audio device or undecodable file: reported like a missing file
+        raise OSError(f"sound unavailable ({e})") from e
+    sound.set_volume(volume)
+    return sound
@@ -0,0 +1,169 @@
+"""
+BULK IMPORT / EXPORT
+-------------------
+Streams large files of student marks into or out of a store (StudentStore or
+SqliteStore) without going through the Add Student form one record at a time.
+
+FORMATS (picked from the file extension, or forced with fmt=):
+- .csv            -> id,name,cw1,cw2,cw3,exam (an optional header row is detected)
+- .jsonl/.ndjson  -> one {"id", "name", "cw1", "cw2", "cw3", "exam"} object per line
+                     ("cw": [a, b, c] is accepted instead of cw1-cw3)
+- .txt            -> the usual studentMarks.txt format
+- .bin            -> the binary snapshot (student_snapshot.py); export only writes it
+                     in one go, since the record table is sized up front
+
+PIPELINE:
+- Rows are read one at a time and validated with validate_record(), the same
+  rules as the Add/Update form. Bad rows go to a RejectReport.
+- Duplicate IDs (within the file, or already in the store) are caught with the
+  loader's IdSet.
+- Valid rows are handed to store.extend() in batches of `batch_size`, so the
+  SQLite backend commits once per batch and the in-memory store grades each
+  batch in one pass.
+"""
+
+import csv
+import json
+import os
+import time
+
+from student_loader import IdSet, RejectReport, iter_lines, validate_record
+import student_snapshot
+
+BATCH_SIZE = 10000
+FIELDS = ("id", "name", "cw1", "cw2", "cw3", "exam")
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".txt": "txt", ".bin": "bin"}
+
+
+def detect_format(path, fmt=None):
+    if fmt: return fmt
+    try:
+        return FORMATS[os.path.splitext(path)[1].lower()]
+    except KeyError:
+        raise ValueError(f"unknown file type for {path} (use --format csv|jsonl|txt|bin)")
+
+
+# --- READERS: yield (line number, raw text for the report, 6 raw fields) ---
+
+def _csv_rows(path):
+    with open(path, newline="") as f:
+        for line_no, row in enumerate(csv.reader(f), start=1):
+            if not row: continue
+            if line_no == 1 and row[0].strip().lower() == "id": continue # Header row
+            yield line_no, ",".join(row), row
+
+
+def _jsonl_rows(path):
+    with open(path) as f:
+        for line_no, line in enumerate(iter_lines(f), start=1):
+            if not line.strip(): continue
+            try:
+                obj = json.loads(line)
+                cw = obj.get("cw") or [obj["cw1"], obj["cw2"], obj["cw3"]]
+                fields = [str(obj["id"]), str(obj["name"]), *map(str, cw), str(obj["exam"])]
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                fields = [f"bad JSON object ({e.__class__.__name__})"]
+            yield line_no, line, fields
+
+
+def _txt_rows(path):
+    with open(path) as f:
+        lines = iter_lines(f)
+        next(lines, None) # Student count header
+        for line_no, line in enumerate(lines, start=2):
+            if line.strip(): yield line_no, line, line.strip().split(',')
+
+
+def _bin_rows(path):
+    with student_snapshot.Snapshot(path) as snap:
+        for k in range(len(snap)):
+            sid, name, cw, ex = snap.record(k)
+            yield k + 1, name, [sid, name, *cw, ex]
+
+
+READERS = {"csv": _csv_rows, "jsonl": _jsonl_rows, "txt": _txt_rows, "bin": _bin_rows}
+
+
+def iter_valid(path, fmt=None, report=None, seen=None):
+    """Validated (id, name, cw, exam) records from any supported file; rejects go to report."""
+    seen = seen if seen is not None else IdSet()
+    for line_no, text, fields in READERS[detect_format(path, fmt)](path):
+        try:
+            if len(fields) != 6:
+                raise ValueError(fields[0] if len(fields) == 1 else f"expected 6 fields, found {len(fields)}")
+            rec = validate_record(*fields)
+            if not seen.add(rec[0]): raise ValueError(f"duplicate ID {rec[0]}")
+        except ValueError as e:
+            if report is not None: report.add(line_no, text, str(e))
+            continue
+        if report is not None: report.loaded += 1
+        yield rec
+
+
+# --- IMPORT ---
+
+def bulk_import(store, path, fmt=None, report=None, batch_size=BATCH_SIZE, on_batch=None):
+    """
+    Appends every valid record of a file to a store, batch by batch.
+    IDs already in the store count as duplicates. Returns (imported, seconds).
+    On StudentStore, wrap the call in store.batch() so listeners rebuild once.
+    """
+    report = report if report is not None else RejectReport()
+    seen = IdSet()
+    for sid, *_ in store.records():
+        seen.add(sid)
+    start, batch, imported = time.perf_counter(), [], 0
+    for rec in iter_valid(path, fmt, report, seen):
+        batch.append(rec)
+        if len(batch) >= batch_size:
+            store.extend(batch)
+            imported += len(batch)
+            batch = []
+            if on_batch: on_batch(imported)
+    if batch:
+        store.extend(batch)
+        imported += len(batch)
+    report.close()
+    return imported, time.perf_counter() - start
+
+
+# --- EXPORT ---
+
+def _write_csv(f, records):
+    out = csv.writer(f, lineterminator="\n")
+    out.writerow(FIELDS)
+    for sid, name, cw, ex in records:
+        out.writerow((sid, name, cw[0], cw[1], cw[2], ex))
+        yield
+
+
+def _write_jsonl(f, records):
+    for sid, name, cw, ex in records:
+        f.write(json.dumps({"id": sid, "name": name, "cw1": cw[0], "cw2": cw[1], "cw3": cw[2], "exam": ex}) + "\n")
+        yield
+
+
+def _write_txt(f, records, count):
+    f.write(f"{count}\n")
+    for sid, name, cw, ex in records:
+        f.write(f"{sid},{name},{cw[0]},{cw[1]},{cw[2]},{ex}\n")
+        yield
+
+
+def bulk_export(store, path, fmt=None):
+    """Streams the store (in display order) to a file. Returns (exported, seconds)."""
+    fmt = detect_format(path, fmt)
+    start = time.perf_counter()
+    if fmt == "bin":
+        count = student_snapshot.write_snapshot(store.records(), path)
+        return count, time.perf_counter() - start
+    tmp, count = path + ".tmp", 0
+    with open(tmp, "w", newline="" if fmt == "csv" else None) as f:
+        if fmt == "csv": rows = _write_csv(f, store.records())
+        elif fmt == "jsonl": rows = _write_jsonl(f, store.records())
+        else: rows = _write_txt(f, store.records(), len(store))
+        for _ in rows: count += 1
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return count, time.perf_counter() - start
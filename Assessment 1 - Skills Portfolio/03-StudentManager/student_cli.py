@@ -0,0 +1,299 @@
+"""
+HEADLESS COMMAND LINE
+-------------------
+Runs Student Manager jobs without opening the window. 03-StudentManager.py
+hands over to main() before importing Tk, Pillow or pygame whenever it is
+started with arguments, so this works over SSH or from a scheduled task:
+
+    python 03-StudentManager.py import new_cohort.csv
+    python 03-StudentManager.py export marks.jsonl --sort score
+    python 03-StudentManager.py stats cohorts/ --jobs 8
+    python 03-StudentManager.py top cohorts/ -n 5 --json
+
+COMMANDS (app data):
+- import SRC  -> Validates SRC (.csv/.jsonl/.txt/.bin) with the Add Student rules
+                 and adds its students to studentMarks.txt (or studentMarks.db).
+- export DEST -> Streams the cohort out as .csv/.jsonl/.txt/.bin.
+Both report rows/sec. Run them while the window is closed: the text file and
+its journal are rewritten as one snapshot.
+
+COMMANDS (batch jobs over any mark files; a directory means every file in it):
+- load    -> Validates each file: students loaded, rejected lines, rows/sec.
+- grade   -> Every student with coursework total, exam, percentage and grade.
+- sort    -> Same, ordered --by score or name.
+- filter  -> Students matching --grade / --min / --max / --name.
+- top / bottom -> The -n best or worst students per file.
+- stats   -> Count, average, grade counts, highest and lowest per file, plus
+             a combined line for the whole run.
+Files are processed in parallel by a process pool (--jobs, default: all cores);
+--json prints one JSON object per file for other tools to consume.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+import heapq
+from itertools import repeat
+import json
+import os
+import time
+
+from student_bulk import BATCH_SIZE, FORMATS, bulk_export, bulk_import, detect_format
+from student_grading import GRADES
+from student_journal import MarksJournal
+from student_loader import RejectReport
+import student_snapshot
+from student_sqlite import SqliteStore, db_path, text_stamp
+from student_store import StudentStore
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FILE_NAME = os.path.join(BASE_DIR, "studentMarks.txt")
+
+
+# --- STORE ACCESS (same sources the window uses) ---
+
+def open_store(args):
+    """The cohort as the app would see it: snapshot/text + journal, or the SQLite database."""
+    if args.sqlite:
+        store = SqliteStore(db_path(args.file))
+        if os.path.exists(args.file) and store.source_stamp() != text_stamp(args.file):
+            store.load_file(args.file) # Text file changed since the last import
+        return store
+    store = StudentStore()
+    if os.path.exists(args.file) and not student_snapshot.load_fresh(store, args.file):
+        store.load_file(args.file)
+    MarksJournal(args.file).replay(store)
+    return store
+
+
+def save_store(store, args):
+    """Writes an edited in-memory cohort back as one snapshot (the journal is folded in)."""
+    if args.sqlite: return # Every batch is already committed
+    store.save_file(args.file)
+    journal = MarksJournal(args.file)
+    for path in (journal.sealed_path, journal.path):
+        if os.path.exists(path): os.remove(path)
+
+
+def rate(count, seconds):
+    return f"{count} rows in {seconds:.2f}s ({count / max(seconds, 1e-9):,.0f} rows/sec)"
+
+
+# --- COMMANDS ---
+
+def cmd_import(args):
+    store = open_store(args)
+    report = RejectReport(args.rejects)
+    on_batch = (lambda n: print(f"  {n} rows...", flush=True)) if args.verbose else None
+    with nullcontext() if args.sqlite else store.batch(): # In memory: one index rebuild, not one per row
+        imported, seconds = bulk_import(store, args.source, args.format, report, args.batch, on_batch)
+    save_store(store, args)
+    print(f"Imported {rate(imported, seconds)} into {args.file if not args.sqlite else db_path(args.file)}")
+    if report.count:
+        print(f"Skipped {report.count} bad or duplicate row(s):")
+        for line_no, _, reason in report.samples[:5]:
+            print(f"  line {line_no}: {reason}")
+        if args.rejects: print(f"Full report: {args.rejects}")
+    if args.sqlite: store.close()
+    return 0
+
+
+def cmd_export(args):
+    store = open_store(args)
+    if args.sort: store.sort_by(args.sort)
+    exported, seconds = bulk_export(store, args.dest, args.format)
+    print(f"Exported {rate(exported, seconds)} to {args.dest}")
+    if args.sqlite: store.close()
+    return 0
+
+
+# --- BATCH JOBS (one worker process per file) ---
+
+def mark_files(paths):
+    """
+    Expands directories into the mark files they contain (sorted, non-recursive).
+    A .bin snapshot is dropped when its .txt source is listed too (load_path already
+    uses the snapshot for that text file), so a cohort is never counted twice.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(os.path.join(path, name) for name in os.listdir(path)
+                            if os.path.splitext(name)[1].lower() in FORMATS)
+        else:
+            files.append(path)
+    kind = lambda f: FORMATS.get(os.path.splitext(f)[1].lower())
+    snapshots = {os.path.abspath(student_snapshot.snapshot_path(f)) for f in files if kind(f) == "txt"}
+    return [f for f in files if not (kind(f) == "bin" and os.path.abspath(f) in snapshots)]
+
+
+def load_path(path, report):
+    """A StudentStore holding the valid records of any supported mark file."""
+    store, fmt = StudentStore(), detect_format(path)
+    if fmt == "txt":
+        if not student_snapshot.load_fresh(store, path): store.load_file(path, report)
+    elif fmt == "bin":
+        with student_snapshot.Snapshot(path) as snap: snap.load_into(store)
+    else:
+        with store.batch(): bulk_import(store, path, fmt, report)
+    report.loaded = len(store)
+    return store
+
+
+def select(store, opts):
+    """Rows for a row command, in output order."""
+    if opts["command"] in ("top", "bottom"):
+        pick = heapq.nlargest if opts["command"] == "top" else heapq.nsmallest
+        return pick(opts["n"], range(len(store)), key=store.perc10.__getitem__) # Ties: first added first
+    if opts["command"] == "sort": store.sort_by(opts["by"])
+    rows = store.rows()
+    if opts["command"] == "filter":
+        grades = opts["grade"] and {ord(g) for g in opts["grade"].upper()}
+        lo = -1 if opts["min"] is None else round(opts["min"] * 10)
+        hi = 1000 if opts["max"] is None else round(opts["max"] * 10)
+        q = opts["name"] and opts["name"].lower()
+        p10, grade = store.perc10, store.grade
+        rows = [i for i in (store.match(q) if q else rows)
+                if lo <= p10[i] <= hi and (not grades or grade[i] in grades)]
+    return rows
+
+
+def run_job(path, opts):
+    """Runs one command on one file; returns a JSON-ready result dict (errors included)."""
+    start = time.perf_counter()
+    report = RejectReport()
+    try:
+        store = load_path(path, report)
+    except (OSError, ValueError) as e:
+        return {"file": path, "error": str(e)}
+    result = {"file": path, "students": len(store), "rejected": report.count,
+              "seconds": round(time.perf_counter() - start, 4)}
+    command = opts["command"]
+    if command == "load":
+        result["samples"] = [f"line {n}: {reason}" for n, _, reason in report.samples[:5]]
+    elif command == "stats":
+        count, avg, top, counts = store.summary()
+        low = store.argmin()
+        result.update(average=avg, p10_sum=sum(store.perc10), grades=counts,
+                      highest=top is not None and store.row(top), lowest=low is not None and store.row(low))
+    else:
+        result["rows"] = [store.row(i) for i in select(store, opts)]
+    return result
+
+
+def run_jobs(files, opts, jobs):
+    """Results in file order; several files are spread over a process pool."""
+    jobs = min(jobs or os.cpu_count() or 1, len(files))
+    if jobs <= 1:
+        yield from map(run_job, files, repeat(opts))
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(run_job, files, repeat(opts), chunksize=max(1, len(files) // (jobs * 8)))
+
+
+def student_line(r):
+    return f"  {r['id']:>8}  {r['name']:<28}{r['cw_total']:>4}{r['exam']:>5}{r['perc']:>7.1f}%  {r['grade']}"
+
+
+def print_result(res):
+    if "error" in res:
+        print(f"{res['file']}: error: {res['error']}")
+        return
+    print(f"{res['file']}: {res['students']} students, {res['rejected']} rejected")
+    for sample in res.get("samples", ()): print(f"  {sample}")
+    if "grades" in res:
+        print(f"  average {res['average']}%  " + "  ".join(f"{g}:{res['grades'][g]}" for g in GRADES))
+        for label in ("highest", "lowest"):
+            if res[label]: print(f"  {label:<8}" + student_line(res[label]))
+    for r in res.get("rows", ()): print(student_line(r))
+
+
+def cmd_batch(args):
+    files = mark_files(args.paths or [args.file])
+    if not files:
+        print("error: no mark files found")
+        return 1
+    opts = {k: getattr(args, k, None) for k in ("command", "by", "n", "grade", "min", "max", "name")}
+    start = time.perf_counter()
+    totals = {"files": 0, "students": 0, "rejected": 0, "p10_sum": 0, "grades": dict.fromkeys(GRADES, 0)}
+    failed = 0
+    for res in run_jobs(files, opts, args.jobs):
+        if args.json: print(json.dumps(res))
+        else: print_result(res)
+        if "error" in res:
+            failed += 1
+            continue
+        totals["files"] += 1
+        totals["students"] += res["students"]
+        totals["rejected"] += res["rejected"]
+        if "grades" in res:
+            totals["p10_sum"] += res["p10_sum"]
+            for g in GRADES: totals["grades"][g] += res["grades"][g]
+    seconds = time.perf_counter() - start
+    if len(files) > 1 or args.command == "load":
+        if args.command == "stats" and totals["students"]:
+            totals["average"] = round(totals["p10_sum"] / totals["students"] / 10, 1)
+        if args.json:
+            print(json.dumps({"total": totals, "failed": failed, "seconds": round(seconds, 4)}))
+        else:
+            avg = f", average {totals['average']}%" if "average" in totals else ""
+            print(f"TOTAL: {totals['files']} file(s), {rate(totals['students'], seconds)}, "
+                  f"{totals['rejected']} rejected, {failed} failed{avg}")
+    return 1 if failed else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="03-StudentManager.py", description="Student Manager (headless mode)")
+    parser.add_argument("--file", default=FILE_NAME, help="marks file (default: studentMarks.txt)")
+    parser.add_argument("--sqlite", action="store_true", help="work on the .db next to the marks file")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="validate a CSV/JSONL/txt/bin file and add its students")
+    imp.add_argument("source")
+    imp.add_argument("--format", choices=("csv", "jsonl", "txt", "bin"))
+    imp.add_argument("--batch", type=int, default=BATCH_SIZE, help="rows per store commit")
+    imp.add_argument("--rejects", help="write every rejected row to this file")
+    imp.add_argument("-v", "--verbose", action="store_true", help="print progress per batch")
+    imp.set_defaults(run=cmd_import)
+
+    exp = sub.add_parser("export", help="stream the cohort to a CSV/JSONL/txt/bin file")
+    exp.add_argument("dest")
+    exp.add_argument("--format", choices=("csv", "jsonl", "txt", "bin"))
+    exp.add_argument("--sort", choices=("score", "name"), help="row order (default: file order)")
+    exp.set_defaults(run=cmd_export)
+
+    batch = argparse.ArgumentParser(add_help=False) # Options shared by the batch commands
+    batch.add_argument("paths", nargs="*", help="mark files or directories (default: --file)")
+    batch.add_argument("--jobs", type=int, help="worker processes (default: all cores)")
+    batch.add_argument("--json", action="store_true", help="one JSON object per file")
+    helps = {"load": "validate mark files and count rejects", "grade": "list every student with grades",
+             "sort": "list students in score or name order", "filter": "list students matching conditions",
+             "top": "best N students per file", "bottom": "worst N students per file",
+             "stats": "cohort statistics per file and overall"}
+    for name, text in helps.items():
+        cmd = sub.add_parser(name, parents=[batch], help=text)
+        if name == "sort": cmd.add_argument("--by", choices=("score", "name"), default="score")
+        if name in ("top", "bottom"): cmd.add_argument("-n", type=int, default=10)
+        if name == "filter":
+            cmd.add_argument("--grade", help="grade letters to keep, e.g. AB")
+            cmd.add_argument("--min", type=float, help="lowest percentage")
+            cmd.add_argument("--max", type=float, help="highest percentage")
+            cmd.add_argument("--name", help="name or ID contains")
+        cmd.set_defaults(run=cmd_batch)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.run(args)
+    except BrokenPipeError: # Output piped into head & co.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"error: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
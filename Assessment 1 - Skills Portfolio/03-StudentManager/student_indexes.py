@@ -0,0 +1,143 @@
+"""
+STUDENT STORE INDEXES
+-------------------
+Secondary indexes that StudentStore keeps current through its listener hooks,
+so lookups and sort orders never need a scan or a full re-sort.
+
+- IdIndex     -> Hash index: student ID -> row sequence number. find() is one
+                 dict lookup plus a binary search over the store's `seqs` column
+                 (rows keep their relative order, so `seqs` is always ascending).
+- SortedIndex -> Every row, kept ordered by (key, row). Used directly as the
+                 store's sorted view: an add or edit moves one entry to its
+                 bisected position, a delete removes one entry.
+                 Rows after a deleted one move down by one, but the stored row
+                 numbers are not rewritten per delete. Deleted rows are kept in
+                 a small sorted `dead` list, and hooks translate through it.
+                 One vectorized renumbering pass runs when the view is next
+                 read (or after DEAD_MAX deletes), however many deletes came
+                 before it.
+
+Both are built on first use after a bulk load (on_reset) and then maintained.
+"""
+
+from array import array
+from bisect import bisect_left, insort
+
+from student_grading import np  # Optional: speeds up the row renumbering after deletes
+
+DEAD_MAX = 1024   # Pending deletes before the order is renumbered anyway
+
+
+def _renumber(order, dead):
+    """Stored row numbers -> current ones: each moves down by the deleted rows below it."""
+    if np is not None:
+        a = np.frombuffer(order.tobytes(), dtype=np.int32)
+        return array('i', (a - np.searchsorted(np.array(dead, dtype=np.int32), a)).astype(np.int32).tobytes())
+    return array('i', [k - bisect_left(dead, k) for k in order])
+
+
+class IdIndex:
+    """Student ID -> row, via a dict of ID -> stable row sequence number."""
+    def __init__(self, store):
+        self.store = store
+        self.seq_of = None
+
+    def row(self, sid):
+        """Row index of a student ID, or None."""
+        store = self.store
+        if self.seq_of is None:
+            self.seq_of = dict(zip(store.ids, store.seqs))
+        seq = self.seq_of.get(sid)
+        return None if seq is None else store.row_of_seq(seq)
+
+    # --- STORE LISTENER HOOKS ---
+    def on_reset(self):
+        self.seq_of = None
+
+    def on_append(self, i):
+        if self.seq_of is not None:
+            self.seq_of[self.store.ids[i]] = self.store.seqs[i]
+
+    def on_update(self, i, old):
+        pass # IDs never change in place
+
+    def on_remove(self, i, old):
+        if self.seq_of is not None:
+            self.seq_of.pop(old['id'], None)
+
+
+class SortedIndex:
+    """
+    All rows ordered by key(row), ties by row (i.e. insertion order).
+    key(i) reads the live columns; old_key(record) gives the same key from the
+    row(i) dict a hook receives, for rows that have already changed.
+    """
+    def __init__(self, store, key, old_key, build=None):
+        self.store = store
+        self.key = key
+        self.old_key = old_key
+        self.build = build   # Optional fast builder: () -> array('i') of ordered rows
+        self._order = None   # Stored row numbers: current rows once `dead` is folded in
+        self.dead = []       # Stored numbers of rows deleted since the last renumbering, sorted
+
+    @property
+    def order(self):
+        if self._order is None:
+            if self.build:
+                self._order = self.build()
+            else:
+                key = self.key
+                self._order = array('i', sorted(range(len(self.store)), key=key))
+        else:
+            self._fold()
+        return self._order
+
+    def _fold(self):
+        """Applies the pending deletes to the stored row numbers (one pass)."""
+        if self.dead:
+            self._order = _renumber(self._order, self.dead)
+            self.dead = []
+
+    def _current(self, r):
+        """Current row of a stored row number."""
+        return r - bisect_left(self.dead, r)
+
+    def _stored(self, i):
+        """Stored row number of current row i."""
+        for d in self.dead:
+            if d > i: break
+            i += 1
+        return i
+
+    def _find(self, s, old_k):
+        """Position of stored row s (whose key used to be old_k) in the order."""
+        key, current = self.key, self._current
+        probe = lambda r: (old_k, s) if r == s else (key(current(r)), r)
+        return bisect_left(self._order, (old_k, s), key=probe)
+
+    def _insert(self, i):
+        key, current, s = self.key, self._current, self._stored(i)
+        pos = bisect_left(self._order, (key(i), s), key=lambda r: (key(current(r)), r))
+        self._order.insert(pos, s)
+
+    # --- STORE LISTENER HOOKS ---
+    def on_reset(self):
+        self._order = None
+        self.dead = []
+
+    def on_append(self, i):
+        if self._order is not None: self._insert(i)
+
+    def on_update(self, i, old):
+        if self._order is None: return
+        old_k = self.old_key(old)
+        if old_k == self.key(i): return
+        del self._order[self._find(self._stored(i), old_k)]
+        self._insert(i)
+
+    def on_remove(self, i, old):
+        if self._order is None: return
+        s = self._stored(i)
+        insort(self.dead, s) # Columns have already shifted down past i
+        del self._order[self._find(s, self.old_key(old))]
+        if len(self.dead) >= DEAD_MAX: self._fold()
@@ -0,0 +1,223 @@
+"""
+STUDENT MARKS JOURNAL (Write-Ahead Persistence)
+-------------------
+Instead of rewriting the whole studentMarks.txt after every add, edit or delete,
+each change is appended to a small journal file next to it:
+
+    studentMarks.txt            -> Base snapshot (the usual format)
+    studentMarks.txt.journal    -> Changes since the snapshot, one per line
+    studentMarks.txt.journal.1  -> Sealed journal being folded in by compaction
+
+JOURNAL LINE FORMAT:
+    <crc32 hex>|P,<id>,<name>,<cw1>,<cw2>,<cw3>,<exam>    (put = add or update)
+    <crc32 hex>|D,<id>                                    (delete)
+
+- Lines are fsynced in batches (every `sync_every` changes or `interval` seconds).
+- A torn last line from a crash fails its checksum and replay stops there.
+  Before the journal is reopened for appending, anything from the first bad
+  line on is moved to studentMarks.txt.journal.torn and cut off, so new
+  records never land behind unreadable bytes.
+- Replaying is idempotent (put/delete by ID), so a crash part-way through a
+  compaction can never double-apply a change.
+- A background thread folds the journal into the snapshot once it grows past
+  `compact_bytes`: the active journal is sealed, a new snapshot is written to a
+  temp file and swapped in with os.replace(), then the sealed journal is removed.
+  A sealed journal that does not replay cleanly to the end is kept and
+  compaction stops. Snapshot lines that fail validation are appended to
+  studentMarks.txt.rejected.txt instead of being dropped from the new snapshot.
+"""
+
+import os
+import threading
+import zlib
+
+from student_loader import RejectReport
+from student_store import StudentStore
+
+
+def encode(payload):
+    return f"{zlib.crc32(payload.encode()):08x}|{payload}\n"
+
+
+def decode(line):
+    """Payload of a journal line, or None if it is torn or corrupt."""
+    crc, sep, payload = line.rstrip("\n").partition("|")
+    if not sep or not line.endswith("\n"): return None
+    try:
+        return payload if int(crc, 16) == zlib.crc32(payload.encode()) else None
+    except ValueError:
+        return None
+
+
+def apply(store, payload):
+    """Applies one journal record to a store (upsert or delete by student ID)."""
+    p = payload.split(',')
+    i = store.find(p[1])
+    if p[0] == 'P':
+        cw, ex = [int(p[3]), int(p[4]), int(p[5])], int(p[6])
+        if i is None: store.append(p[1], p[2], cw, ex)
+        else: store.update(i, p[2], cw, ex)
+    elif p[0] == 'D' and i is not None:
+        store.remove(i)
+
+
+def records(path):
+    """Yields (payload, end offset) for each intact record, stopping at the first bad one."""
+    if not os.path.exists(path): return
+    end = 0
+    with open(path, "rb") as f:
+        for raw in f:
+            try:
+                payload = decode(raw.decode("utf-8"))
+            except UnicodeDecodeError:
+                payload = None
+            if payload is None: return # Torn tail from a crash: nothing valid after it
+            end += len(raw)
+            yield payload, end
+
+
+def intact_bytes(path):
+    """Length of the leading run of intact records (the file size if it is all good)."""
+    end = 0
+    for _, end in records(path): pass
+    return end
+
+
+def is_clean(path):
+    """True if a journal file is missing or replays right to its end."""
+    return not os.path.exists(path) or intact_bytes(path) == os.path.getsize(path)
+
+
+def replay_file(store, path):
+    """Applies every intact record in a journal file. Returns the number applied."""
+    applied = 0
+    for payload, _ in records(path):
+        apply(store, payload)
+        applied += 1
+    return applied
+
+
+def trim(path):
+    """Cuts a journal back to its intact records; the rest is appended to <path>.torn. Returns bytes cut."""
+    if not os.path.exists(path): return 0
+    good, size = intact_bytes(path), os.path.getsize(path)
+    if good == size: return 0
+    with open(path, "rb") as f, open(path + ".torn", "ab") as out:
+        f.seek(good)
+        out.write(f.read())
+        out.flush()
+        os.fsync(out.fileno())
+    os.truncate(path, good)
+    return size - good
+
+
+class MarksJournal:
+    """Append-only change log for a studentMarks.txt snapshot."""
+    def __init__(self, base_path, sync_every=64, interval=1.0, compact_bytes=1 << 20):
+        self.base_path = base_path
+        self.path = base_path + ".journal"
+        self.sealed_path = self.path + ".1"
+        self.sync_every = sync_every
+        self.interval = interval
+        self.compact_bytes = compact_bytes
+
+        self.lock = threading.Lock()
+        self.file = None
+        self.pending = 0              # Records written but not yet fsynced
+        self.compacting = False
+        self.damaged = False          # Sealed journal is corrupt: kept on disk, no more compaction
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    # --- STARTUP ---
+    def replay(self, store):
+        """Brings a store loaded from the snapshot up to date (sealed, then active journal)."""
+        with store.batch():
+            return replay_file(store, self.sealed_path) + replay_file(store, self.path)
+
+    def start(self):
+        """Opens the journal for appending and starts the background sync/compaction thread."""
+        with self.lock:
+            if self.file is None: self._open()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    # --- WRITES ---
+    def put(self, sid, name, cw, exam):
+        self.write(f"P,{sid},{name},{cw[0]},{cw[1]},{cw[2]},{exam}")
+
+    def delete(self, sid):
+        self.write(f"D,{sid}")
+
+    def write(self, payload):
+        with self.lock:
+            if self.file is None: self._open() # Edits made before start()
+            self.file.write(encode(payload))
+            self.pending += 1
+            if self.pending >= self.sync_every: self._sync()
+
+    def _open(self):
+        """Opens the active journal for appending, after cutting off a torn tail left by a crash."""
+        cut = trim(self.path)
+        if cut: print(f"Journal: {cut} torn byte(s) moved to {os.path.basename(self.path)}.torn")
+        self.file = open(self.path, "a")
+
+    def sync(self):
+        with self.lock: self._sync()
+
+    def _sync(self):
+        if self.pending and self.file:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.pending = 0
+
+    # --- BACKGROUND MAINTENANCE ---
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            self.sync()
+            if self.damaged: continue
+            if os.path.getsize(self.path) > self.compact_bytes or os.path.exists(self.sealed_path):
+                self.compact()
+
+    def compact(self):
+        """Folds the journal into a fresh snapshot without blocking writers. Returns True if it did."""
+        with self.lock:
+            if self.compacting or self.damaged: return False
+            self.compacting = True
+            if not os.path.exists(self.sealed_path):
+                # Seal the active journal; new writes go to a fresh file
+                self._sync()
+                if self.file: self.file.close()
+                self.file = None
+                trim(self.path)
+                os.replace(self.path, self.sealed_path)
+                self._open()
+        try:
+            if not is_clean(self.sealed_path):
+                # Records after the bad line cannot be replayed: keep the file for recovery
+                self.damaged = True
+                print(f"Journal: {os.path.basename(self.sealed_path)} is corrupt; kept, compaction stopped")
+                return False
+            store = StudentStore()
+            report = RejectReport(self.base_path + ".rejected.txt", append=True)
+            try:
+                store.load_file(self.base_path, report)
+            finally:
+                report.close()
+            if report.count: print(f"Journal: {report.count} invalid snapshot line(s) kept in {os.path.basename(report.path)}")
+            replay_file(store, self.sealed_path)
+            store.save_file(self.base_path) # Atomic temp-file + os.replace
+            os.remove(self.sealed_path)
+            return True
+        finally:
+            self.compacting = False
+
+    def close(self):
+        """Final sync on shutdown (the snapshot is folded on the next compaction)."""
+        self.stop_event.set()
+        if self.thread: self.thread.join(timeout=self.interval * 2)
+        with self.lock:
+            if self.file:
+                self._sync()
+                self.file.close()
+                self.file = None
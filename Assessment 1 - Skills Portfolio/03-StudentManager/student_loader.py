@@ -0,0 +1,148 @@
+"""
+STREAMING MARKS LOADER
+-------------------
+Reads studentMarks.txt-format files in fixed-size chunks and yields one
+validated record at a time, so memory stays flat however large the file is.
+Lines that fail validation go to a RejectReport instead of aborting the load.
+
+VALIDATION RULES (shared with the Add/Update form):
+- Exactly 6 comma-separated fields: id,name,cw1,cw2,cw3,exam
+- ID is a positive whole number, unique within the file (the brief's codes are
+  4-digit, but large cohort exports use longer ones)
+- Name is not blank and has no commas (the file is comma-separated)
+- Coursework marks 0-20, exam mark 0-100
+"""
+
+import os
+
+CHUNK_SIZE = 1 << 20   # Bytes read per step
+REJECT_SAMPLES = 20    # Rejected lines kept in memory for the summary dialog
+BITMAP_LIMIT = 1 << 24 # IDs below this are tracked in a bitmap (max 2 MB)
+
+
+def validate_record(sid, name, c1, c2, c3, ex):
+    """Returns (id, name, [cw1, cw2, cw3], exam) or raises ValueError with the reason."""
+    try:
+        sid = int(sid)
+    except ValueError:
+        raise ValueError("ID is not a number")
+    if not 0 < sid < 2**31: raise ValueError("ID must be a positive number")
+    name = name.strip()
+    if not name: raise ValueError("name is blank")
+    if ',' in name: raise ValueError("name cannot contain commas")
+    try:
+        cw, ex = [int(c1), int(c2), int(c3)], int(ex)
+    except ValueError:
+        raise ValueError("marks must be whole numbers")
+    if any(x < 0 or x > 20 for x in cw): raise ValueError("coursework marks must be 0-20")
+    if ex < 0 or ex > 100: raise ValueError("exam mark must be 0-100")
+    return sid, name, cw, ex
+
+
+def parse_line(line):
+    """One studentMarks.txt data line -> validated record (raises ValueError)."""
+    p = line.strip().split(',')
+    if len(p) != 6: raise ValueError(f"expected 6 fields, found {len(p)}")
+    return validate_record(*p)
+
+
+class IdSet:
+    """
+    Set of seen student IDs for duplicate detection.
+    IDs are small numbers, so a growable bitmap costs one bit per possible ID
+    instead of ~60 bytes per entry in a Python set. Rare huge IDs use a set.
+    """
+    def __init__(self):
+        self.bits = bytearray()
+        self.overflow = set()
+
+    def add(self, sid):
+        """Adds sid; returns False if it was already present."""
+        if sid >= BITMAP_LIMIT:
+            if sid in self.overflow: return False
+            self.overflow.add(sid)
+            return True
+        byte, bit = sid >> 3, 1 << (sid & 7)
+        if byte >= len(self.bits):
+            self.bits.extend(bytes(max(byte + 1 - len(self.bits), len(self.bits))))
+        if self.bits[byte] & bit: return False
+        self.bits[byte] |= bit
+        return True
+
+
+class RejectReport:
+    """
+    Collects lines that failed validation. Every reject is streamed to an
+    optional report file (append=True adds to it instead of starting a new
+    one); only the first few are kept in memory.
+    """
+    def __init__(self, path=None, keep=REJECT_SAMPLES, append=False):
+        self.path = path
+        self.keep = keep
+        self.append = append
+        self.count = 0
+        self.samples = []   # (line number, line, reason)
+        self.expected = None # Student count from the header line
+        self.loaded = 0
+        self._file = None
+
+    def add(self, line_no, line, reason):
+        self.count += 1
+        if len(self.samples) < self.keep:
+            self.samples.append((line_no, line, reason))
+        if self.path:
+            if self._file is None: self._file = open(self.path, "a" if self.append else "w")
+            self._file.write(f"line {line_no}: {reason}: {line}\n")
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+        elif self.path and self.count == 0 and not self.append and os.path.exists(self.path):
+            os.remove(self.path) # Old report from a previous, dirtier load
+
+    def summary(self):
+        """Short human-readable summary for a dialog."""
+        msg = f"Loaded {self.loaded} students, skipped {self.count} bad line(s)."
+        if self.expected is not None and self.expected != self.loaded + self.count:
+            msg += f"\nHeader said {self.expected} students."
+        for line_no, line, reason in self.samples[:5]:
+            msg += f"\n  line {line_no}: {reason}"
+        if self.path and self.count:
+            msg += f"\n\nFull report: {os.path.basename(self.path)}"
+        return msg
+
+
+def iter_lines(f, chunk_size=CHUNK_SIZE):
+    """Yields lines (without newline) from a text file read in fixed-size chunks."""
+    tail = ""
+    while True:
+        block = f.read(chunk_size)
+        if not block: break
+        lines = (tail + block).split("\n")
+        tail = lines.pop() # Last piece may be a partial line
+        yield from lines
+    if tail: yield tail
+
+
+def iter_records(path, report=None, chunk_size=CHUNK_SIZE):
+    """
+    Streams validated (id, name, cw, exam) records from a marks file.
+    The first line is the student count header. Bad lines and duplicate IDs are
+    sent to report (if given) and skipped.
+    """
+    seen = IdSet()
+    with open(path, "r") as f:
+        lines = iter_lines(f, chunk_size)
+        header = next(lines, "").strip()
+        if report is not None and header.isdigit(): report.expected = int(header)
+        for line_no, line in enumerate(lines, start=2):
+            if not line.strip(): continue
+            try:
+                rec = parse_line(line)
+                if not seen.add(rec[0]): raise ValueError(f"duplicate ID {rec[0]}")
+            except ValueError as e:
+                if report is not None: report.add(line_no, line.rstrip("\r"), str(e))
+                continue
+            if report is not None: report.loaded += 1
+            yield rec
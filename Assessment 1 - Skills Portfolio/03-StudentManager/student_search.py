@@ -0,0 +1,263 @@
+"""
+STUDENT SEARCH INDEX
+-------------------
+Answers the dashboard search box ("q in name.lower() or q in str(id)") without
+scanning every student on every keystroke.
+
+HOW IT WORKS:
+- Rows are grouped by distinct key: lower-cased names and ID strings.
+- Every key is cut into 1-, 2- and 3-character grams. Each gram keeps a posting
+  list of the keys that contain it plus the number of rows behind them, so a
+  short query knows its exact result size without touching a single row.
+- Longer queries only verify the keys listed under their rarest trigram. Typing
+  usually extends the previous query, and any key containing the new query also
+  contains the old one, so the previous matches are narrowed instead.
+- Narrow results are gathered from the per-key row lists. Broad results come
+  back as a lazy Matches sequence that only finds the rows the table reads.
+- Results are always in the store's display order.
+- The index listens to the store, so add/edit/delete update it in place.
+"""
+
+from array import array
+from bisect import insort
+import threading
+
+
+def grams_of(key):
+    """Distinct grams of length 1-3 in a key."""
+    return {key[a:a + n] for n in (1, 2, 3) for a in range(len(key) - n + 1)}
+
+
+class Matches:
+    """
+    Lazy, display-ordered sequence of matching rows with an exact length.
+    Rows are located chunk by chunk as positions are read, so showing the first
+    page of a 200k-row result only scans a few hundred rows.
+    """
+    def __init__(self, order, test, count):
+        self.order = order     # Row indices in display order
+        self.test = test       # Row predicate
+        self.count = count
+        self.found = []
+        self.pos = 0           # Next position in self.order to scan
+
+    def __len__(self):
+        return self.count
+
+    def _fill(self, upto):
+        order, test, found = self.order, self.test, self.found
+        n = len(order)
+        density = max(self.count / n, 1e-6) if n else 1
+        while len(found) <= upto and self.pos < n:
+            need = upto - len(found) + 1
+            end = min(n, self.pos + int(need / density * 1.25) + 64)
+            found.extend([i for i in order[self.pos:end] if test(i)])
+            self.pos = end
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            self._fill(self.count if k.stop is None or k.stop < 0 else k.stop - 1)
+            return self.found[k]
+        if k < 0: k += self.count
+        if not 0 <= k < self.count: raise IndexError(k)
+        self._fill(k)
+        return self.found[k]
+
+    def __iter__(self):
+        self._fill(self.count)
+        return iter(self.found)
+
+
+class KeyIndex:
+    """Distinct string keys, the rows behind each key, and gram posting lists."""
+    def __init__(self, row_keys):
+        self.keys = []           # key id -> key string
+        self.key_ids = {}        # key string -> key id
+        self.counts = []         # key id -> number of rows
+        self.grams = {}          # gram -> key ids containing it
+        self.gram_rows = {}      # gram -> number of rows whose key contains it
+        self.row_key = array('i', map(self.key_id, row_keys)) # store row -> key id
+        for kid in self.row_key:
+            self.counts[kid] += 1
+        counts = self.counts
+        self.gram_rows = {g: sum(map(counts.__getitem__, p)) for g, p in self.grams.items()}
+        self._group()
+
+    def key_id(self, key):
+        kid = self.key_ids.get(key)
+        if kid is None:
+            kid = self.key_ids[key] = len(self.keys)
+            self.keys.append(key)
+            self.counts.append(0)
+            grams = self.grams
+            for gram in grams_of(key):
+                posting = grams.get(gram)
+                if posting is None: grams[gram] = [kid]
+                else: posting.append(kid)
+        return kid
+
+    def _group(self):
+        """Per-key ascending row lists, cut from one stable sort of row_key."""
+        row_key = self.row_key
+        order = sorted(range(len(row_key)), key=row_key.__getitem__)
+        self._rows, start = [], 0
+        for n in self.counts:
+            self._rows.append(order[start:start + n])
+            start += n
+
+    def rows(self, kid):
+        """Ascending store rows behind a key."""
+        if self._rows is None:
+            self._group()
+        return self._rows[kid]
+
+    # --- INCREMENTAL MAINTENANCE ---
+    def _count(self, kid, delta):
+        self.counts[kid] += delta
+        gram_rows = self.gram_rows
+        for gram in grams_of(self.keys[kid]):
+            gram_rows[gram] = gram_rows.get(gram, 0) + delta
+
+    def add_row(self, i, key):
+        kid = self.key_id(key)
+        self.row_key.append(kid)
+        self._count(kid, 1)
+        if self._rows is not None:
+            if kid == len(self._rows): self._rows.append([])
+            self._rows[kid].append(i)
+
+    def change_row(self, i, key):
+        old, kid = self.row_key[i], self.key_id(key)
+        if old == kid: return
+        self.row_key[i] = kid
+        self._count(old, -1)
+        self._count(kid, 1)
+        if self._rows is not None:
+            if kid == len(self._rows): self._rows.append([])
+            self._rows[old].remove(i)
+            insort(self._rows[kid], i)
+
+    def remove_row(self, i):
+        self._count(self.row_key[i], -1)
+        del self.row_key[i]
+        self._rows = None # Later rows shift down by one; regroup on next use
+
+    # --- QUERIES ---
+    def search(self, q, within=None):
+        """Key ids whose key contains q. within = previous candidate keys to narrow."""
+        if len(q) <= 3:
+            return self.grams.get(q, []) # Posting lists are exact for short grams
+        keys = self.keys
+        trigrams = (q[a:a + 3] for a in range(len(q) - 2))
+        candidates = min((self.grams.get(g, []) for g in trigrams), key=len)
+        if within is not None and len(within) < len(candidates):
+            candidates = within
+        return [k for k in candidates if q in keys[k]]
+
+    def size(self, q, kids):
+        """Number of rows behind a key list returned by search(q)."""
+        if len(q) <= 3:
+            return self.gram_rows.get(q, 0)
+        counts = self.counts
+        return sum(map(counts.__getitem__, kids))
+
+
+class SearchIndex:
+    """
+    Search index over a StudentStore.
+    Built on first search, then kept current through the store's listener hooks.
+    Safe to query from a worker thread: queries and hooks share one lock.
+    """
+    def __init__(self, store):
+        self.store = store
+        self.lock = threading.RLock()
+        self.names = self.ids = None
+        self.last_q = None
+        self.last_hits = None   # (name key ids, id key ids) for last_q
+        store.listeners.append(self)
+
+    def rebuild(self):
+        store = self.store
+        self.names = KeyIndex(name.lower() for name in store.names)
+        self.ids = KeyIndex(map(str, store.ids))
+        self.last_q = self.last_hits = None
+
+    # --- STORE LISTENER HOOKS ---
+    def on_reset(self):
+        with self.lock:
+            self.names = self.ids = None
+            self.last_q = self.last_hits = None
+
+    def on_append(self, i):
+        with self.lock:
+            if self.names is None: return
+            self.names.add_row(i, self.store.names[i].lower())
+            self.ids.add_row(i, str(self.store.ids[i]))
+            self.last_hits = None
+
+    def on_update(self, i, old):
+        with self.lock:
+            if self.names is None: return
+            self.names.change_row(i, self.store.names[i].lower())
+            self.last_hits = None
+
+    def on_remove(self, i, old):
+        with self.lock:
+            if self.names is None: return
+            self.names.remove_row(i)
+            self.ids.remove_row(i)
+            self.last_hits = None
+
+    # --- QUERIES ---
+    def search(self, q):
+        """Store rows matching q, in display order."""
+        with self.lock:
+            return self._search(q)
+
+    def _search(self, q):
+        if self.names is None:
+            self.rebuild()
+        q = q.lower()
+        if not q:
+            self.last_q, self.last_hits = q, None
+            return self.store.rows()
+
+        if self.last_hits is not None and self.last_q in q:
+            within_names, within_ids = self.last_hits # Narrow the previous result
+        else:
+            within_names = within_ids = None
+        hits = (self.names.search(q, within_names), self.ids.search(q, within_ids))
+        self.last_q, self.last_hits = q, hits
+        return self.collect(q, *hits)
+
+    def collect(self, q, name_keys, id_keys):
+        """Expands matched keys to store rows in display order."""
+        store = self.store
+        names, ids = self.names, self.ids
+        count = names.size(q, name_keys) + ids.size(q, id_keys)
+        if count == 0:
+            return []
+
+        if name_keys and id_keys:
+            # A row can match on both name and ID: count exactly by de-duplicating
+            both = set()
+            for k in name_keys: both.update(names.rows(k))
+            for k in id_keys: both.update(ids.rows(k))
+            count = len(both)
+
+        if count * 8 > len(store):
+            # Broad query: rows are dense, find them lazily in display order
+            nkeys, nkey, ikeys, ikey = names.keys, names.row_key, ids.keys, ids.row_key
+            test = lambda i: q in nkeys[nkey[i]] or q in ikeys[ikey[i]]
+            return Matches(store.rows(), test, count)
+
+        # Narrow query: gather the few matching rows, then order them
+        found = []
+        for k in name_keys: found.extend(names.rows(k))
+        for k in id_keys: found.extend(ids.rows(k))
+        if name_keys and id_keys: found = list(set(found))
+        if store.view is None:
+            found.sort()
+        else:
+            found.sort(key=store.rank().__getitem__)
+        return found
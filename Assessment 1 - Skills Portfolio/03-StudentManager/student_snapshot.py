@@ -0,0 +1,191 @@
+"""
+BINARY STUDENT SNAPSHOT
+-------------------
+Optional fast-start copy of studentMarks.txt (studentMarks.bin) that can be
+memory-mapped instead of parsed. The text file stays the interchange format;
+the snapshot is rebuilt whenever the text file changes.
+
+FILE LAYOUT (little-endian):
+- Header (40 bytes): magic b"SMKB", version, record size, record count,
+  name heap offset/size, and the source text file's size + mtime (staleness check)
+- Record table: `count` fixed-width records of RECORD_FMT
+    id, name offset, name length, cw1, cw2, cw3, exam, cw_total, total, perc10, grade
+- Name heap: UTF-8 names joined by newlines, in record order
+
+LOADING:
+- The app copies the mapped columns into its StudentStore (load_into) rather
+  than serving rows from the mapping. The store is edited in place, keeps
+  hash and sorted indexes, and feeds the aggregates, so it needs arrays it
+  owns. The copy is one column transpose with no text parsing, which is what
+  removes the startup cost.
+- Read-only paths (export) stream records lazily with record(i) and never
+  build a store.
+
+USAGE:
+  python student_snapshot.py import studentMarks.txt [studentMarks.bin]
+  python student_snapshot.py export studentMarks.bin [studentMarks.txt]
+"""
+
+import argparse
+from array import array
+import mmap
+import os
+import struct
+
+from student_loader import iter_records
+from student_store import derive
+
+MAGIC = b"SMKB"
+VERSION = 1
+HEADER_FMT = "<4sHHIQQQq"   # magic, version, record size, count, heap offset, heap size, src size, src mtime_ns
+RECORD_FMT = "<iIHBBBBBHHc"  # id, name off, name len, cw1-3, exam, cw_total, total, perc10, grade
+HEADER_SIZE = struct.calcsize(HEADER_FMT)
+RECORD_SIZE = struct.calcsize(RECORD_FMT)
+
+
+def snapshot_path(text_path):
+    return os.path.splitext(text_path)[0] + ".bin"
+
+
+def source_stamp(text_path):
+    st = os.stat(text_path)
+    return st.st_size, st.st_mtime_ns
+
+
+# --- WRITING ---
+
+def write_snapshot(records, bin_path, stamp=(0, 0)):
+    """Writes (id, name, cw, exam) records to a snapshot file (temp file + os.replace)."""
+    table, names, heap_size = bytearray(), [], 0
+    for sid, name, cw, ex in records:
+        encoded = name.encode("utf-8")
+        cw_t, ovr, p10, gd = derive(cw, ex)
+        table += struct.pack(RECORD_FMT, sid, heap_size, len(encoded), cw[0], cw[1], cw[2], ex,
+                             cw_t, ovr, p10, gd.encode())
+        names.append(encoded)
+        heap_size += len(encoded) + 1 # + newline separator
+    heap = b"\n".join(names) + (b"\n" if names else b"")
+    count = len(table) // RECORD_SIZE
+    header = struct.pack(HEADER_FMT, MAGIC, VERSION, RECORD_SIZE, count,
+                         HEADER_SIZE + len(table), len(heap), *stamp)
+    tmp = bin_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(header); f.write(table); f.write(heap)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, bin_path)
+    return count
+
+
+def import_text(text_path, bin_path=None, report=None):
+    """studentMarks.txt -> snapshot. Returns the number of records written."""
+    bin_path = bin_path or snapshot_path(text_path)
+    stamp = source_stamp(text_path)
+    return write_snapshot(iter_records(text_path, report), bin_path, stamp)
+
+
+def export_text(bin_path, text_path):
+    """Snapshot -> studentMarks.txt format, streamed record by record from the mapping."""
+    tmp = text_path + ".tmp"
+    with Snapshot(bin_path) as snap, open(tmp, "w") as f:
+        f.write(f"{len(snap)}\n")
+        for sid, name, cw, ex in map(snap.record, range(len(snap))):
+            f.write(f"{sid},{name},{cw[0]},{cw[1]},{cw[2]},{ex}\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, text_path)
+    return len(snap)
+
+
+# --- READING ---
+
+class Snapshot:
+    """
+    Read-only, memory-mapped view of a snapshot file.
+    record(i) decodes a single record straight from the mapping; load_into()
+    fills a StudentStore column by column without any text parsing.
+    """
+    def __init__(self, bin_path):
+        self.file = open(bin_path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, rec_size, self.count, self.heap_off, self.heap_size,
+         src_size, src_mtime) = struct.unpack_from(HEADER_FMT, self.map, 0)
+        if magic != MAGIC or version != VERSION or rec_size != RECORD_SIZE:
+            self.close()
+            raise ValueError(f"{bin_path} is not a version {VERSION} student snapshot")
+        self.stamp = (src_size, src_mtime)
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.map: self.map.close()
+        self.file.close()
+        self.map = None
+
+    def record(self, i):
+        """(id, name, [cw1, cw2, cw3], exam) for record i, decoded lazily from the mapping."""
+        sid, off, ln, c1, c2, c3, ex, *_ = struct.unpack_from(RECORD_FMT, self.map, HEADER_SIZE + i * RECORD_SIZE)
+        start = self.heap_off + off
+        return sid, self.map[start:start + ln].decode("utf-8"), [c1, c2, c3], ex
+
+    def load_into(self, store):
+        """
+        Replaces store contents with every record (bulk column transpose, no parsing).
+        This is a copy: the store must own its columns to be edited and indexed.
+        """
+        if not self.count:
+            store.clear()
+            return
+        with memoryview(self.map) as view:
+            table = view[HEADER_SIZE:HEADER_SIZE + self.count * RECORD_SIZE]
+            cols = list(zip(*struct.iter_unpack(RECORD_FMT, table)))
+            table.release()
+        heap = self.map[self.heap_off:self.heap_off + self.heap_size].decode("utf-8")
+        names = heap.split("\n")[:self.count]
+        store.set_columns(ids=array('i', cols[0]), names=names,
+                          cw1=array('b', cols[3]), cw2=array('b', cols[4]), cw3=array('b', cols[5]),
+                          exam=array('h', cols[6]), cw_total=array('h', cols[7]), total=array('h', cols[8]),
+                          perc10=array('h', cols[9]), grade=bytearray(b"".join(cols[10])))
+
+
+def is_fresh(text_path, bin_path=None):
+    """True if the snapshot exists and was built from the current text file."""
+    bin_path = bin_path or snapshot_path(text_path)
+    try:
+        with Snapshot(bin_path) as snap:
+            return snap.stamp == source_stamp(text_path)
+    except (OSError, ValueError, struct.error):
+        return False
+
+
+def load_fresh(store, text_path):
+    """Loads the snapshot into store if it is up to date. Returns True on success."""
+    bin_path = snapshot_path(text_path)
+    if not is_fresh(text_path, bin_path): return False
+    with Snapshot(bin_path) as snap:
+        snap.load_into(store)
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert between studentMarks.txt and the binary snapshot")
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", help="text -> binary snapshot")
+    imp.add_argument("text"); imp.add_argument("bin", nargs="?")
+    exp = sub.add_parser("export", help="binary snapshot -> text")
+    exp.add_argument("bin"); exp.add_argument("text", nargs="?")
+    args = parser.parse_args()
+    if args.command == "import":
+        n = import_text(args.text, args.bin)
+        print(f"Imported {n} students into {args.bin or snapshot_path(args.text)}")
+    else:
+        text = args.text or os.path.splitext(args.bin)[0] + ".txt"
+        n = export_text(args.bin, text)
+        print(f"Exported {n} students to {text}")
@@ -0,0 +1,343 @@
+"""
+SQLITE STUDENT BACKEND
+-------------------
+Optional storage backend (BACKEND = "sqlite" in 03-StudentManager.py) that keeps
+the cohort in studentMarks.db instead of in memory, so cohorts bigger than RAM
+still open instantly. It offers the same methods the dashboard calls on
+StudentStore, but rows are addressed by student ID instead of by position.
+
+HOW IT WORKS:
+- One `students` table (id is the INTEGER PRIMARY KEY) plus indexes on
+  (name, id) and (total DESC, id), in WAL mode so the search worker can read
+  while the Tk thread writes.
+- Every query is a fixed parameterized SQL string, so sqlite3's statement
+  cache prepares each one once.
+- rows() and search() return SqlRows: a lazy sequence that knows its length
+  from COUNT(*) and fetches the table a page at a time with LIMIT/OFFSET in
+  index order, so the table only ever holds a screenful.
+- Sorting, highest/lowest, the stat cards and the chart are single indexed or
+  aggregate queries.
+- Searches of 3+ characters use an FTS5 trigram index (kept in sync by
+  triggers); shorter ones fall back to a scan. That scan lower-cases names
+  with Python's str.lower (registered as py_lower), since SQLite's lower()
+  only folds ASCII, so both backends match "é" in "ÉMILE".
+- Imports (clear() ... finish_import()) load the bare table first and build the
+  secondary indexes, trigram index and triggers once at the end.
+- studentMarks.txt stays the interchange format: it is re-imported when it
+  changes, and `python student_sqlite.py import|export` converts either way.
+"""
+
+import argparse
+from contextlib import contextmanager
+import os
+import sqlite3
+import threading
+
+from student_grading import GRADES
+from student_loader import iter_records
+from student_store import derive
+
+PAGE_ROWS = 256     # Rows fetched per LIMIT/OFFSET query
+CACHE_ROWS = 8192   # Display rows kept between page fetches
+
+TABLES = """
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY, name TEXT NOT NULL,
+    cw1 INTEGER NOT NULL, cw2 INTEGER NOT NULL, cw3 INTEGER NOT NULL, exam INTEGER NOT NULL,
+    cw_total INTEGER NOT NULL, total INTEGER NOT NULL, perc10 INTEGER NOT NULL, grade TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE VIRTUAL TABLE IF NOT EXISTS students_fts USING fts5(name, sid, tokenize='trigram');
+"""
+
+# Built after a bulk import (3x faster than maintaining them row by row)
+SECONDARY = [
+    "CREATE INDEX IF NOT EXISTS students_name ON students(name, id)",
+    "CREATE INDEX IF NOT EXISTS students_total ON students(total DESC, id)",
+    """CREATE TRIGGER IF NOT EXISTS students_ai AFTER INSERT ON students BEGIN
+        INSERT INTO students_fts(rowid, name, sid) VALUES (new.id, new.name, new.id); END""",
+    """CREATE TRIGGER IF NOT EXISTS students_ad AFTER DELETE ON students BEGIN
+        DELETE FROM students_fts WHERE rowid = old.id; END""",
+    """CREATE TRIGGER IF NOT EXISTS students_au AFTER UPDATE OF name ON students BEGIN
+        UPDATE students_fts SET name = new.name WHERE rowid = old.id; END""",
+]
+
+ORDERS = {None: "id", 'score': "total DESC, id", 'name': "name, id"}
+INSERT = "INSERT INTO students VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+DISPLAY_COLS = "id, name, cw_total, exam, perc10, grade"
+
+
+def db_path(text_path):
+    return os.path.splitext(text_path)[0] + ".db"
+
+
+def _record(sid, name, cw, exam):
+    cw_t, ovr, p10, gd = derive(cw, exam)
+    return (int(sid), name, cw[0], cw[1], cw[2], exam, cw_t, ovr, p10, gd)
+
+
+class SqlRows:
+    """Lazy, display-ordered student IDs for one query, fetched page by page."""
+    def __init__(self, store, where="", params=()):
+        self.store = store
+        self.where = where
+        self.params = params
+        self.order = ORDERS[store.sort_key]
+        self.count = None
+        self.pages = {}
+
+    def __len__(self):
+        if self.count is None:
+            self.count = self.store._scalar(f"SELECT COUNT(*) FROM students {self.where}", self.params)
+        return self.count
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[j] for j in range(*k.indices(len(self)))]
+        if k < 0: k += len(self)
+        if not 0 <= k < len(self): raise IndexError(k)
+        page = self.pages.get(k // PAGE_ROWS)
+        if page is None:
+            page = self.pages[k // PAGE_ROWS] = self.store._page(self, k // PAGE_ROWS * PAGE_ROWS)
+        return page[k % PAGE_ROWS]
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+
+
+class SqliteStore:
+    """SQLite-backed counterpart of StudentStore (row handles are student IDs)."""
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.lock = threading.RLock() # One connection, shared by the Tk thread and search worker
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.create_function("py_lower", 1, str.lower, deterministic=True) # Same folding as StudentStore
+        self.conn.executescript(TABLES)
+        for stmt in SECONDARY: self.conn.execute(stmt)
+        self.sort_key = None
+        self.cache = {}           # id -> display tuple, filled by page fetches
+        self._batching = False
+
+    def close(self):
+        with self.lock: self.conn.close()
+
+    # --- SQL HELPERS ---
+    def _scalar(self, sql, params=()):
+        with self.lock:
+            return self.conn.execute(sql, params).fetchone()[0]
+
+    def _page(self, rows, offset):
+        sql = f"SELECT {DISPLAY_COLS} FROM students {rows.where} ORDER BY {rows.order} LIMIT ? OFFSET ?"
+        with self.lock:
+            fetched = self.conn.execute(sql, (*rows.params, PAGE_ROWS, offset)).fetchall()
+        if len(self.cache) > CACHE_ROWS: self.cache.clear()
+        for values in fetched: self.cache[values[0]] = values
+        return [values[0] for values in fetched]
+
+    def _display(self, i):
+        values = self.cache.get(i)
+        if values is None:
+            with self.lock:
+                values = self.conn.execute(f"SELECT {DISPLAY_COLS} FROM students WHERE id = ?", (i,)).fetchone()
+            self.cache[i] = values
+        return values
+
+    def _write(self, sid, sql, params):
+        """One autocommitted change (or part of the open batch) to student sid."""
+        with self.lock:
+            self.conn.execute(sql, params)
+        self.cache.pop(sid, None)
+
+    # --- MUTATION ---
+    @contextmanager
+    def batch(self):
+        """Bulk changes in a single transaction."""
+        with self.lock:
+            self._batching = True
+            self.conn.execute("BEGIN")
+            try:
+                yield self
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            finally:
+                self._batching = False
+
+    def clear(self):
+        """Empties the database for an import; call finish_import() once the rows are in."""
+        with self.lock: # Dropping is much faster than deleting row by row through the triggers
+            self.conn.executescript("DROP TABLE IF EXISTS students; DROP TABLE IF EXISTS students_fts; "
+                                    "DELETE FROM meta;" + TABLES)
+        self.cache.clear()
+        self.sort_key = None
+
+    def finish_import(self, stamp):
+        """Builds the secondary indexes and search index, then records which text file was imported."""
+        with self.batch():
+            for stmt in SECONDARY: self.conn.execute(stmt)
+            self.conn.execute("INSERT INTO students_fts(rowid, name, sid) SELECT id, name, id FROM students")
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('source', ?)", (stamp,))
+
+    def append(self, sid, name, cw, exam):
+        rec = _record(sid, name, cw, exam)
+        self._write(rec[0], INSERT, rec)
+        return rec[0]
+
+    def extend(self, records):
+        with self.lock:
+            if self._batching:
+                self.conn.executemany(INSERT, (_record(*r) for r in records))
+            else:
+                with self.batch(): self.extend(records)
+
+    def update(self, i, name, cw, exam):
+        rec = _record(i, name, cw, exam)
+        self._write(i, "UPDATE students SET name=?, cw1=?, cw2=?, cw3=?, exam=?, cw_total=?, total=?, "
+                    "perc10=?, grade=? WHERE id=?", (*rec[1:], rec[0]))
+
+    def remove(self, i):
+        self._write(i, "DELETE FROM students WHERE id=?", (i,))
+
+    def sort_by(self, key):
+        self.sort_key = 'score' if key == 'score' else 'name'
+
+    # --- ACCESS ---
+    def __len__(self):
+        return self._scalar("SELECT COUNT(*) FROM students")
+
+    def find(self, sid):
+        """The student's row handle (its ID) if present, else None."""
+        try:
+            sid = int(sid)
+        except ValueError:
+            return None
+        return sid if self.has_row(sid) else None
+
+    def has_row(self, i):
+        return self._scalar("SELECT EXISTS(SELECT 1 FROM students WHERE id = ?)", (i,)) == 1
+
+    def perc(self, i):
+        return self._display(i)[4] / 10
+
+    def grade_of(self, i):
+        return self._display(i)[5]
+
+    def row(self, i):
+        with self.lock:
+            r = self.conn.execute("SELECT * FROM students WHERE id = ?", (i,)).fetchone()
+        return {"id": r[0], "name": r[1], "cw": [r[2], r[3], r[4]], "exam": r[5],
+                "cw_total": r[6], "total": r[7], "perc": r[8] / 10, "grade": r[9]}
+
+    def table_values(self, i):
+        sid, name, cw_t, exam, p10, gd = self._display(i)
+        return (sid, name, f"{cw_t}", f"{exam}", f"{p10 / 10}%", gd)
+
+    def rows(self):
+        """All students in display order (lazy)."""
+        return SqlRows(self)
+
+    def records(self):
+        """(id, name, cw, exam) for every student in display order, streamed a page at a time."""
+        with self.lock:
+            cur = self.conn.execute(f"SELECT id, name, cw1, cw2, cw3, exam FROM students "
+                                    f"ORDER BY {ORDERS[self.sort_key]}")
+        while True:
+            with self.lock: page = cur.fetchmany(PAGE_ROWS)
+            if not page: return
+            for sid, name, c1, c2, c3, ex in page:
+                yield sid, name, [c1, c2, c3], ex
+
+    # --- QUERIES ---
+    def search(self, q):
+        """Students whose name or ID contains q, in display order (same rule as SearchIndex)."""
+        q = q.lower()
+        if not q:
+            return self.rows()
+        if len(q) >= 3: # Trigram index
+            return SqlRows(self, "WHERE id IN (SELECT rowid FROM students_fts WHERE students_fts MATCH ?)",
+                           ('"' + q.replace('"', '""') + '"',))
+        return SqlRows(self, "WHERE instr(py_lower(name), ?) OR instr(CAST(id AS TEXT), ?)", (q, q))
+
+    def grade_counts(self, rows=None):
+        where, params = (rows.where, rows.params) if rows is not None else ("", ())
+        counts = dict.fromkeys(GRADES, 0)
+        with self.lock:
+            for gd, n in self.conn.execute(f"SELECT grade, COUNT(*) FROM students {where} GROUP BY grade", params):
+                counts[gd] = n
+        return counts
+
+    def summary(self, rows=None, cancelled=None):
+        """(count, average %, top performer ID or None, grade counts), as aggregate queries."""
+        if rows is None: rows = self.rows()
+        if cancelled and cancelled(): return None
+        with self.lock:
+            count, p10_sum = self.conn.execute(
+                f"SELECT COUNT(*), TOTAL(perc10) FROM students {rows.where}", rows.params).fetchone()
+            top = self.conn.execute(
+                f"SELECT id FROM students {rows.where} ORDER BY total DESC, id LIMIT 1", rows.params).fetchone()
+        rows.count = count
+        if count == 0:
+            return 0, 0, None, dict.fromkeys(GRADES, 0)
+        return count, round(p10_sum / count / 10, 1), top[0], self.grade_counts(rows)
+
+    def highest(self):
+        with self.lock:
+            r = self.conn.execute("SELECT id FROM students ORDER BY total DESC, id LIMIT 1").fetchone()
+        return r and r[0]
+
+    def lowest(self):
+        with self.lock:
+            r = self.conn.execute("SELECT id FROM students ORDER BY total, id LIMIT 1").fetchone()
+        return r and r[0]
+
+    # --- TEXT INTERCHANGE ---
+    def source_stamp(self):
+        with self.lock:
+            r = self.conn.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+        return r and r[0]
+
+    def load_file(self, path, report=None):
+        """Replaces the table with the valid records of a marks file."""
+        self.clear()
+        with self.batch():
+            self.extend(iter_records(path, report))
+        self.finish_import(text_stamp(path))
+
+    def save_file(self, path):
+        """Exports to studentMarks.txt format (temp file + os.replace)."""
+        tmp = path + ".tmp"
+        with self.lock, open(tmp, "w") as f:
+            f.write(f"{len(self)}\n")
+            for r in self.conn.execute("SELECT id, name, cw1, cw2, cw3, exam FROM students ORDER BY id"):
+                f.write(",".join(map(str, r)) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+
+def text_stamp(text_path):
+    """Size + mtime of the text file the database was imported from."""
+    st = os.stat(text_path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert between studentMarks.txt and studentMarks.db")
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", help="text -> database")
+    imp.add_argument("text"); imp.add_argument("db", nargs="?")
+    exp = sub.add_parser("export", help="database -> text")
+    exp.add_argument("db"); exp.add_argument("text")
+    args = parser.parse_args()
+    if args.command == "import":
+        store = SqliteStore(args.db or db_path(args.text))
+        store.load_file(args.text)
+        print(f"Imported {len(store)} students into {store.path}")
+    else:
+        store = SqliteStore(args.db)
+        store.save_file(args.text)
+        print(f"Exported {len(store)} students to {args.text}")
+    store.close()
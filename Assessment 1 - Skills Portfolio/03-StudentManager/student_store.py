@@ -0,0 +1,335 @@
+"""
+STUDENT STORE (Columnar Data Layer)
+-------------------
+Keeps every student as one slot in a set of parallel typed arrays instead of
+one dict per student. A cohort of 500k students costs a few megabytes rather
+than gigabytes, and whole-column scans (grade counts, sorting, max/min) run
+over compact C arrays.
+
+LAYOUT:
+- ids                 -> array('i')   Student code (1000-9999)
+- cw1, cw2, cw3       -> array('b')   Coursework marks (0-20)
+- exam                -> array('h')   Exam mark (0-100)
+- cw_total, total     -> array('h')   Derived totals (/60 and /160)
+- perc10              -> array('h')   Percentage in tenths (55.6% -> 556)
+- grade               -> bytearray    Grade letter as a byte (b'A' ... b'F')
+- names               -> list         Interned name strings
+- seqs                -> array('q')   Stable row identity, ascending (rows never reorder)
+
+INDEXES (student_indexes.py, maintained on every change):
+- by_id               -> IdIndex      find() by student code in O(1) + O(log N)
+- sorted['score'/'name'] -> SortedIndex  Sorted views; the active one is `view`
+"""
+
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+from itertools import islice
+import os
+import sys
+
+from student_loader import iter_records
+from student_indexes import IdIndex, SortedIndex
+import student_grading as grading
+from student_grading import GRADES, MAX_TOTAL, PERC10_BY_TOTAL, GRADE_BY_TOTAL
+
+SUMMARY_CHUNK = 65536 # Rows per step in summary(), between cancellation checks
+EXTEND_CHUNK = 65536  # Records gathered per step in load_file()
+
+
+def derive(cw, exam):
+    """Returns (cw_total, total, perc10, grade) for a single set of marks."""
+    cw_t = cw[0] + cw[1] + cw[2]
+    ovr = cw_t + exam
+    return cw_t, ovr, PERC10_BY_TOTAL[ovr], chr(GRADE_BY_TOTAL[ovr])
+
+
+class StudentStore:
+    """
+    Column-oriented container for student records.
+    Rows are addressed by position; row(i) rebuilds the classic record dict
+    for code paths (forms, dialogs) that still want one. Sorting only switches
+    `view` to a maintained SortedIndex, the columns themselves never move.
+
+    Indexes subscribe through `listeners` and are told about every change:
+    on_reset(), on_append(i), on_update(i, old) and on_remove(i, old), where
+    old is the row(i) dict from before the change.
+    """
+    def __init__(self):
+        self.version = 0 # Bumped on every content change so indexes know to refresh
+        self._batching = False
+        self.by_id = IdIndex(self)
+        self.sorted = {
+            'score': SortedIndex(self, lambda i: -self.total[i], lambda old: -old['total'], self._score_order),
+            'name': SortedIndex(self, lambda i: self.names[i], lambda old: old['name']),
+        }
+        self.listeners = [self.by_id, *self.sorted.values()] # Own indexes update first
+        self.clear()
+
+    def _notify(self, event, *args):
+        self.version += 1
+        if not self._batching:
+            for listener in self.listeners:
+                getattr(listener, event)(*args)
+        else:
+            getattr(self.by_id, event)(*args) # find() must see rows added/removed inside the batch
+
+    @contextmanager
+    def batch(self):
+        """
+        Bulk changes: listeners get one on_reset() at the end instead of per-row events.
+        The ID index is the exception and stays current, so find() works inside the batch.
+        """
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            self._notify("on_reset")
+
+    def clear(self):
+        self.ids = array('i')
+        self.names = []
+        self.cw1 = array('b')
+        self.cw2 = array('b')
+        self.cw3 = array('b')
+        self.exam = array('h')
+        self.cw_total = array('h')
+        self.total = array('h')
+        self.perc10 = array('h')
+        self.grade = bytearray()
+        self.seqs = array('q')
+        self.next_seq = 0
+        self.sort_key = None # None = insertion order
+        self._rank = None
+        self._notify("on_reset")
+
+    def set_columns(self, ids, names, cw1, cw2, cw3, exam, cw_total, total, perc10, grade):
+        """Replaces every column at once (bulk loaders that already hold typed columns)."""
+        self.ids, self.names = ids, list(map(sys.intern, names))
+        self.cw1, self.cw2, self.cw3, self.exam = cw1, cw2, cw3, exam
+        self.cw_total, self.total, self.perc10, self.grade = cw_total, total, perc10, grade
+        self.seqs = array('q', range(len(ids)))
+        self.next_seq = len(ids)
+        self.sort_key = None
+        self._rank = None
+        self._notify("on_reset")
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _columns(self):
+        return (self.ids, self.names, self.cw1, self.cw2, self.cw3, self.exam,
+                self.cw_total, self.total, self.perc10, self.grade, self.seqs)
+
+    @property
+    def view(self):
+        """Display order as an array of rows, or None for insertion order."""
+        return None if self.sort_key is None else self.sorted[self.sort_key].order
+
+    def row_of_seq(self, seq):
+        """Current row of a sequence number, or None if that row was deleted."""
+        i = bisect_left(self.seqs, seq)
+        return i if i < len(self.seqs) and self.seqs[i] == seq else None
+
+    # --- MUTATION ---
+    def append(self, sid, name, cw, exam):
+        """Adds a student and returns its row index."""
+        cw_t, ovr, p10, gd = derive(cw, exam)
+        self.ids.append(int(sid))
+        self.names.append(sys.intern(name))
+        self.cw1.append(cw[0]); self.cw2.append(cw[1]); self.cw3.append(cw[2])
+        self.exam.append(exam)
+        self.cw_total.append(cw_t)
+        self.total.append(ovr)
+        self.perc10.append(p10)
+        self.grade.append(ord(gd))
+        self.seqs.append(self.next_seq)
+        self.next_seq += 1
+        i = len(self.ids) - 1
+        self._notify("on_append", i)
+        return i
+
+    def extend(self, records):
+        """
+        Bulk append of (id, name, cw, exam) records. Derived columns come from one
+        grading.grade_columns() pass instead of derive() per row.
+        """
+        cols = list(zip(*records))
+        if not cols: return
+        start = len(self)
+        sids, names, cws, exams = cols
+        self.ids.extend(sids)
+        self.names.extend(map(sys.intern, names))
+        cw1, cw2, cw3 = array('b', [c[0] for c in cws]), array('b', [c[1] for c in cws]), array('b', [c[2] for c in cws])
+        exam = array('h', exams)
+        cw_t, total, p10, grade = grading.grade_columns(cw1, cw2, cw3, exam)
+        self.cw1.extend(cw1); self.cw2.extend(cw2); self.cw3.extend(cw3)
+        self.exam.extend(exam)
+        self.cw_total.extend(cw_t)
+        self.total.extend(total)
+        self.perc10.extend(p10)
+        self.grade.extend(grade)
+        self.seqs.extend(range(self.next_seq, self.next_seq + len(exam)))
+        self.next_seq += len(exam)
+        for i in range(start, len(self)):
+            self._notify("on_append", i)
+
+    def update(self, i, name, cw, exam):
+        old = self.row(i) if self.listeners else None
+        cw_t, ovr, p10, gd = derive(cw, exam)
+        self.names[i] = sys.intern(name)
+        self.cw1[i], self.cw2[i], self.cw3[i] = cw
+        self.exam[i] = exam
+        self.cw_total[i] = cw_t
+        self.total[i] = ovr
+        self.perc10[i] = p10
+        self.grade[i] = ord(gd)
+        self._notify("on_update", i, old)
+
+    def remove(self, i):
+        old = self.row(i) if self.listeners else None
+        for col in self._columns():
+            del col[i]
+        self._notify("on_remove", i, old)
+
+    def sort_by(self, key):
+        """Switches the view: 'score' -> total descending, anything else -> name (ties: insertion order)."""
+        self.sort_key = 'score' if key == 'score' else 'name'
+
+    def _score_order(self):
+        """Builds the score index: totals are bounded (0-160), so a counting sort beats sorted()."""
+        buckets = [[] for _ in range(MAX_TOTAL + 1)]
+        total = self.total
+        for i in range(len(self)):
+            buckets[total[i]].append(i)
+        order = array('i')
+        for b in reversed(buckets):
+            order.extend(b)
+        return order
+
+    # --- ACCESS ---
+    def find(self, sid):
+        """Row index of a student code, or None."""
+        try:
+            return self.by_id.row(int(sid))
+        except ValueError:
+            return None
+
+    def has_row(self, i):
+        return 0 <= i < len(self)
+
+    def perc(self, i):
+        return self.perc10[i] / 10
+
+    def grade_of(self, i):
+        return chr(self.grade[i])
+
+    def row(self, i):
+        """Classic record dict for row i (same keys the dashboard always used)."""
+        return {"id": self.ids[i], "name": self.names[i],
+                "cw": [self.cw1[i], self.cw2[i], self.cw3[i]], "exam": self.exam[i],
+                "cw_total": self.cw_total[i], "total": self.total[i],
+                "perc": self.perc(i), "grade": self.grade_of(i)}
+
+    def table_values(self, i):
+        """Tuple of display values for one Treeview row."""
+        return (self.ids[i], self.names[i], f"{self.cw_total[i]}", f"{self.exam[i]}",
+                f"{self.perc(i)}%", self.grade_of(i))
+
+    def rows(self):
+        """Row indices in display order."""
+        return range(len(self)) if self.view is None else self.view
+
+    def records(self):
+        """(id, name, cw, exam) for every row in display order, for exporters."""
+        for i in self.rows():
+            yield self.ids[i], self.names[i], [self.cw1[i], self.cw2[i], self.cw3[i]], self.exam[i]
+
+    def rank(self):
+        """Display position of every row (inverse of the view), cached until the next change."""
+        stamp = (self.version, self.sort_key)
+        if self._rank is None or self._rank[0] != stamp:
+            rank = array('i', [0]) * len(self)
+            for pos, i in enumerate(self.rows()):
+                rank[i] = pos
+            self._rank = (stamp, rank)
+        return self._rank[1]
+
+    # --- COLUMN SCANS ---
+    def grade_counts(self, rows=None):
+        """{'A': n, ...} over all rows (C-level count) or a subset of row indices."""
+        if rows is None:
+            return {g: self.grade.count(ord(g)) for g in GRADES}
+        counts = dict.fromkeys(GRADES, 0)
+        grade = self.grade
+        for i in rows:
+            counts[chr(grade[i])] += 1
+        return counts
+
+    def summary(self, rows=None, cancelled=None):
+        """
+        (count, average %, top performer row or None, grade counts) for a row subset,
+        in one chunked pass. Returns None if cancelled() turns true between chunks.
+        """
+        if rows is None:
+            rows = self.rows()
+        count = len(rows)
+        if count == 0:
+            return 0, 0, None, dict.fromkeys(GRADES, 0)
+        p10, grade = grading.stat_columns(self.perc10, self.grade)
+        total, best, top = 0, -1, None
+        counts = dict.fromkeys(GRADES, 0)
+        for start in range(0, count, SUMMARY_CHUNK):
+            if cancelled and cancelled(): return None
+            c_sum, c_best, c_top, c_counts = grading.chunk_stats(p10, grade, rows[start:start + SUMMARY_CHUNK])
+            total += c_sum
+            if c_best > best: best, top = c_best, c_top # First top in display order
+            for g in GRADES: counts[g] += c_counts[g]
+        return count, round(total / count / 10, 1), top, counts
+
+    def argmax(self):
+        return grading.extreme(self.perc10, self.rows(), highest=True)
+
+    def argmin(self):
+        return grading.extreme(self.perc10, self.rows(), highest=False)
+
+    def match(self, q, rows=None):
+        """Row indices whose name or ID contains the lower-case query q."""
+        names, ids = self.names, self.ids
+        if rows is None and self.view is None:
+            return [i for i, (n, sid) in enumerate(zip(names, ids)) if q in n.lower() or q in str(sid)]
+        if rows is None:
+            rows = self.view
+        return [i for i in rows if q in names[i].lower() or q in str(ids[i])]
+
+    # --- FILE I/O (studentMarks.txt format) ---
+    def load_file(self, path, report=None):
+        """
+        Replaces the store contents with the valid records in a marks file (bad lines -> report).
+        The marks are gathered first and graded in one grading.grade_columns() call over the
+        whole file, so a large file is split across its process pool.
+        """
+        ids, names = array('i'), []
+        cw1, cw2, cw3, exam = array('b'), array('b'), array('b'), array('h')
+        records = iter_records(path, report)
+        while True:
+            chunk = list(islice(records, EXTEND_CHUNK))
+            if not chunk: break
+            sids, nms, cws, exs = zip(*chunk)
+            ids.extend(sids)
+            names.extend(nms)
+            cw1.extend([c[0] for c in cws]); cw2.extend([c[1] for c in cws]); cw3.extend([c[2] for c in cws])
+            exam.extend(exs)
+        self.set_columns(ids, names, cw1, cw2, cw3, exam, *grading.grade_columns(cw1, cw2, cw3, exam))
+
+    def save_file(self, path):
+        """Writes a full snapshot via a temp file + os.replace(), so a crash never leaves half a file."""
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(f"{len(self)}\n")
+            for i in self.rows():
+                f.write(f"{self.ids[i]},{self.names[i]},{self.cw1[i]},{self.cw2[i]},{self.cw3[i]},{self.exam[i]}\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)